@@ -68,6 +68,21 @@ class ChannelInfo:
         ...
 
 
+class ChannelIterator:
+    r"""
+    Iterator over the channels of an :class:`Mdf`, returned by
+    :py:meth:`Mdf.iter_channels`.
+    
+    Yields ``(group, channel, values)`` tuples in file order; ``group`` /
+    ``channel`` are ``None`` when unnamed.
+    """
+    def __iter__(self) -> ChannelIterator:
+        ...
+
+    def __next__(self) -> typing.Optional[tuple[typing.Optional[builtins.str], typing.Optional[builtins.str], typing.Any]]:
+        ...
+
+
 class DataType:
     r"""
     MDF channel data type descriptor.
@@ -204,6 +219,21 @@ class GroupInfo:
         """
         ...
 
+    def channel_columns(self) -> tuple[builtins.list[typing.Optional[builtins.str]], builtins.list[builtins.str], builtins.list[builtins.int]]:
+        r"""
+        Channel metadata as parallel lists rather than one object per channel.
+        
+        Cheaper than iterating :py:attr:`channels` when only names and types
+        are needed, e.g. to print a group listing.
+        
+        Returns
+        -------
+        tuple[list[Optional[str]], list[str], list[int]]
+            ``(names, data_type_names, bit_counts)``, one entry per channel
+            in record order.
+        """
+        ...
+
     def __str__(self) -> builtins.str:
         ...
 
@@ -279,6 +309,32 @@ class Mdf:
         """
         ...
 
+    def channel_table(self, group:builtins.str) -> builtins.dict[builtins.str, typing.Any]:
+        r"""
+        A group's channel metadata as one table of columns.
+        
+        Unlike :py:attr:`GroupInfo.channels`, no :class:`ChannelInfo` object is
+        created per channel: names and units come back as two lists and the
+        numeric fields as numpy arrays, one entry per channel in record order.
+        
+        Parameters
+        ----------
+        group : str
+        
+        Returns
+        -------
+        dict
+            ``{"name": list[Optional[str]], "unit": list[Optional[str]],
+            "data_type": uint8 array, "bit_count": uint32 array}``; the
+            ``data_type`` codes are :py:attr:`DataType.value`.
+        
+        Raises
+        ------
+        MdfException
+            If no group is called ``group``.
+        """
+        ...
+
     def read(self, name:builtins.str, group:typing.Optional[builtins.str]) -> typing.Any:
         r"""
         Read a channel as a ``pandas.Series`` of values indexed by timestamps.
@@ -319,6 +375,56 @@ class Mdf:
         """
         ...
 
+    def values_many(self, names:typing.Sequence[builtins.str], group:typing.Optional[builtins.str]) -> typing.Any:
+        r"""
+        Read several numeric channels in one call as ``{name: float64 array}``.
+        
+        The channels may come from different groups. Channels of one group are
+        decoded together in a single pass over its data blocks, and different
+        groups are decoded in parallel, all with the GIL released, instead of
+        one :py:meth:`values` call (and FFI round-trip) per channel.
+        
+        Parameters
+        ----------
+        names : list[str]
+        group : Optional[str]
+            Resolve every name inside this group only.
+        
+        Raises
+        ------
+        MdfException
+            If any channel is missing.
+        """
+        ...
+
+    def dataframe(self, names:typing.Optional[typing.Sequence[builtins.str]], group:typing.Optional[builtins.str]) -> typing.Any:
+        r"""
+        Read several channels of one group as a ``pandas.DataFrame``.
+        
+        Each channel becomes a ``float64`` column (invalid / non-numeric samples
+        are ``NaN``) and the group's master/time channel is the index, as with
+        :py:meth:`read`. The channels are decoded with the GIL released, and
+        the frame is assembled in a single pandas call.
+        
+        Parameters
+        ----------
+        names : Optional[list[str]]
+            Channel names (case-sensitive). All must live in the same group.
+            Decoded in parallel. When omitted, every named channel of
+            ``group`` except the master is read, in one pass over the group's
+            data blocks.
+        group : Optional[str]
+            Restrict the search to a single group by name. Required when
+            ``names`` is omitted.
+        
+        Raises
+        ------
+        MdfException
+            If a channel or the group is missing, the channels span several
+            groups, neither argument is given, or pandas is not installed.
+        """
+        ...
+
     def __getitem__(self, key:typing.Any) -> typing.Any:
         r"""
         ``mdf["Speed"]`` — shorthand for :py:meth:`read` (timestamp-indexed Series).
@@ -337,6 +443,52 @@ class Mdf:
         """
         ...
 
+    def index(self) -> MdfIndex:
+        r"""
+        Build an :class:`MdfIndex` from this already-open file.
+        
+        Nothing is re-opened or re-parsed: the index is built from the parsed
+        metadata and reads samples through this file's memory map, so
+        :py:meth:`MdfIndex.read` / :py:meth:`MdfIndex.values` need no path.
+        For remote files use :py:meth:`MdfIndex.from_url` instead.
+        """
+        ...
+
+    def iter_values(self, name:builtins.str, group:typing.Optional[builtins.str], chunk_size:typing.Optional[builtins.int]) -> ValueChunkIterator:
+        r"""
+        Stream a numeric channel as successive ``float64`` numpy chunks.
+        
+        Same as :py:meth:`MdfIndex.iter_values`: each step decodes the next
+        ``chunk_size`` records from this file's memory map with the GIL
+        released, so reductions over a long channel hold one chunk at a time
+        instead of the whole column. Concatenated, the chunks equal
+        :py:meth:`values`.
+        
+        Parameters
+        ----------
+        name : str
+        group : Optional[str]
+        chunk_size : Optional[int]
+            Records per chunk (default 65536); the last chunk may be shorter.
+        
+        Raises
+        ------
+        MdfException
+            If the channel is missing or ``chunk_size`` is zero.
+        """
+        ...
+
+    def iter_channels(self) -> ChannelIterator:
+        r"""
+        Iterate over every channel as ``(group, channel, values)`` tuples.
+        
+        ``values`` is a numpy ``float64`` array as from :py:meth:`values`.
+        Groups are decoded one at a time as the iteration reaches them, and
+        each group's data blocks are read once for all of its channels rather
+        than once per channel — the way to visit a whole file.
+        """
+        ...
+
 
 class MdfIndex:
     r"""
@@ -363,10 +515,12 @@ class MdfIndex:
     """
     groups: builtins.list[GroupInfo]
     channel_names: builtins.list[builtins.str]
+    channel_count: builtins.int
+    record_count: builtins.int
     file_size: builtins.int
     source: typing.Optional[builtins.str]
     @staticmethod
-    def from_file(path:builtins.str) -> MdfIndex:
+    def from_file(path:builtins.str, mapped:typing.Optional[builtins.bool]) -> MdfIndex:
         r"""
         Build a fresh index by parsing an MDF file from disk.
         
@@ -377,6 +531,11 @@ class MdfIndex:
         ----------
         path : str
             Path to a ``.mf4`` file.
+        mapped : Optional[bool]
+            Keep the memory map the file was parsed through as the index's
+            source, as :py:meth:`attach_file` would, so later reads slice that
+            one map instead of re-opening the file on every call. Off by
+            default: a plain path source holds no mapping between reads.
         """
         ...
 
@@ -436,7 +595,7 @@ class MdfIndex:
         """
         ...
 
-    def byte_ranges(self, name:builtins.str, group:typing.Optional[builtins.str]) -> builtins.list[tuple[builtins.int, builtins.int]]:
+    def byte_ranges(self, name:builtins.str, group:typing.Optional[builtins.str], max_gap:typing.Optional[builtins.int]) -> builtins.list[tuple[builtins.int, builtins.int]]:
         r"""
         Byte ranges ``[(offset, length), ...]`` occupied by a channel.
         
@@ -448,12 +607,73 @@ class MdfIndex:
         name : str
         group : Optional[str]
             Disambiguate by group when the name is not unique.
+        max_gap : Optional[int]
+            Merge ranges that are at most this many bytes apart, trading a
+            little over-fetch for fewer requests (e.g. ``4096`` for HTTP).
+            ``None`` returns the exact per-block ranges.
+        """
+        ...
+
+    def byte_range_arrays(self, name:builtins.str, group:typing.Optional[builtins.str], max_gap:typing.Optional[builtins.int]) -> tuple[typing.Any, typing.Any]:
+        r"""
+        :py:meth:`byte_ranges` as two numpy ``uint64`` arrays ``(offsets, lengths)``.
+        
+        Two arrays cross into Python instead of one tuple per range, and
+        aggregates such as ``lengths.sum()`` run in numpy rather than a
+        Python loop.
+        
+        Parameters
+        ----------
+        name : str
+        group : Optional[str]
+        max_gap : Optional[int]
+            As in :py:meth:`byte_ranges`.
         """
         ...
 
-    def byte_ranges_for_records(self, name:builtins.str, start_record:builtins.int, record_count:builtins.int) -> builtins.list[tuple[builtins.int, builtins.int]]:
+    def byte_ranges_for_records(self, name:builtins.str, start_record:builtins.int, record_count:builtins.int, max_gap:typing.Optional[builtins.int]) -> builtins.list[tuple[builtins.int, builtins.int]]:
         r"""
         Byte ranges covering a record window ``[start, start+count)``.
+        
+        ``max_gap`` merges nearby ranges as in :py:meth:`byte_ranges`.
+        """
+        ...
+
+    def byte_plan_for_records(self, name:builtins.str, start_record:builtins.int, record_count:builtins.int, max_gap:typing.Optional[builtins.int]) -> tuple[builtins.list[tuple[builtins.int, builtins.int]], builtins.int]:
+        r"""
+        Byte ranges for a record window together with their total length.
+        
+        Same ranges as :py:meth:`byte_ranges_for_records`; the total is summed
+        on the Rust side so callers sizing a buffer or a request budget need
+        not walk the list again.
+        
+        Returns
+        -------
+        tuple[list[tuple[int, int]], int]
+            ``(ranges, total_bytes)``.
+        """
+        ...
+
+    def byte_summary(self, group:builtins.str, max_gap:typing.Optional[builtins.int]) -> builtins.list[tuple[typing.Optional[builtins.str], builtins.int, builtins.int]]:
+        r"""
+        Byte footprint of every channel in a group, in one call.
+        
+        Equivalent to calling :py:meth:`byte_ranges` per channel and summing,
+        without crossing into Rust once per channel.
+        
+        Parameters
+        ----------
+        group : str
+            Name of the channel group.
+        max_gap : Optional[int]
+            Count ranges after merging as in :py:meth:`byte_ranges`.
+        
+        Returns
+        -------
+        list[tuple[Optional[str], int, int]]
+            ``(channel name, total bytes, range count)`` per channel, in
+            channel order. VLSD channels, whose samples live outside the
+            records, report ``(name, 0, 0)``.
         """
         ...
 
@@ -467,6 +687,18 @@ class MdfIndex:
         """
         ...
 
+    def summary(self) -> builtins.dict[builtins.str, typing.Any]:
+        r"""
+        Headline figures for the index, straight from the in-memory structure.
+        
+        A cheap alternative to re-reading a saved JSON index just to report
+        on it. Keys: ``file_size``, ``group_count``, ``channel_count``,
+        ``record_count``, ``first_channel`` (name of the first channel, or
+        ``None``) and ``first_block`` (``(offset, size)`` of the first data
+        block, or ``None``).
+        """
+        ...
+
     def list_signals(self) -> builtins.list[tuple[typing.Optional[builtins.str], typing.Optional[builtins.str], typing.Optional[builtins.str]]]:
         r"""
         A flat catalog of every channel as ``(source, group, channel)`` tuples.
@@ -494,6 +726,22 @@ class MdfIndex:
         """
         ...
 
+    def attach_file(self, path:builtins.str) -> None:
+        r"""
+        Attach a local MDF file and keep it memory-mapped for all later reads.
+        
+        A plain file :py:attr:`source` is re-opened and re-mapped on every
+        :py:meth:`read` / :py:meth:`values` call. ``attach_file`` maps it once
+        and reuses that map until the source is replaced — the fast path for
+        many reads against one local file. Pages are still read lazily.
+        
+        Parameters
+        ----------
+        path : str
+            Path to the ``.mf4`` file this index was built from.
+        """
+        ...
+
     def read(self, name:builtins.str, group:typing.Optional[builtins.str]) -> typing.Any:
         r"""
         Read a channel as a ``pandas.Series`` of values indexed by timestamps.
@@ -530,6 +778,154 @@ class MdfIndex:
         """
         ...
 
+    def typed_values(self, name:builtins.str, group:typing.Optional[builtins.str], dtype:typing.Optional[builtins.str]) -> typing.Any:
+        r"""
+        Read a numeric channel by name as a numpy array of its natural dtype.
+        
+        Like :py:meth:`values`, but integer channels keep their integers:
+        ``int64`` (``uint64`` when a value exceeds the ``int64`` range), while
+        float channels (including linearly converted ones) and channels with
+        invalid samples are ``float64`` with ``NaN`` for invalid samples. The
+        array is filled from Rust with no Python object per sample.
+        
+        Parameters
+        ----------
+        name : str
+        group : Optional[str]
+        dtype : Optional[str]
+            Narrow an integer channel to a smaller element type: one of
+            ``"int8"``, ``"int16"``, ``"int32"``, ``"int64"``, ``"uint8"``,
+            ``"uint16"``, ``"uint32"`` or ``"uint64"``. Every sample must be a
+            valid integer that fits; a narrow array makes later scans such as
+            ``np.count_nonzero(speed > 100)`` touch fewer bytes.
+        
+        Raises
+        ------
+        MdfException
+            If no source is attached, the channel is missing, or it holds text
+            or bytes (use :py:meth:`read` for those); also if ``dtype`` is
+            not a supported type or a sample is invalid, not an integer, or out
+            of its range.
+        """
+        ...
+
+    def stats(self, name:builtins.str, group:typing.Optional[builtins.str], threshold:typing.Optional[builtins.float]) -> builtins.dict[builtins.str, typing.Any]:
+        r"""
+        Summary statistics of a numeric channel in one pass.
+        
+        Decodes the channel as :py:meth:`values` does and folds every valid
+        sample into the count, minimum, maximum, sum and threshold count
+        together, inside Rust, rather than one numpy reduction per figure.
+        ``NaN`` (invalid) samples are skipped.
+        
+        Parameters
+        ----------
+        name : str
+        group : Optional[str]
+        threshold : Optional[float]
+            Also count the samples strictly greater than this value.
+        
+        Returns
+        -------
+        dict
+            ``{"count": int, "min": float | None, "max": float | None,
+            "mean": float | None, "above": int | None}``; the statistics are
+            ``None`` when no sample is valid, ``above`` when no ``threshold``
+            is given.
+        
+        Raises
+        ------
+        MdfException
+            If no source is attached or the channel is missing.
+        """
+        ...
+
+    def values_from_buffers(self, name:builtins.str, ranges:typing.Sequence[tuple[builtins.int, builtins.int]], buffers:typing.Sequence[bytes], group:typing.Optional[builtins.str]) -> typing.Any:
+        r"""
+        Decode a numeric channel from byte ranges you have already fetched.
+        
+        Pairs with :py:meth:`byte_ranges`: fetch those ranges yourself (HTTP,
+        S3, a cache, ...) and hand the bytes back here, so the data is decoded
+        from what was downloaded instead of being read from the source a second
+        time. No source needs to be attached. The buffers are decoded in place
+        with the GIL released. Invalid samples are ``NaN``.
+        
+        Parameters
+        ----------
+        name : str
+        ranges : list[tuple[int, int]]
+            ``(offset, length)`` of each fetched range, as returned by
+            :py:meth:`byte_ranges` (merged ranges work too). For a group with
+            invalidation bytes the decoder needs each data block's whole record
+            payload, which :py:meth:`byte_ranges` does not cover, so such
+            channels are read with :py:meth:`values` instead.
+        buffers : list[bytes]
+            The fetched bytes, one entry per range.
+        group : Optional[str]
+        
+        Raises
+        ------
+        MdfException
+            If the channel is missing, ``ranges`` and ``buffers`` differ in
+            length, or the buffers do not cover the channel's data.
+        """
+        ...
+
+    def values_many(self, names:typing.Sequence[builtins.str], group:typing.Optional[builtins.str]) -> typing.Any:
+        r"""
+        Read several numeric channels in one call as ``{name: float64 array}``.
+        
+        The attached source is opened once (a single memory map, or a single
+        HTTP reader) and all channels are decoded with the GIL released, instead
+        of paying the open + FFI round-trip per channel as repeated
+        :py:meth:`values` calls do. For a local file the channels are decoded
+        in parallel across the available cores; over HTTP, channels of the same
+        group share one fetch of the group's data blocks.
+        
+        Parameters
+        ----------
+        names : list[str]
+        group : Optional[str]
+            Resolve every name inside this group only.
+        
+        Raises
+        ------
+        MdfException
+            If no source is attached or any channel is missing.
+        """
+        ...
+
+    def iter_values(self, name:builtins.str, group:typing.Optional[builtins.str], chunk_size:typing.Optional[builtins.int]) -> ValueChunkIterator:
+        r"""
+        Stream a numeric channel as successive ``float64`` numpy chunks.
+        
+        Each step decodes the next ``chunk_size`` records straight from the
+        data blocks that hold them, with the GIL released, so peak memory is
+        one chunk rather than the whole column. Concatenated, the chunks equal
+        :py:meth:`values`. A local file source is opened and mapped once, when
+        the iterator is created, and every chunk slices that mapping.
+        
+        Parameters
+        ----------
+        name : str
+        group : Optional[str]
+        chunk_size : Optional[int]
+            Records per chunk (default 65536); the last chunk may be shorter.
+        
+        Raises
+        ------
+        MdfException
+            If the channel is missing, ``chunk_size`` is zero, or no source
+            is attached.
+        
+        Example
+        -------
+        >>> total = 0.0
+        >>> for chunk in idx.iter_values("Speed", chunk_size=100_000):
+        ...     total += chunk.sum()
+        """
+        ...
+
     def __getitem__(self, key:typing.Any) -> typing.Any:
         r"""
         ``index["Speed"]`` — shorthand for :py:meth:`read` (timestamp-indexed Series).
@@ -580,7 +976,7 @@ class MdfWriter:
     >>> w.finish_data_block(cg)
     >>> w.finalize()
     """
-    def __new__(cls,path:builtins.str): ...
+    def __new__(cls,path:builtins.str, buffer_size:typing.Optional[builtins.int]): ...
     def init_mdf_file(self) -> None:
         r"""
         Write the MDF identification (``##ID``) and header (``##HD``) blocks.
@@ -709,6 +1105,24 @@ class MdfWriter:
         """
         ...
 
+    def add_value_to_text_conversion(self, channel_id:builtins.str, mapping:typing.Sequence[tuple[builtins.int, builtins.str]], default:builtins.str) -> None:
+        r"""
+        Attach a value-to-text conversion (``##CC`` type 7) to a channel.
+        
+        Raw values listed in ``mapping`` display as their text; any other
+        value displays as ``default``.
+        
+        Parameters
+        ----------
+        channel_id : str
+            ID returned by one of the ``add_*_channel`` methods.
+        mapping : Sequence[tuple[int, str]]
+            e.g. ``[(0, "OK"), (1, "WARN")]``.
+        default : str
+            Text for values not in ``mapping``.
+        """
+        ...
+
     def start_data_block(self, group_id:builtins.str) -> None:
         r"""
         Open a fresh ``##DT`` data block for a channel group.
@@ -737,6 +1151,128 @@ class MdfWriter:
         """
         ...
 
+    def write_record_buf(self, group_id:builtins.str, buffer:RecordBuffer) -> None:
+        r"""
+        Append one record from a reusable :class:`RecordBuffer`.
+        
+        Same encoding as :py:meth:`write_record`, but the values come from the
+        buffer's slots, so a tight Python loop only updates numbers in place.
+        
+        Parameters
+        ----------
+        group_id : str
+        buffer : RecordBuffer
+            One slot per channel, in channel order.
+        """
+        ...
+
+    def write_record_f64(self, group_id:builtins.str, values:typing.Sequence[builtins.float]) -> None:
+        r"""
+        Append one record of plain floats, one per channel in channel order.
+        
+        The values are read straight from the Python floats, so a row costs
+        no :class:`DecodedValue` allocations. Every channel of the group must
+        be a float channel; float32 channels are narrowed automatically.
+        
+        Parameters
+        ----------
+        group_id : str
+        values : Sequence[float]
+            e.g. ``(t, speed, temperature)``.
+        
+        Raises
+        ------
+        MdfException
+            If the value count differs from the channel count or a channel is
+            not a float type.
+        """
+        ...
+
+    def write_records_iter(self, group_id:builtins.str, records:typing.Any) -> None:
+        r"""
+        Append records of plain floats pulled from any iterable.
+        
+        Each item is one record, a sequence with one float per channel in
+        channel order — e.g. ``map(make_row, range(n))`` or a generator. The
+        loop over the iterable runs in Rust and rows are handed to the writer
+        in batches, so only the row construction itself runs in Python. Every
+        channel of the group must be a float channel; float32 channels are
+        narrowed automatically.
+        
+        Parameters
+        ----------
+        group_id : str
+        records : Iterable[Sequence[float]]
+        
+        Raises
+        ------
+        MdfException
+            If the rows differ in length, a row's length differs from the
+            channel count, or a channel is not a float type.
+        """
+        ...
+
+    def write_records_f64(self, group_id:builtins.str, records:typing.Any) -> None:
+        r"""
+        Append a batch of records from a 2-D numpy ``float64`` array.
+        
+        Each row is one record with one column per channel, in channel order,
+        so building a row no longer allocates a :class:`DecodedValue` per
+        field: the rows are encoded straight from the array's memory. Every
+        channel of the group must be a float channel; float32 channels are
+        narrowed automatically.
+        
+        Parameters
+        ----------
+        group_id : str
+        records : numpy.ndarray
+            C-contiguous ``float64`` array of shape ``(n_records, n_channels)``.
+        
+        Raises
+        ------
+        MdfException
+            If the array is not C-contiguous ``float64``, its column count
+            differs from the channel count, or a channel is not a float type.
+        """
+        ...
+
+    def record_size(self, group_id:builtins.str) -> builtins.int:
+        r"""
+        Size in bytes of one record of the group's open data block.
+        
+        This is the stride to use when packing records for
+        :py:meth:`write_raw_records` (record id + data + invalidation bytes).
+        Only valid between :py:meth:`start_data_block` and
+        :py:meth:`finish_data_block`.
+        
+        Parameters
+        ----------
+        group_id : str
+        """
+        ...
+
+    def write_raw_records(self, group_id:builtins.str, data:typing.Any) -> None:
+        r"""
+        Append a batch of records that are already encoded as raw bytes.
+        
+        ``data`` holds whole records back to back, each :py:meth:`record_size`
+        bytes long, e.g. a ``bytearray`` filled with ``struct.pack_into``. The
+        bytes are copied to the file without re-encoding, so one call writes
+        the whole batch instead of crossing into Rust once per record.
+        
+        Parameters
+        ----------
+        group_id : str
+        data : bytes | bytearray
+        
+        Raises
+        ------
+        MdfException
+            If ``data`` is not ``bytes``/``bytearray`` or its length is not a
+            multiple of the record size.
+        """
+        ...
+
     def finish_data_block(self, group_id:builtins.str) -> None:
         r"""
         Close the open ``##DT`` block for a channel group.
@@ -773,7 +1309,7 @@ class MdfWriter:
         """
         ...
 
-    def write_columns(self, group_id:builtins.str, columns:typing.Sequence[typing.Any], dtypes:typing.Sequence[builtins.str]) -> None:
+    def write_columns(self, group_id:builtins.str, columns:typing.Sequence[typing.Any], dtypes:typing.Optional[typing.Sequence[builtins.str]]) -> None:
         r"""
         Bulk-write all channels of a group from heterogeneous numpy arrays.
         
@@ -786,16 +1322,25 @@ class MdfWriter:
         group_id : str
         columns : list[numpy.ndarray]
             One contiguous 1-D array per channel, all of identical length.
-        dtypes : list[str]
+            A constant channel may be passed as a single-element array or a
+            ``numpy.broadcast_to`` view; its value is written into every
+            record without materializing the full column.
+        dtypes : Optional[list[str]]
             One entry per column, matching ``columns``. Allowed values:
-            ``"f64"``, ``"f32"``, ``"u64"``, ``"i64"``.
+            ``"f64"``, ``"f32"``, ``"u64"``, ``"i64"``, ``"u32"``, ``"i32"``.
+            When omitted, each column's type is taken from its numpy dtype
+            (``float64``, ``float32``, ``uint64``, ``int64``, ``uint32`` or
+            ``int32``). 32-bit integer arrays fill integer channels directly,
+            with no ``astype`` copy.
         
         Raises
         ------
         MdfException
             If the dtype string is not one of the supported values, the
-            numpy array's element type doesn't match the dtype string, the
-            two list lengths differ, or any array is non-contiguous.
+            numpy array's element type doesn't match the dtype string (or,
+            without ``dtypes``, is not one of the six supported types), the
+            two list lengths differ, or any array is non-contiguous (other
+            than a zero-stride broadcast view).
         """
         ...
 
@@ -810,6 +1355,62 @@ class MdfWriter:
         ...
 
 
+class RecordBuffer:
+    r"""
+    Reusable, fixed-size staging area for one record of a channel group.
+    
+    Allocate it once with the group's channel count, overwrite slots in place
+    with the typed setters, and hand it to :py:meth:`MdfWriter.write_record_buf`
+    for every record. Unlike :py:meth:`MdfWriter.write_record`, no Python list
+    or ``DecodedValue`` objects are created per record.
+    
+    Example
+    -------
+    >>> buf = mf4_rs.RecordBuffer(2)
+    >>> for i in range(100):
+    ...     buf.set_f64(0, i * 0.01)
+    ...     buf.set_u64(1, i)
+    ...     w.write_record_buf(cg, buf)
+    """
+    def __new__(cls,channel_count:builtins.int): ...
+
+    def set_f64(self, index:builtins.int, value:builtins.float) -> None:
+        r"""
+        Store a float in slot ``index`` (float32 / float64 channels).
+        """
+        ...
+
+    def set_u64(self, index:builtins.int, value:builtins.int) -> None:
+        r"""
+        Store an unsigned integer in slot ``index``.
+        """
+        ...
+
+    def set_i64(self, index:builtins.int, value:builtins.int) -> None:
+        r"""
+        Store a signed integer in slot ``index``.
+        """
+        ...
+
+    def __len__(self) -> builtins.int:
+        ...
+
+
+class ValueChunkIterator:
+    r"""
+    Iterator over fixed-size chunks of one channel, returned by
+    :py:meth:`MdfIndex.iter_values`.
+    
+    Yields ``float64`` numpy arrays of at most ``chunk_size`` values, in
+    record order.
+    """
+    def __iter__(self) -> ValueChunkIterator:
+        ...
+
+    def __next__(self) -> typing.Optional[typing.Any]:
+        ...
+
+
 class DecodedValue(Enum):
     r"""
     A single decoded channel sample, tagged with its underlying type.
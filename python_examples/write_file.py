@@ -16,12 +16,12 @@ Features of the new API:
 """
 
 import mf4_rs
-import math
+import numpy as np
 
 def main():
     try:
         # Create a new MDF writer
-        writer = mf4_rs.PyMdfWriter("example.mf4")
+        writer = mf4_rs.MdfWriter("example.mf4")
         print("Created MDF writer")
         
         # Initialize the MDF file structure
@@ -45,28 +45,41 @@ def main():
         speed_ch_id = writer.add_int_channel(group_id, "Speed")
         print(f"Added speed channel: {speed_ch_id} (automatic: UnsignedIntegerLE 32-bit, linked)")
         
+        status_ch_id = writer.add_int_channel(group_id, "Status")
+        print(f"Added status channel: {status_ch_id} (flags every 10th record)")
+        
         # Start data block
         writer.start_data_block(group_id)
         print("Started data block")
         
         # Write sample data
         print("Writing data records...")
-        for i in range(100):
-            time = i * 0.01  # 10ms intervals
-            temperature = 20.0 + 5.0 * math.sin(time * 2.0)  # Varying temperature
-            speed = int(math.sin(time * 10.0) * 50.0 + 60.0)  # Varying speed
-            
-            # Create record values (must match the order channels were added)
-            values = [
-                mf4_rs.create_float_value(time),
-                mf4_rs.create_float_value(temperature),
-                mf4_rs.create_uint_value(speed)
-            ]
-            
-            writer.write_record(group_id, values)
-            
-            if i % 20 == 0:
-                print(f"  Wrote record {i}: time={time:.3f}, temp={temperature:.2f}, speed={speed}")
+        # Generate every sample at once with numpy instead of evaluating the
+        # formulas record by record in a Python loop.
+        n = 100
+        dt = 0.01  # 10ms intervals
+        time = np.arange(n, dtype=np.float64)
+        time *= dt
+        # Both waveforms are one vectorized np.sin over the time axis; no
+        # per-sample libm calls and no lookup table needed. The scaling is
+        # applied in place, so no extra full-length temporaries are built
+        temperature = np.sin(2.0 * time)  # Varying temperature
+        temperature *= 5.0
+        temperature += 20.0
+        speed = np.sin(10.0 * time)  # Varying speed
+        speed *= 50.0
+        speed += 60.0
+        speed = speed.astype(np.uint64)
+        # Flag every 10th record with one strided store instead of a
+        # per-record if/else
+        status = np.zeros(n, dtype=np.uint64)
+        status[::10] = 1
+        
+        # Columns must match the order the channels were added
+        writer.write_columns(group_id, [time, temperature, speed, status], ["f64", "f64", "u64", "u64"])
+        
+        for k in range(0, n, 20):
+            print(f"  Wrote record {k}: time={time[k]:.3f}, temp={temperature[k]:.2f}, speed={speed[k]}, status={status[k]}")
         
         # Finish data block
         writer.finish_data_block(group_id)
@@ -88,10 +101,10 @@ def main():
 def test_read_created_file():
     """Test reading the file we just created"""
     try:
-        mdf = mf4_rs.PyMDF("example.mf4")
+        mdf = mf4_rs.Mdf("example.mf4")
         
         # Get channel groups
-        groups = mdf.channel_groups()
+        groups = mdf.groups
         print(f"Created file has {len(groups)} channel groups")
         
         if groups:
@@ -99,13 +112,12 @@ def test_read_created_file():
             print(f"Group has {group.channel_count} channels and {group.record_count} records")
             
             # Get channel names
-            names = mdf.get_all_channel_names()
+            names = mdf.channel_names
             print(f"Channel names: {names}")
             
-            # Read a few values from each channel
-            for name in names[:3]:  # Limit to first 3 channels
-                values = mdf.get_channel_values(name)
-                if values and len(values) > 0:
+            # Read the first 4 channels in one call, decoded in parallel
+            for name, values in mdf.values_many(names[:4]).items():
+                if len(values) > 0:
                     print(f"Channel '{name}': first value = {values[0]}, last value = {values[-1]}")
         
     except Exception as e:
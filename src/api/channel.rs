@@ -1,6 +1,6 @@
 use crate::error::MdfError;
 use crate::blocks::channel_block::ChannelBlock;
-use crate::parsing::decoder::{ DecodedValue, decode_channel_value, decode_channel_value_with_validity, decode_f64_from_record };
+use crate::parsing::decoder::{ DecodedValue, decode_channel_value, decode_channel_value_with_validity, decode_f64_column, decode_f64_from_record };
 use crate::parsing::raw_channel_group::RawChannelGroup;
 use crate::parsing::raw_data_group::RawDataGroup;
 use crate::parsing::raw_channel::RawChannel;
@@ -205,6 +205,10 @@ impl<'a> Channel<'a> {
         let blocks = self.raw_data_group.data_blocks(self.mmap)?;
         for data_block in &blocks {
             let raw = data_block.data;
+            // Byte-aligned fields of either byte order decode as one strided column.
+            if decode_f64_column(raw, record_size, record_id_len, self.block, &mut out) {
+                continue;
+            }
             let valid_len = (raw.len() / record_size) * record_size;
             let mut offset = 0;
             while offset + record_size <= valid_len {
@@ -3,6 +3,7 @@ use crate::parsing::raw_data_group::RawDataGroup;
 use crate::parsing::raw_channel_group::RawChannelGroup;
 use crate::parsing::source_info::SourceInfo;
 use crate::api::channel::Channel;
+use crate::parsing::decoder::{decode_f64_column, decode_f64_from_record};
 use crate::error::MdfError;
 use crate::signal::Signal;
 
@@ -111,6 +112,71 @@ impl<'a> ChannelGroup<'a> {
         }))
     }
 
+    /// Decode every channel of the group as `f64`, walking the data blocks once.
+    ///
+    /// Gives the same columns as calling [`Channel::values_as_f64`] on each of
+    /// [`ChannelGroup::channels`], in channel order, but the group's data
+    /// blocks are located and read a single time for all channels instead of
+    /// once per channel. Like `values_as_f64`, no conversions are applied.
+    pub fn columns_as_f64(&self) -> Result<Vec<Vec<f64>>, MdfError> {
+        let all: Vec<usize> = (0..self.raw_channel_group.raw_channels.len()).collect();
+        self.columns_as_f64_for(&all)
+    }
+
+    /// Decode the channels at `indices` (positions in
+    /// [`ChannelGroup::channels`]) as `f64`, walking the data blocks once.
+    ///
+    /// Each block's records are read while the block is hot and scattered
+    /// into one output column per requested channel, in the order of
+    /// `indices`. Repeated indices give repeated columns.
+    pub fn columns_as_f64_for(&self, indices: &[usize]) -> Result<Vec<Vec<f64>>, MdfError> {
+        let all = self.channels();
+        let channels = indices
+            .iter()
+            .map(|&i| {
+                all.get(i).ok_or_else(|| {
+                    MdfError::BlockSerializationError(format!("Invalid channel index {}", i))
+                })
+            })
+            .collect::<Result<Vec<_>, MdfError>>()?;
+        let record_id_len = self.raw_data_group.block.record_id_len as usize;
+        let cg = &self.raw_channel_group.block;
+        let record_size =
+            record_id_len + cg.samples_byte_nr as usize + cg.invalidation_bytes_nr as usize;
+        let is_vlsd = |ch: &Channel<'_>| ch.block().channel_type == 1 && ch.block().data != 0;
+
+        let mut columns = Vec::with_capacity(channels.len());
+        for ch in &channels {
+            // VLSD samples live in their own ##SD chain, not in the records.
+            columns.push(if is_vlsd(ch) {
+                ch.values_as_f64()?
+            } else {
+                Vec::with_capacity(cg.cycles_nr as usize)
+            });
+        }
+        if record_size == 0 {
+            return Ok(columns);
+        }
+
+        for data_block in &self.raw_data_group.data_blocks(self.mmap)? {
+            let raw = data_block.data;
+            let valid_len = (raw.len() / record_size) * record_size;
+            for (ch, out) in channels.iter().zip(columns.iter_mut()) {
+                if is_vlsd(ch) {
+                    continue;
+                }
+                let block = ch.block();
+                if decode_f64_column(raw, record_size, record_id_len, block, out) {
+                    continue;
+                }
+                for rec in raw[..valid_len].chunks_exact(record_size) {
+                    out.push(decode_f64_from_record(rec, record_id_len, block));
+                }
+            }
+        }
+        Ok(columns)
+    }
+
     /// Get the raw data group (for internal use)
     pub fn raw_data_group(&self) -> &RawDataGroup {
         self.raw_data_group
@@ -100,6 +100,15 @@ impl MDF {
         }
     }
 
+    /// The memory map backing this file, shared rather than copied.
+    ///
+    /// Used by [`MdfIndex::from_mdf`](crate::index::MdfIndex::from_mdf) to read
+    /// samples without opening the file again.
+    #[cfg(not(target_arch = "wasm32"))]
+    pub(crate) fn shared_mmap(&self) -> std::sync::Arc<memmap2::Mmap> {
+        std::sync::Arc::clone(&self.raw.mmap)
+    }
+
     /// Build a [`FileLayout`] describing every block in the underlying file.
     ///
     /// The layout can be rendered as a flat table, an indented tree or JSON
@@ -7,11 +7,17 @@ use super::types::ConversionType;
 pub struct ConversionBlock {
     pub header: BlockHeader,
 
-    // Link section
+    // Link section. Unset links are left out of a saved index, which keeps
+    // the JSON for conversion-heavy files short to parse.
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub cc_tx_name: Option<u64>,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub cc_md_unit: Option<u64>,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub cc_md_comment: Option<u64>,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub cc_cc_inverse: Option<u64>,
+    #[serde(default)]
     pub cc_ref: Vec<u64>,
 
     // Data
@@ -20,23 +26,29 @@ pub struct ConversionBlock {
     pub cc_flags: u16,
     pub cc_ref_count: u16,
     pub cc_val_count: u16,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub cc_phy_range_min: Option<f64>,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub cc_phy_range_max: Option<f64>,
     pub cc_val: Vec<f64>,
 
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub formula: Option<String>,
     
     // Resolved data for self-contained conversions (populated during index creation)
     /// Pre-resolved text strings for text-based conversions (ValueToText, RangeToText, etc.)
     /// Maps cc_ref indices to their resolved text content
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub resolved_texts: Option<std::collections::HashMap<usize, String>>,
     
     /// Pre-resolved nested conversion blocks for chained conversions
     /// Maps cc_ref indices to their resolved ConversionBlock content
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub resolved_conversions: Option<std::collections::HashMap<usize, Box<ConversionBlock>>>,
     
     /// Default conversion for fallback cases (similar to asammdf's "default_addr")
     /// This is typically the last reference in cc_ref for some conversion types
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub default_conversion: Option<Box<ConversionBlock>>,
 }
 
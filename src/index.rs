@@ -9,7 +9,7 @@ use crate::api::mdf::MDF;
 use crate::blocks::common::{DataType, BlockParse};
 use crate::blocks::conversion::{ConversionBlock, ConversionType};
 use crate::error::MdfError;
-use crate::parsing::decoder::{check_value_validity, decode_channel_value_with_validity, decode_f64_from_record, DecodedValue};
+use crate::parsing::decoder::{check_value_validity, decode_channel_value_with_validity, decode_f64_column, decode_f64_from_record, DecodedValue};
 use crate::signal::{decoded_opt_to_f64, Signal};
 
 /// Represents the location and metadata of data blocks in the file
@@ -27,8 +27,10 @@ pub struct DataBlockInfo {
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct IndexedChannel {
     /// Channel name
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub name: Option<String>,
     /// Physical unit
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub unit: Option<String>,
     /// Data type of the channel
     pub data_type: DataType,
@@ -45,8 +47,10 @@ pub struct IndexedChannel {
     /// Position of invalidation bit within invalidation bytes
     pub pos_invalidation_bit: u32,
     /// Conversion block for unit conversion (if any)
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub conversion: Option<ConversionBlock>,
     /// For VLSD channels: address of signal data blocks
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub vlsd_data_address: Option<u64>,
 }
 
@@ -146,8 +150,10 @@ impl IndexedChannel {
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct IndexedChannelGroup {
     /// Group name
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub name: Option<String>,
     /// Comment
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub comment: Option<String>,
     /// Size of record ID in bytes
     pub record_id_len: u8,
@@ -191,15 +197,39 @@ impl IndexedChannelGroup {
 /// re-attach one with [`MdfIndex::set_file`] / [`MdfIndex::set_url`]. Building an
 /// index never reads sample data; the actual byte-range reads happen lazily on
 /// [`MdfIndex::read`].
+///
+/// More source kinds may be added, so matches outside this crate need a
+/// wildcard arm.
 #[derive(Debug, Clone)]
+#[non_exhaustive]
 pub enum Source {
     /// A local file path, read via memory map.
     File(String),
+    /// A local file kept memory-mapped across reads (see [`MdfIndex::attach_file`]).
+    #[cfg(not(target_arch = "wasm32"))]
+    Mapped(String, MappedFile),
     /// An HTTP/S3 URL, read via range requests.
     #[cfg(feature = "http")]
     Url(String),
 }
 
+/// A memory-mapped file shared by an index and the reads made through it.
+///
+/// Cloning shares the mapping. Derefs to the file's bytes; the mapping
+/// itself is not part of the public API.
+#[cfg(not(target_arch = "wasm32"))]
+#[derive(Debug, Clone)]
+pub struct MappedFile(std::sync::Arc<memmap2::Mmap>);
+
+#[cfg(not(target_arch = "wasm32"))]
+impl std::ops::Deref for MappedFile {
+    type Target = [u8];
+
+    fn deref(&self) -> &[u8] {
+        &self.0
+    }
+}
+
 /// Complete MDF file index
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct MdfIndex {
@@ -207,6 +237,7 @@ pub struct MdfIndex {
     pub file_size: u64,
     /// Start time of the measurement in nanoseconds since epoch (from MDF header)
     /// None if the start time is not set (0) in the file
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub start_time_ns: Option<u64>,
     /// Channel groups in the file
     pub channel_groups: Vec<IndexedChannelGroup>,
@@ -224,6 +255,38 @@ pub trait ByteRangeReader {
     /// Read bytes from the specified range
     /// Returns the requested bytes or an error
     fn read_range(&mut self, offset: u64, length: u64) -> Result<Vec<u8>, Self::Error>;
+
+    /// Fill `buf` with the `buf.len()` bytes starting at `offset`.
+    ///
+    /// Lets a caller reuse one buffer across many reads. The default goes
+    /// through [`read_range`](Self::read_range); readers that can copy
+    /// straight into `buf` override it to skip the intermediate `Vec`.
+    fn read_range_into(&mut self, offset: u64, buf: &mut [u8]) -> Result<(), Self::Error>
+    where
+        Self::Error: From<MdfError>,
+    {
+        let bytes = self.read_range(offset, buf.len() as u64)?;
+        if bytes.len() != buf.len() {
+            return Err(MdfError::TooShortBuffer {
+                actual: bytes.len(),
+                expected: buf.len(),
+                file: file!(),
+                line: line!(),
+            }
+            .into());
+        }
+        buf.copy_from_slice(&bytes);
+        Ok(())
+    }
+
+    /// The whole source as one in-memory slice, when the reader holds it.
+    ///
+    /// Readers backed by memory (a mapping or an owned buffer) return it so
+    /// callers can decode straight from the source instead of copying every
+    /// range out first. The default is `None`.
+    fn as_slice(&self) -> Option<&[u8]> {
+        None
+    }
 }
 
 /// Local file reader implementation.
@@ -249,17 +312,106 @@ impl ByteRangeReader for FileRangeReader {
     type Error = MdfError;
 
     fn read_range(&mut self, offset: u64, length: u64) -> Result<Vec<u8>, Self::Error> {
-        use std::io::{Read, Seek, SeekFrom};
-
-        self.file.seek(SeekFrom::Start(offset))
-            .map_err(|e| MdfError::IOError(e))?;
-
         let mut buffer = vec![0u8; length as usize];
-        self.file.read_exact(&mut buffer)
-            .map_err(|e| MdfError::IOError(e))?;
+
+        // A positional read is a single pread(2) per range instead of a
+        // seek followed by a read.
+        #[cfg(unix)]
+        {
+            use std::os::unix::fs::FileExt;
+            self.file.read_exact_at(&mut buffer, offset)
+                .map_err(|e| MdfError::IOError(e))?;
+        }
+        #[cfg(not(unix))]
+        {
+            use std::io::{Read, Seek, SeekFrom};
+            self.file.seek(SeekFrom::Start(offset))
+                .map_err(|e| MdfError::IOError(e))?;
+            self.file.read_exact(&mut buffer)
+                .map_err(|e| MdfError::IOError(e))?;
+        }
 
         Ok(buffer)
     }
+
+    fn read_range_into(&mut self, offset: u64, buf: &mut [u8]) -> Result<(), Self::Error> {
+        #[cfg(unix)]
+        {
+            use std::os::unix::fs::FileExt;
+            self.file.read_exact_at(buf, offset).map_err(MdfError::IOError)
+        }
+        #[cfg(not(unix))]
+        {
+            use std::io::{Read, Seek, SeekFrom};
+            self.file.seek(SeekFrom::Start(offset)).map_err(MdfError::IOError)?;
+            self.file.read_exact(buf).map_err(MdfError::IOError)
+        }
+    }
+}
+
+/// Map `path` read-only with the kernel's default paging behaviour.
+#[cfg(not(target_arch = "wasm32"))]
+fn map_file(path: &str) -> Result<memmap2::Mmap, MdfError> {
+    let file = std::fs::File::open(path).map_err(MdfError::IOError)?;
+    unsafe { memmap2::Mmap::map(&file) }.map_err(MdfError::IOError)
+}
+
+/// Map `path` for a single front-to-back scan of its data blocks.
+///
+/// The kernel is told to read ahead aggressively and to drop pages behind
+/// the cursor, so use it only for reads that pass over the blocks once;
+/// multi-pass and parallel reads use [`map_file`]. The hint is purely
+/// advisory; failures are ignored.
+#[cfg(not(target_arch = "wasm32"))]
+fn map_sequential(path: &str) -> Result<memmap2::Mmap, MdfError> {
+    let mmap = map_file(path)?;
+    #[cfg(unix)]
+    let _ = mmap.advise(memmap2::Advice::Sequential);
+    Ok(mmap)
+}
+
+/// Ask the kernel to start reading the data blocks of `groups` in now.
+///
+/// A channel read touches every data block of its group, and those blocks
+/// can be scattered through the file. Announcing them up front lets the
+/// reads overlap with decoding instead of faulting each page in cold when
+/// the decoder reaches it. Blocks closer than a page are announced as one
+/// range. The hint is purely advisory; failures are ignored.
+#[cfg(not(target_arch = "wasm32"))]
+fn advise_will_need(mmap: &memmap2::Mmap, groups: &[&IndexedChannelGroup]) {
+    #[cfg(unix)]
+    {
+        let ranges: Vec<(u64, u64)> = groups
+            .iter()
+            .flat_map(|group| group.data_blocks.iter())
+            .map(|block| (block.file_offset, block.size))
+            .collect();
+        for (offset, length) in coalesce_byte_ranges(&ranges, 4096) {
+            let start = offset as usize;
+            let len = (length as usize).min(mmap.len().saturating_sub(start));
+            if len > 0 {
+                let _ = mmap.advise_range(memmap2::Advice::WillNeed, start, len);
+            }
+        }
+    }
+    #[cfg(not(unix))]
+    let _ = (mmap, groups);
+}
+
+/// Copy `buf.len()` bytes of `data` starting at `offset` into `buf`.
+fn copy_range(data: &[u8], offset: u64, buf: &mut [u8]) -> Result<(), MdfError> {
+    let start = offset as usize;
+    let end = start + buf.len();
+    if end > data.len() {
+        return Err(MdfError::TooShortBuffer {
+            actual: data.len(),
+            expected: end,
+            file: file!(),
+            line: line!(),
+        });
+    }
+    buf.copy_from_slice(&data[start..end]);
+    Ok(())
 }
 
 /// Memory-mapped file reader implementation.
@@ -296,6 +448,14 @@ impl ByteRangeReader for MmapRangeReader {
         }
         Ok(self.mmap[start..end].to_vec())
     }
+
+    fn read_range_into(&mut self, offset: u64, buf: &mut [u8]) -> Result<(), Self::Error> {
+        copy_range(&self.mmap, offset, buf)
+    }
+
+    fn as_slice(&self) -> Option<&[u8]> {
+        Some(&self.mmap)
+    }
 }
 
 /// In-memory byte-slice reader — available on all targets including WASM.
@@ -329,6 +489,14 @@ impl ByteRangeReader for SliceRangeReader {
         }
         Ok(self.data[start..end].to_vec())
     }
+
+    fn read_range_into(&mut self, offset: u64, buf: &mut [u8]) -> Result<(), Self::Error> {
+        copy_range(&self.data, offset, buf)
+    }
+
+    fn as_slice(&self) -> Option<&[u8]> {
+        Some(&self.data)
+    }
 }
 
 /// Caching wrapper around any [`ByteRangeReader`].
@@ -620,6 +788,162 @@ impl ByteRangeReader for HttpRangeReader {
     }
 }
 
+/// Serves repeated identical range reads from memory.
+///
+/// Channels of one group live in the same data blocks, so reading several of
+/// them asks for exactly the same merged runs; behind this wrapper each run
+/// crosses the network once instead of once per channel. Call
+/// [`clear`](Self::clear) between groups to hold at most one group's data.
+#[cfg(feature = "http")]
+struct SharedRunReader<R> {
+    inner: R,
+    runs: std::collections::HashMap<(u64, usize), Vec<u8>>,
+}
+
+#[cfg(feature = "http")]
+impl<R: ByteRangeReader<Error = MdfError>> SharedRunReader<R> {
+    fn new(inner: R) -> Self {
+        Self { inner, runs: std::collections::HashMap::new() }
+    }
+
+    fn clear(&mut self) {
+        self.runs.clear();
+    }
+}
+
+#[cfg(feature = "http")]
+impl<R: ByteRangeReader<Error = MdfError>> ByteRangeReader for SharedRunReader<R> {
+    type Error = MdfError;
+
+    fn read_range(&mut self, offset: u64, length: u64) -> Result<Vec<u8>, MdfError> {
+        let mut buf = vec![0u8; length as usize];
+        self.read_range_into(offset, &mut buf)?;
+        Ok(buf)
+    }
+
+    fn read_range_into(&mut self, offset: u64, buf: &mut [u8]) -> Result<(), MdfError> {
+        let key = (offset, buf.len());
+        if let Some(run) = self.runs.get(&key) {
+            buf.copy_from_slice(run);
+            return Ok(());
+        }
+        self.inner.read_range_into(offset, buf)?;
+        self.runs.insert(key, buf.to_vec());
+        Ok(())
+    }
+}
+
+/// Merge `(offset, length)` byte ranges that overlap or sit within `max_gap`
+/// bytes of each other.
+///
+/// Ranges from consecutive `##DT` blocks are only a 24-byte block header
+/// apart, so a small gap collapses a split channel into a handful of reads;
+/// each merged range over-fetches at most `max_gap` bytes per join. Input
+/// order does not matter; the result is sorted by offset.
+pub fn coalesce_byte_ranges(ranges: &[(u64, u64)], max_gap: u64) -> Vec<(u64, u64)> {
+    let mut sorted = ranges.to_vec();
+    sorted.sort_unstable();
+    let mut merged: Vec<(u64, u64)> = Vec::with_capacity(sorted.len());
+    for (offset, length) in sorted {
+        if let Some((last_offset, last_length)) = merged.last_mut() {
+            let last_end = *last_offset + *last_length;
+            if offset <= last_end.saturating_add(max_gap) {
+                *last_length = last_end.max(offset + length) - *last_offset;
+                continue;
+            }
+        }
+        merged.push((offset, length));
+    }
+    merged
+}
+
+/// Number of bytes a channel occupies in each record.
+fn channel_bytes_per_record(channel: &IndexedChannel) -> usize {
+    if matches!(channel.data_type,
+        DataType::StringLatin1 | DataType::StringUtf8 | DataType::StringUtf16LE |
+        DataType::StringUtf16BE | DataType::ByteArray | DataType::MimeSample | DataType::MimeStream)
+    {
+        channel.bit_count as usize / 8
+    } else {
+        ((channel.bit_offset as usize + channel.bit_count as usize + 7) / 8).max(1)
+    }
+}
+
+/// Largest gap between two data block payloads that is still fetched as part
+/// of one read; consecutive `##DT` blocks are normally a 24-byte header apart.
+const BLOCK_FETCH_MAX_GAP: u64 = 16 * 1024;
+
+/// Upper bound on a single merged data block read, so coalescing never
+/// turns a long channel into one unbounded buffer.
+const BLOCK_FETCH_MAX_LEN: u64 = 16 * 1024 * 1024;
+
+/// Bytes of records decoded for every requested channel of a group before
+/// moving on, sized to stay resident in a core's L2 cache.
+#[cfg(not(target_arch = "wasm32"))]
+const GROUP_DECODE_STRETCH: usize = 256 * 1024;
+
+/// Fetch the payloads of `blocks` through `reader`, merging neighbouring
+/// blocks into one `read_range` call, and hand each payload to `f` in order.
+///
+/// Over HTTP every `read_range` is a round trip, so a channel split over many
+/// small blocks costs one request per merged run instead of one per block.
+fn for_each_block_payload<R, F>(reader: &mut R, blocks: &[DataBlockInfo], mut f: F) -> Result<(), MdfError>
+where
+    R: ByteRangeReader<Error = MdfError>,
+    F: FnMut(&[u8]) -> Result<(), MdfError>,
+{
+    if blocks.iter().any(|b| b.is_compressed) {
+        return Err(MdfError::BlockSerializationError(
+            "Compressed blocks not yet supported in index reader".to_string()
+        ));
+    }
+
+    // A reader that already holds the whole file hands out the payloads
+    // in place: no reads and no copies.
+    if let Some(data) = reader.as_slice() {
+        for block in blocks {
+            let start = (block.file_offset + 24) as usize;
+            let end = start + (block.size - 24) as usize;
+            let payload = data.get(start..end).ok_or(MdfError::TooShortBuffer {
+                actual: data.len(),
+                expected: end,
+                file: file!(),
+                line: line!(),
+            })?;
+            f(payload)?;
+        }
+        return Ok(());
+    }
+
+    // One scratch buffer serves every merged run.
+    let mut run = Vec::new();
+    let mut i = 0;
+    while i < blocks.len() {
+        let start = blocks[i].file_offset + 24;
+        let mut end = start + (blocks[i].size - 24);
+        let mut j = i + 1;
+        while j < blocks.len() {
+            let next_start = blocks[j].file_offset + 24;
+            let next_end = next_start + (blocks[j].size - 24);
+            if next_start < end || next_start - end > BLOCK_FETCH_MAX_GAP || next_end - start > BLOCK_FETCH_MAX_LEN {
+                break;
+            }
+            end = next_end;
+            j += 1;
+        }
+
+        run.clear();
+        run.resize((end - start) as usize, 0);
+        reader.read_range_into(start, &mut run)?;
+        for block in &blocks[i..j] {
+            let lo = (block.file_offset + 24 - start) as usize;
+            f(&run[lo..lo + (block.size - 24) as usize])?;
+        }
+        i = j;
+    }
+    Ok(())
+}
+
 impl MdfIndex {
     /// Create an index from an MDF file on disk.
     ///
@@ -630,11 +954,24 @@ impl MdfIndex {
         let file_size = std::fs::metadata(file_path)
             .map_err(|e| MdfError::IOError(e))?
             .len();
-        let mut index = Self::build_index(mdf, file_size)?;
+        let mut index = Self::build_index(&mdf, file_size)?;
         index.source = Some(Source::File(file_path.to_string()));
         Ok(index)
     }
 
+    /// Create an index from an already-opened [`MDF`] without re-parsing it.
+    ///
+    /// The index reads its samples through the same memory map as `mdf`
+    /// (attached as a [`Source::Mapped`] under `path`), so no file is opened
+    /// again. Not available on `wasm32-unknown-unknown`.
+    #[cfg(not(target_arch = "wasm32"))]
+    pub fn from_mdf(mdf: &MDF, path: impl Into<String>) -> Result<Self, MdfError> {
+        let mmap = mdf.shared_mmap();
+        let mut index = Self::build_index(mdf, mmap.len() as u64)?;
+        index.source = Some(Source::Mapped(path.into(), MappedFile(mmap)));
+        Ok(index)
+    }
+
     /// Build an index from an MDF file served over HTTP / S3 using range
     /// requests, remembering the URL as the index's [`Source`].
     ///
@@ -657,7 +994,7 @@ impl MdfIndex {
     }
 
     /// Shared index-building logic operating on an already-parsed [`MDF`].
-    fn build_index(mdf: MDF, file_size: u64) -> Result<Self, MdfError> {
+    fn build_index(mdf: &MDF, file_size: u64) -> Result<Self, MdfError> {
         let start_time_ns = mdf.start_time_ns();
         let mut indexed_groups = Vec::new();
 
@@ -790,7 +1127,7 @@ impl MdfIndex {
     pub fn from_bytes(data: Vec<u8>) -> Result<Self, MdfError> {
         let file_size = data.len() as u64;
         let mdf = MDF::from_bytes(data)?;
-        Self::build_index(mdf, file_size)
+        Self::build_index(&mdf, file_size)
     }
 
     /// Build an [`MdfIndex`] using only [`ByteRangeReader`] calls.
@@ -938,23 +1275,36 @@ impl MdfIndex {
 
     /// Save the index to a JSON file.
     ///
+    /// The file is written as compact JSON streamed straight from the index
+    /// (no intermediate string, no pretty-printing whitespace); use
+    /// [`to_json`] for a human-readable rendering.
+    ///
     /// Not available on `wasm32-unknown-unknown`; use [`to_json`] instead.
     #[cfg(not(target_arch = "wasm32"))]
     pub fn save_to_file(&self, index_path: &str) -> Result<(), MdfError> {
-        let json = self.to_json()?;
-        std::fs::write(index_path, json)
+        use std::io::Write;
+
+        let file = std::fs::File::create(index_path)
             .map_err(|e| MdfError::IOError(e))?;
+        let mut writer = std::io::BufWriter::new(file);
+        serde_json::to_writer(&mut writer, self)
+            .map_err(|e| MdfError::BlockSerializationError(format!("JSON serialization failed: {}", e)))?;
+        writer.flush().map_err(|e| MdfError::IOError(e))?;
         Ok(())
     }
 
     /// Load an index from a JSON file.
     ///
+    /// The raw bytes are parsed directly, skipping the UTF-8 `String`
+    /// round-trip. Accepts both compact and pretty-printed JSON.
+    ///
     /// Not available on `wasm32-unknown-unknown`; use [`from_json`] instead.
     #[cfg(not(target_arch = "wasm32"))]
     pub fn load_from_file(index_path: &str) -> Result<Self, MdfError> {
-        let json = std::fs::read_to_string(index_path)
+        let bytes = std::fs::read(index_path)
             .map_err(|e| MdfError::IOError(e))?;
-        Self::from_json(&json)
+        serde_json::from_slice(&bytes)
+            .map_err(|e| MdfError::BlockSerializationError(format!("JSON deserialization failed: {}", e)))
     }
 
     /// Serialize the index to a JSON string (available on all targets).
@@ -1024,16 +1374,9 @@ impl MdfIndex {
         let mut values = Vec::with_capacity(total_records);
         let temp_cb = channel.to_channel_block();
 
-        for data_block in &group.data_blocks {
-            if data_block.is_compressed {
-                return Err(MdfError::BlockSerializationError(
-                    "Compressed blocks not yet supported in index reader".to_string()
-                ));
-            }
-
-            let block_data = reader.read_range(data_block.file_offset + 24, data_block.size - 24)?;
-            Self::decode_records_to_values(&block_data, record_size, group, channel, &temp_cb, &mut values)?;
-        }
+        for_each_block_payload(reader, &group.data_blocks, |block_data| {
+            Self::decode_records_to_values(block_data, record_size, group, channel, &temp_cb, &mut values)
+        })?;
 
         Ok(values)
     }
@@ -1092,6 +1435,19 @@ impl MdfIndex {
         let cg_data_bytes = group.record_size;
         let has_invalidation = group.invalidation_bytes > 0;
 
+        if !has_invalidation && (!has_conversion || linear_coeffs.is_some()) {
+            // Byte-aligned fields, in either byte order, are pulled out with a
+            // fixed-stride column loop; a linear conversion is one more pass
+            // over the freshly decoded, still-cached values.
+            let first = values.len();
+            if decode_f64_column(block_data, record_size, record_id_len, temp_cb, values) {
+                if let Some((a, b)) = linear_coeffs {
+                    values[first..].iter_mut().for_each(|v| *v = a + b * *v);
+                }
+                return Ok(());
+            }
+        }
+
         if !has_invalidation && !has_conversion {
             // Fastest path: no invalidation, no conversion - just decode f64 directly
             for i in 0..record_count {
@@ -1206,6 +1562,8 @@ impl MdfIndex {
     pub fn source_string(&self) -> Option<String> {
         match &self.source {
             Some(Source::File(p)) => Some(p.clone()),
+            #[cfg(not(target_arch = "wasm32"))]
+            Some(Source::Mapped(p, _)) => Some(p.clone()),
             #[cfg(feature = "http")]
             Some(Source::Url(u)) => Some(u.clone()),
             None => None,
@@ -1228,6 +1586,16 @@ impl MdfIndex {
         out
     }
 
+    /// Total number of channels across all groups.
+    pub fn channel_count(&self) -> usize {
+        self.channel_groups.iter().map(|g| g.channels.len()).sum()
+    }
+
+    /// Total number of records across all groups (sum of each group's cycle count).
+    pub fn record_count(&self) -> u64 {
+        self.channel_groups.iter().map(|g| g.record_count).sum()
+    }
+
     /// Every channel name across all groups, in file order (duplicates kept).
     pub fn channel_names(&self) -> Vec<&str> {
         self.channel_groups
@@ -1313,6 +1681,21 @@ impl MdfIndex {
         self.source = Some(Source::File(path.into()));
     }
 
+    /// Attach a local file and keep it memory-mapped for every later read.
+    ///
+    /// [`MdfIndex::set_file`] maps the file afresh on each read; this maps it
+    /// once and reuses the map until the source is replaced. Pages are still
+    /// read lazily, as reads touch them. Not available on
+    /// `wasm32-unknown-unknown`.
+    #[cfg(not(target_arch = "wasm32"))]
+    pub fn attach_file(&mut self, path: impl Into<String>) -> Result<(), MdfError> {
+        let path = path.into();
+        let file = std::fs::File::open(&path).map_err(MdfError::IOError)?;
+        let mmap = unsafe { memmap2::Mmap::map(&file) }.map_err(MdfError::IOError)?;
+        self.source = Some(Source::Mapped(path, MappedFile(std::sync::Arc::new(mmap))));
+        Ok(())
+    }
+
     /// Attach an HTTP/S3 URL as the data source for lazy reads.
     #[cfg(feature = "http")]
     pub fn set_url(&mut self, url: impl Into<String>) {
@@ -1344,7 +1727,7 @@ impl MdfIndex {
     }
 
     /// Decode a channel + its group master from the attached source.
-    fn read_signal(&self, g: usize, c: usize) -> Result<Signal, MdfError> {
+    pub(crate) fn read_signal(&self, g: usize, c: usize) -> Result<Signal, MdfError> {
         let (name, unit, master) = {
             let channel = &self.channel_groups[g].channels[c];
             let master = self.channel_groups[g]
@@ -1355,13 +1738,69 @@ impl MdfIndex {
             (channel.name.clone().unwrap_or_default(), channel.unit.clone(), master)
         };
 
-        let values = self.read_values_via_source(g, c)?;
+        let (values, timestamps) = match self.require_source()? {
+            // Map a local file once and decode both the channel and its master
+            // from the same slice instead of mapping it per column.
+            #[cfg(not(target_arch = "wasm32"))]
+            Source::File(path) => {
+                let mmap = map_file(path)?;
+                advise_will_need(&mmap, &[&self.channel_groups[g]]);
+                self.read_signal_columns_from_slice(g, c, master, &mmap)?
+            }
+            #[cfg(not(target_arch = "wasm32"))]
+            Source::Mapped(_, mmap) => {
+                advise_will_need(&mmap.0, &[&self.channel_groups[g]]);
+                self.read_signal_columns_from_slice(g, c, master, mmap)?
+            }
+            #[allow(unreachable_patterns)]
+            _ => {
+                let values = self.read_values_via_source(g, c)?;
+                let timestamps = match master {
+                    Some(m) => self.read_values_f64_via_source(g, m)?,
+                    None => Vec::new(),
+                };
+                (values, timestamps)
+            }
+        };
+
+        Ok(Signal { name, unit, timestamps, values })
+    }
+
+    /// Decode a channel and (optionally) its master column from one file slice.
+    #[cfg(not(target_arch = "wasm32"))]
+    fn read_signal_columns_from_slice(
+        &self,
+        g: usize,
+        c: usize,
+        master: Option<usize>,
+        file_data: &[u8],
+    ) -> Result<(Vec<Option<DecodedValue>>, Vec<f64>), MdfError> {
+        let values = self.read_channel_values_from_slice(g, c, file_data)?;
         let timestamps = match master {
-            Some(m) => self.read_values_f64_via_source(g, m)?,
+            Some(m) => self.read_channel_values_from_slice_as_f64(g, m, file_data)?,
             None => Vec::new(),
         };
+        Ok((values, timestamps))
+    }
 
-        Ok(Signal { name, unit, timestamps, values })
+    /// The group at index `g`, or an error naming the bad index.
+    #[cfg(not(target_arch = "wasm32"))]
+    fn group_at(&self, g: usize) -> Result<&IndexedChannelGroup, MdfError> {
+        self.channel_groups
+            .get(g)
+            .ok_or_else(|| MdfError::BlockSerializationError("Invalid group index".to_string()))
+    }
+
+    /// The distinct groups referenced by `positions`, in first-seen order.
+    #[cfg(not(target_arch = "wasm32"))]
+    fn groups_at(&self, positions: &[(usize, usize)]) -> Result<Vec<&IndexedChannelGroup>, MdfError> {
+        let mut seen = Vec::new();
+        for &(g, _) in positions {
+            if !seen.contains(&g) {
+                seen.push(g);
+            }
+        }
+        seen.into_iter().map(|g| self.group_at(g)).collect()
     }
 
     /// Resolve the attached [`Source`], erroring with a helpful message if none.
@@ -1382,10 +1821,15 @@ impl MdfIndex {
         match self.require_source()? {
             #[cfg(not(target_arch = "wasm32"))]
             Source::File(path) => {
-                let file = std::fs::File::open(path).map_err(MdfError::IOError)?;
-                let mmap = unsafe { memmap2::Mmap::map(&file) }.map_err(MdfError::IOError)?;
+                let mmap = map_sequential(path)?;
+                advise_will_need(&mmap, &[self.group_at(g)?]);
                 self.read_channel_values_from_slice(g, c, &mmap)
             }
+            #[cfg(not(target_arch = "wasm32"))]
+            Source::Mapped(_, mmap) => {
+                advise_will_need(&mmap.0, &[self.group_at(g)?]);
+                self.read_channel_values_from_slice(g, c, mmap)
+            }
             #[cfg(target_arch = "wasm32")]
             Source::File(_) => Err(MdfError::BlockSerializationError(
                 "file sources are not available on wasm32".to_string(),
@@ -1409,10 +1853,15 @@ impl MdfIndex {
         match self.require_source()? {
             #[cfg(not(target_arch = "wasm32"))]
             Source::File(path) => {
-                let file = std::fs::File::open(path).map_err(MdfError::IOError)?;
-                let mmap = unsafe { memmap2::Mmap::map(&file) }.map_err(MdfError::IOError)?;
+                let mmap = map_sequential(path)?;
+                advise_will_need(&mmap, &[self.group_at(g)?]);
                 self.read_channel_values_from_slice_as_f64(g, c, &mmap)
             }
+            #[cfg(not(target_arch = "wasm32"))]
+            Source::Mapped(_, mmap) => {
+                advise_will_need(&mmap.0, &[self.group_at(g)?]);
+                self.read_channel_values_from_slice_as_f64(g, c, mmap)
+            }
             #[cfg(target_arch = "wasm32")]
             Source::File(_) => Err(MdfError::BlockSerializationError(
                 "file sources are not available on wasm32".to_string(),
@@ -1427,6 +1876,269 @@ impl MdfIndex {
         }
     }
 
+    /// Read records `[start, start + count)` of one channel as `f64` through
+    /// the attached source.
+    ///
+    /// Only the data blocks overlapping the window are touched, so a long
+    /// channel can be walked chunk by chunk in bounded memory. The window is
+    /// clamped to the group's records; past the end the result is empty.
+    #[allow(dead_code)] // used by the Python bindings (pyo3 feature)
+    pub(crate) fn read_values_f64_window_via_source(
+        &self,
+        g: usize,
+        c: usize,
+        start: u64,
+        count: u64,
+    ) -> Result<Vec<f64>, MdfError> {
+        self.read_values_f64_window_from(self.require_source()?, g, c, start, count)
+    }
+
+    /// The attached source, with a plain file path mapped once.
+    ///
+    /// For a caller that will read the same source many times in a row (a
+    /// chunked walk over one channel, say) so that each read slices one
+    /// mapping instead of opening and mapping the file again. Other sources
+    /// are returned as they are.
+    #[allow(dead_code)] // used by the Python bindings (pyo3 feature)
+    pub(crate) fn pinned_source(&self) -> Result<Source, MdfError> {
+        match self.require_source()? {
+            #[cfg(not(target_arch = "wasm32"))]
+            Source::File(path) => {
+                let mmap = map_file(path)?;
+                Ok(Source::Mapped(path.clone(), MappedFile(std::sync::Arc::new(mmap))))
+            }
+            other => Ok(other.clone()),
+        }
+    }
+
+    /// [`read_values_f64_window_via_source`](Self::read_values_f64_window_via_source)
+    /// against an explicit `source` rather than the attached one.
+    #[allow(dead_code)] // used by the Python bindings (pyo3 feature)
+    pub(crate) fn read_values_f64_window_from(
+        &self,
+        source: &Source,
+        g: usize,
+        c: usize,
+        start: u64,
+        count: u64,
+    ) -> Result<Vec<f64>, MdfError> {
+        match source {
+            #[cfg(not(target_arch = "wasm32"))]
+            Source::File(path) => {
+                let mmap = map_sequential(path)?;
+                self.read_channel_window_from_slice_as_f64(g, c, start, count, &mmap)
+            }
+            #[cfg(not(target_arch = "wasm32"))]
+            Source::Mapped(_, mmap) => {
+                self.read_channel_window_from_slice_as_f64(g, c, start, count, mmap)
+            }
+            #[cfg(target_arch = "wasm32")]
+            Source::File(_) => Err(MdfError::BlockSerializationError(
+                "file sources are not available on wasm32".to_string(),
+            )),
+            #[cfg(feature = "http")]
+            Source::Url(url) => {
+                let mut http = HttpRangeReader::new(url)?;
+                self.read_channel_window_as_f64(g, c, start, count, &mut http)
+            }
+        }
+    }
+
+    /// Read several channels' values as `f64` through the attached source,
+    /// opening it only once.
+    ///
+    /// A file source is memory-mapped a single time and the channels are
+    /// decoded from that map in parallel; a URL source shares one HTTP reader,
+    /// and channels of the same group share each fetched data run, so the
+    /// request count scales with groups rather than channels. Results are
+    /// returned in the order of `positions`.
+    pub(crate) fn read_values_f64_many_via_source(
+        &self,
+        positions: &[(usize, usize)],
+    ) -> Result<Vec<Vec<f64>>, MdfError> {
+        match self.require_source()? {
+            #[cfg(not(target_arch = "wasm32"))]
+            Source::File(path) => {
+                let mmap = map_file(path)?;
+                advise_will_need(&mmap, &self.groups_at(positions)?);
+                self.read_many_from_slice_as_f64(positions, &mmap)
+            }
+            #[cfg(not(target_arch = "wasm32"))]
+            Source::Mapped(_, mmap) => {
+                advise_will_need(&mmap.0, &self.groups_at(positions)?);
+                self.read_many_from_slice_as_f64(positions, mmap)
+            }
+            #[cfg(target_arch = "wasm32")]
+            Source::File(_) => Err(MdfError::BlockSerializationError(
+                "file sources are not available on wasm32".to_string(),
+            )),
+            #[cfg(feature = "http")]
+            Source::Url(url) => {
+                // Visit the channels group by group so each group's data
+                // runs are fetched once and shared by all of its channels.
+                let mut order: Vec<usize> = (0..positions.len()).collect();
+                order.sort_by_key(|&i| positions[i].0);
+                let mut shared = SharedRunReader::new(HttpRangeReader::new(url)?);
+                let mut columns = vec![Vec::new(); positions.len()];
+                let mut current_group = None;
+                for i in order {
+                    let (g, c) = positions[i];
+                    if current_group != Some(g) {
+                        shared.clear();
+                        current_group = Some(g);
+                    }
+                    columns[i] = self.read_channel_values_as_f64(g, c, &mut shared)?;
+                }
+                Ok(columns)
+            }
+        }
+    }
+
+    /// Decode several channels from one in-memory file image.
+    ///
+    /// Channels of the same group are decoded together, one stretch of
+    /// records at a time, so each part of a data block is brought into cache
+    /// once for all of them rather than once per channel. The work is split
+    /// across scoped worker threads (one per available core, at most one per
+    /// channel), a large group being divided among several workers; they only
+    /// share read-only access to `file_data`. Results keep the order of
+    /// `positions`.
+    #[cfg(not(target_arch = "wasm32"))]
+    fn read_many_from_slice_as_f64(
+        &self,
+        positions: &[(usize, usize)],
+        file_data: &[u8],
+    ) -> Result<Vec<Vec<f64>>, MdfError> {
+        let workers = std::thread::available_parallelism()
+            .map(|n| n.get())
+            .unwrap_or(1)
+            .min(positions.len())
+            .max(1);
+
+        // Requested positions (indices into `positions`) per group, in order
+        // of first appearance.
+        let mut by_group: Vec<(usize, Vec<usize>)> = Vec::new();
+        for (i, &(g, _)) in positions.iter().enumerate() {
+            match by_group.iter_mut().find(|(group, _)| *group == g) {
+                Some((_, requested)) => requested.push(i),
+                None => by_group.push((g, vec![i])),
+            }
+        }
+        let per_unit = (positions.len() + workers - 1) / workers;
+        let units: Vec<(usize, &[usize])> = by_group
+            .iter()
+            .flat_map(|(g, requested)| requested.chunks(per_unit).map(move |part| (*g, part)))
+            .collect();
+
+        let decode_unit = |&(g, part): &(usize, &[usize])| -> Result<Vec<Vec<f64>>, MdfError> {
+            let channels: Vec<usize> = part.iter().map(|&i| positions[i].1).collect();
+            self.read_group_columns_from_slice_as_f64(g, &channels, file_data)
+        };
+
+        let mut decoded: Vec<Vec<Vec<f64>>> = Vec::with_capacity(units.len());
+        if workers <= 1 || units.len() <= 1 {
+            for unit in &units {
+                decoded.push(decode_unit(unit)?);
+            }
+        } else {
+            let per_worker = (units.len() + workers - 1) / workers;
+            std::thread::scope(|scope| -> Result<(), MdfError> {
+                let handles: Vec<_> = units
+                    .chunks(per_worker)
+                    .map(|batch| {
+                        scope.spawn(move || {
+                            batch.iter().map(decode_unit).collect::<Result<Vec<_>, MdfError>>()
+                        })
+                    })
+                    .collect();
+                for handle in handles {
+                    decoded.extend(handle.join().expect("channel decode worker panicked")?);
+                }
+                Ok(())
+            })?;
+        }
+
+        let mut columns = vec![Vec::new(); positions.len()];
+        for ((_, part), unit_columns) in units.iter().zip(decoded) {
+            for (&i, values) in part.iter().zip(unit_columns) {
+                columns[i] = values;
+            }
+        }
+        Ok(columns)
+    }
+
+    /// Decode several channels of one group from an in-memory file image in
+    /// a single pass over its data blocks.
+    ///
+    /// Each block is walked in stretches of about [`GROUP_DECODE_STRETCH`]
+    /// bytes of whole records, and every channel is decoded from a stretch
+    /// before moving to the next, while those records are still in cache.
+    /// Columns come back in the order of `channels`.
+    #[cfg(not(target_arch = "wasm32"))]
+    fn read_group_columns_from_slice_as_f64(
+        &self,
+        group_index: usize,
+        channels: &[usize],
+        file_data: &[u8],
+    ) -> Result<Vec<Vec<f64>>, MdfError> {
+        let group = self.channel_groups.get(group_index)
+            .ok_or_else(|| MdfError::BlockSerializationError("Invalid group index".to_string()))?;
+        let decoders = channels
+            .iter()
+            .map(|&c| {
+                let channel = group.channels.get(c).ok_or_else(|| {
+                    MdfError::BlockSerializationError("Invalid channel index".to_string())
+                })?;
+                let linear_coeffs = Self::get_linear_coeffs(channel);
+                Ok((channel, channel.to_decode_only_channel_block(), linear_coeffs, channel.conversion.is_some()))
+            })
+            .collect::<Result<Vec<_>, MdfError>>()?;
+
+        let record_size = group.record_id_len as usize
+            + group.record_size as usize
+            + group.invalidation_bytes as usize;
+        let total_records: usize = group.data_blocks.iter()
+            .map(|db| ((db.size - 24) / record_size as u64) as usize)
+            .sum();
+        let mut columns: Vec<Vec<f64>> = (0..channels.len())
+            .map(|_| Vec::with_capacity(total_records))
+            .collect();
+        let stretch = (GROUP_DECODE_STRETCH / record_size).max(1) * record_size;
+
+        for data_block in &group.data_blocks {
+            if data_block.is_compressed {
+                return Err(MdfError::BlockSerializationError(
+                    "Compressed blocks not yet supported in index reader".to_string()
+                ));
+            }
+            let block_data = Self::slice_data_block(file_data, data_block)?;
+            for records in block_data.chunks(stretch) {
+                for ((channel, temp_cb, linear_coeffs, has_conversion), values) in decoders.iter().zip(columns.iter_mut()) {
+                    Self::decode_records_to_f64(records, record_size, group, channel, temp_cb, *linear_coeffs, *has_conversion, values)?;
+                }
+            }
+        }
+
+        Ok(columns)
+    }
+
+    /// Read several channels by name as `f64`, opening the source only once.
+    ///
+    /// Each name resolves to its first match across all groups, as with
+    /// [`MdfIndex::read`]. Errors if any name is missing or no source is
+    /// attached.
+    pub fn read_many_f64(&self, names: &[&str]) -> Result<Vec<Vec<f64>>, MdfError> {
+        let positions = names
+            .iter()
+            .map(|name| {
+                self.locate(name).ok_or_else(|| {
+                    MdfError::BlockSerializationError(format!("Channel '{}' not found", name))
+                })
+            })
+            .collect::<Result<Vec<_>, _>>()?;
+        self.read_values_f64_many_via_source(&positions)
+    }
+
     /// Get the exact byte ranges needed to read all data for a specific channel
     /// 
     /// Returns a vector of (file_offset, length) tuples representing the byte ranges
@@ -1526,15 +2238,7 @@ impl MdfIndex {
         let record_size = group.record_id_len as usize + group.record_size as usize + group.invalidation_bytes as usize;
         let channel_offset_in_record = group.record_id_len as usize + channel.byte_offset as usize;
         
-        // Calculate how many bytes this channel needs per record
-        let channel_bytes_per_record = if matches!(channel.data_type,
-            DataType::StringLatin1 | DataType::StringUtf8 | DataType::StringUtf16LE | 
-            DataType::StringUtf16BE | DataType::ByteArray | DataType::MimeSample | DataType::MimeStream)
-        {
-            channel.bit_count as usize / 8
-        } else {
-            ((channel.bit_offset as usize + channel.bit_count as usize + 7) / 8).max(1)
-        };
+        let channel_bytes_per_record = channel_bytes_per_record(channel);
 
         let mut byte_ranges = Vec::new();
         let mut records_processed = 0u64;
@@ -1656,14 +2360,116 @@ impl MdfIndex {
         let linear_coeffs = Self::get_linear_coeffs(channel);
         let has_conversion = channel.conversion.is_some();
 
+        for_each_block_payload(reader, &group.data_blocks, |block_data| {
+            Self::decode_records_to_f64(block_data, record_size, group, channel, &temp_cb, linear_coeffs, has_conversion, &mut values)
+        })?;
+
+        Ok(values)
+    }
+
+    /// Decode a channel's values as `f64` from byte ranges the caller has
+    /// already fetched, by name, without reading the source again.
+    ///
+    /// `buffers` pairs each fetched range's file offset with its bytes, e.g.
+    /// the result of fetching [`MdfIndex::byte_ranges`] (merged or not). For
+    /// every data block, the channel's span of that block must lie inside one
+    /// buffer. Groups with invalidation bytes need each data block's whole
+    /// record payload, which `byte_ranges` does not cover. Invalid samples
+    /// become `f64::NAN`.
+    pub fn decode_f64_from_buffers(&self, name: &str, buffers: &[(u64, &[u8])]) -> Result<Vec<f64>, MdfError> {
+        let (g, c) = self.locate(name).ok_or_else(|| {
+            MdfError::BlockSerializationError(format!("Channel '{}' not found", name))
+        })?;
+        self.decode_channel_f64_from_buffers(g, c, buffers)
+    }
+
+    /// [`MdfIndex::decode_f64_from_buffers`] for a channel addressed by group
+    /// name + channel name.
+    pub fn decode_f64_from_buffers_in(
+        &self,
+        group: &str,
+        name: &str,
+        buffers: &[(u64, &[u8])],
+    ) -> Result<Vec<f64>, MdfError> {
+        let (g, c) = self.locate_in(group, name).ok_or_else(|| {
+            MdfError::BlockSerializationError(format!(
+                "Channel '{}' not found in group '{}'",
+                name, group
+            ))
+        })?;
+        self.decode_channel_f64_from_buffers(g, c, buffers)
+    }
+
+    /// Positional worker behind [`MdfIndex::decode_f64_from_buffers`].
+    pub(crate) fn decode_channel_f64_from_buffers(
+        &self,
+        group_index: usize,
+        channel_index: usize,
+        buffers: &[(u64, &[u8])],
+    ) -> Result<Vec<f64>, MdfError> {
+        let group = self.channel_groups.get(group_index)
+            .ok_or_else(|| MdfError::BlockSerializationError("Invalid group index".to_string()))?;
+        let channel = group.channels.get(channel_index)
+            .ok_or_else(|| MdfError::BlockSerializationError("Invalid channel index".to_string()))?;
+
+        let record_size = group.record_id_len as usize
+            + group.record_size as usize
+            + group.invalidation_bytes as usize;
+        let channel_offset_in_record = (group.record_id_len as u64) + channel.byte_offset as u64;
+        let channel_bytes = channel_bytes_per_record(channel) as u64;
+        let total_records: usize = group.data_blocks.iter()
+            .map(|db| ((db.size - 24) / record_size as u64) as usize)
+            .sum();
+        let mut values = Vec::with_capacity(total_records);
+
+        let temp_cb = channel.to_decode_only_channel_block();
+        let linear_coeffs = Self::get_linear_coeffs(channel);
+        let has_conversion = channel.conversion.is_some();
+
+        let mut sorted = buffers.to_vec();
+        sorted.sort_unstable_by_key(|&(offset, _)| offset);
+
+        // Each block payload is rebuilt in one scratch buffer: the fetched
+        // bytes land at their record positions, anything the channel does not
+        // read stays zero.
+        let mut payload = Vec::new();
         for data_block in &group.data_blocks {
             if data_block.is_compressed {
                 return Err(MdfError::BlockSerializationError(
                     "Compressed blocks not yet supported in index reader".to_string()
                 ));
             }
-            let block_data = reader.read_range(data_block.file_offset + 24, data_block.size - 24)?;
-            Self::decode_records_to_f64(&block_data, record_size, group, channel, &temp_cb, linear_coeffs, has_conversion, &mut values)?;
+            let payload_start = data_block.file_offset + 24;
+            let payload_len = data_block.size - 24;
+            let records = payload_len / record_size as u64;
+            if records == 0 {
+                continue;
+            }
+            let (need_start, need_end) = if group.invalidation_bytes > 0 {
+                (payload_start, payload_start + payload_len)
+            } else {
+                let first = payload_start + channel_offset_in_record;
+                (first, first + (records - 1) * record_size as u64 + channel_bytes)
+            };
+
+            // The last buffer starting at or before the span is the only one
+            // that can contain it.
+            let slot = sorted.partition_point(|&(offset, _)| offset <= need_start);
+            let (offset, bytes) = slot.checked_sub(1)
+                .map(|i| sorted[i])
+                .filter(|&(offset, bytes)| offset + bytes.len() as u64 >= need_end)
+                .ok_or_else(|| MdfError::BlockSerializationError(format!(
+                    "bytes {}-{} of the channel are not covered by the fetched buffers",
+                    need_start, need_end - 1
+                )))?;
+
+            payload.clear();
+            payload.resize(payload_len as usize, 0);
+            let lo = offset.max(payload_start);
+            let hi = (offset + bytes.len() as u64).min(payload_start + payload_len);
+            payload[(lo - payload_start) as usize..(hi - payload_start) as usize]
+                .copy_from_slice(&bytes[(lo - offset) as usize..(hi - offset) as usize]);
+            Self::decode_records_to_f64(&payload, record_size, group, channel, &temp_cb, linear_coeffs, has_conversion, &mut values)?;
         }
 
         Ok(values)
@@ -1749,6 +2555,118 @@ impl MdfIndex {
         Ok(values)
     }
 
+    /// Payload spans `(offset, length)` holding the whole records
+    /// `[start, start + count)` of `group`, one per overlapping data block.
+    fn record_window_spans(
+        group: &IndexedChannelGroup,
+        start: u64,
+        count: u64,
+    ) -> Result<Vec<(u64, usize)>, MdfError> {
+        let record_size = (group.record_id_len as usize
+            + group.record_size as usize
+            + group.invalidation_bytes as usize) as u64;
+        let end = start.saturating_add(count);
+        let mut spans = Vec::new();
+        let mut block_first = 0u64;
+        for data_block in &group.data_blocks {
+            if block_first >= end {
+                break;
+            }
+            let records_in_block = (data_block.size - 24) / record_size;
+            let lo = start.max(block_first);
+            let hi = end.min(block_first + records_in_block);
+            if lo < hi {
+                if data_block.is_compressed {
+                    return Err(MdfError::BlockSerializationError(
+                        "Compressed blocks not yet supported in index reader".to_string()
+                    ));
+                }
+                let offset = data_block.file_offset + 24 + (lo - block_first) * record_size;
+                spans.push((offset, ((hi - lo) * record_size) as usize));
+            }
+            block_first += records_in_block;
+        }
+        Ok(spans)
+    }
+
+    /// Decode records `[start, start + count)` of a channel as `f64` from
+    /// an in-memory file image.
+    #[allow(dead_code)] // used by the Python bindings (pyo3 feature)
+    fn read_channel_window_from_slice_as_f64(
+        &self,
+        group_index: usize,
+        channel_index: usize,
+        start: u64,
+        count: u64,
+        file_data: &[u8],
+    ) -> Result<Vec<f64>, MdfError> {
+        let group = self.channel_groups.get(group_index)
+            .ok_or_else(|| MdfError::BlockSerializationError("Invalid group index".to_string()))?;
+        let channel = group.channels.get(channel_index)
+            .ok_or_else(|| MdfError::BlockSerializationError("Invalid channel index".to_string()))?;
+
+        let record_size = group.record_id_len as usize
+            + group.record_size as usize
+            + group.invalidation_bytes as usize;
+        let spans = Self::record_window_spans(group, start, count)?;
+        let mut values = Vec::with_capacity(spans.iter().map(|&(_, len)| len / record_size).sum());
+        let temp_cb = channel.to_decode_only_channel_block();
+        let linear_coeffs = Self::get_linear_coeffs(channel);
+        let has_conversion = channel.conversion.is_some();
+
+        for (offset, len) in spans {
+            let data_start = offset as usize;
+            let records = file_data.get(data_start..data_start + len).ok_or(MdfError::TooShortBuffer {
+                actual: file_data.len(),
+                expected: data_start + len,
+                file: file!(),
+                line: line!(),
+            })?;
+            Self::decode_records_to_f64(records, record_size, group, channel, &temp_cb, linear_coeffs, has_conversion, &mut values)?;
+        }
+
+        Ok(values)
+    }
+
+    /// Decode records `[start, start + count)` of a channel as `f64`, fetching
+    /// only the overlapping records from `reader`.
+    #[allow(dead_code)] // used by the Python bindings (pyo3 + http features)
+    fn read_channel_window_as_f64<R: ByteRangeReader<Error = MdfError>>(
+        &self,
+        group_index: usize,
+        channel_index: usize,
+        start: u64,
+        count: u64,
+        reader: &mut R,
+    ) -> Result<Vec<f64>, MdfError> {
+        if let Some(data) = reader.as_slice() {
+            return self.read_channel_window_from_slice_as_f64(group_index, channel_index, start, count, data);
+        }
+        let group = self.channel_groups.get(group_index)
+            .ok_or_else(|| MdfError::BlockSerializationError("Invalid group index".to_string()))?;
+        let channel = group.channels.get(channel_index)
+            .ok_or_else(|| MdfError::BlockSerializationError("Invalid channel index".to_string()))?;
+
+        let record_size = group.record_id_len as usize
+            + group.record_size as usize
+            + group.invalidation_bytes as usize;
+        let spans = Self::record_window_spans(group, start, count)?;
+        let mut values = Vec::with_capacity(spans.iter().map(|&(_, len)| len / record_size).sum());
+        let temp_cb = channel.to_decode_only_channel_block();
+        let linear_coeffs = Self::get_linear_coeffs(channel);
+        let has_conversion = channel.conversion.is_some();
+
+        // One scratch buffer serves every span.
+        let mut buf = Vec::new();
+        for (offset, len) in spans {
+            buf.resize(len, 0);
+            reader.read_range_into(offset, &mut buf)?;
+            Self::decode_records_to_f64(&buf, record_size, group, channel, &temp_cb, linear_coeffs, has_conversion, &mut values)?;
+        }
+
+        Ok(values)
+    }
+
     /// Slice a data block from file_data, skipping the 24-byte block header.
     #[allow(dead_code)] // used by the Python bindings (pyo3 feature)
     fn slice_data_block<'a>(file_data: &'a [u8], data_block: &DataBlockInfo) -> Result<&'a [u8], MdfError> {
@@ -264,6 +264,65 @@ pub fn decode_f64_from_record(
     }
 }
 
+/// Append one `f64` per record of `block_data` for a byte-aligned numeric
+/// channel, reading it at a fixed stride.
+///
+/// The element type and byte order are resolved once for the whole block,
+/// so the loop body is a single fixed-width load and convert that the
+/// compiler can unroll and vectorize. Returns `false` without touching `out`
+/// when the layout needs [`decode_f64_from_record`] (bit-packed, odd widths,
+/// VLSD, or a field past the record end).
+pub fn decode_f64_column(
+    block_data: &[u8],
+    record_size: usize,
+    record_id_size: usize,
+    channel: &ChannelBlock,
+    out: &mut Vec<f64>,
+) -> bool {
+    if record_size == 0 || channel.bit_offset != 0 || (channel.channel_type == 1 && channel.data != 0) {
+        return false;
+    }
+    let offset = record_id_size + channel.byte_offset as usize;
+
+    macro_rules! column {
+        ($t:ty, $from_bytes:ident) => {{
+            const WIDTH: usize = std::mem::size_of::<$t>();
+            if offset + WIDTH > record_size {
+                return false;
+            }
+            out.extend(block_data.chunks_exact(record_size).map(|record| {
+                let field: [u8; WIDTH] = record[offset..offset + WIDTH].try_into().unwrap();
+                <$t>::$from_bytes(field) as f64
+            }));
+            true
+        }};
+    }
+
+    match (&channel.data_type, channel.bit_count) {
+        (DataType::FloatLE, 64) => column!(f64, from_le_bytes),
+        (DataType::FloatLE, 32) => column!(f32, from_le_bytes),
+        (DataType::UnsignedIntegerLE, 8) => column!(u8, from_le_bytes),
+        (DataType::UnsignedIntegerLE, 16) => column!(u16, from_le_bytes),
+        (DataType::UnsignedIntegerLE, 32) => column!(u32, from_le_bytes),
+        (DataType::UnsignedIntegerLE, 64) => column!(u64, from_le_bytes),
+        (DataType::SignedIntegerLE, 8) => column!(i8, from_le_bytes),
+        (DataType::SignedIntegerLE, 16) => column!(i16, from_le_bytes),
+        (DataType::SignedIntegerLE, 32) => column!(i32, from_le_bytes),
+        (DataType::SignedIntegerLE, 64) => column!(i64, from_le_bytes),
+        (DataType::FloatBE, 64) => column!(f64, from_be_bytes),
+        (DataType::FloatBE, 32) => column!(f32, from_be_bytes),
+        (DataType::UnsignedIntegerBE, 8) => column!(u8, from_be_bytes),
+        (DataType::UnsignedIntegerBE, 16) => column!(u16, from_be_bytes),
+        (DataType::UnsignedIntegerBE, 32) => column!(u32, from_be_bytes),
+        (DataType::UnsignedIntegerBE, 64) => column!(u64, from_be_bytes),
+        (DataType::SignedIntegerBE, 8) => column!(i8, from_be_bytes),
+        (DataType::SignedIntegerBE, 16) => column!(i16, from_be_bytes),
+        (DataType::SignedIntegerBE, 32) => column!(i32, from_be_bytes),
+        (DataType::SignedIntegerBE, 64) => column!(i64, from_be_bytes),
+        _ => false,
+    }
+}
+
 /// Internal function that performs the actual value decoding.
 ///
 /// This is the core decoding logic separated out so it can be used by both
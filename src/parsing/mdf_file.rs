@@ -15,10 +15,11 @@ pub struct MdfFile {
     pub identification: IdentificationBlock,
     pub header: HeaderBlock,
     pub data_groups: Vec<RawDataGroup>,
-    /// Backing byte store. On native targets this is a memory-mapped file;
-    /// on wasm32 (and when using `parse_from_bytes`) it is an owned `Vec<u8>`.
+    /// Backing byte store. On native targets this is a memory-mapped file,
+    /// shared so an [`MdfIndex`](crate::index::MdfIndex) built from it can
+    /// keep reading through the same map; on wasm32 it is an owned `Vec<u8>`.
     #[cfg(not(target_arch = "wasm32"))]
-    pub mmap: memmap2::Mmap,
+    pub mmap: std::sync::Arc<memmap2::Mmap>,
     #[cfg(target_arch = "wasm32")]
     pub mmap: Vec<u8>,
 }
@@ -38,7 +39,7 @@ impl MdfFile {
             identification,
             header,
             data_groups,
-            mmap,
+            mmap: std::sync::Arc::new(mmap),
         })
     }
 
@@ -57,7 +58,7 @@ impl MdfFile {
             identification,
             header,
             data_groups,
-            mmap,
+            mmap: std::sync::Arc::new(mmap),
         })
     }
 
@@ -6,9 +6,9 @@
 //! - Creating and using indexes
 
 use pyo3::prelude::*;
-use pyo3::types::IntoPyDict;
+use pyo3::types::{IntoPyDict, PyByteArray, PyBytes, PyDict, PyList};
 use pyo3::{create_exception, wrap_pyfunction};
-use numpy::{PyArray1, PyReadonlyArray1};
+use numpy::{Element, PyArray1, PyReadonlyArray1, PyReadonlyArray2, PyUntypedArrayMethods};
 use pyo3_stub_gen::derive::{
     gen_stub_pyclass, gen_stub_pyclass_enum, gen_stub_pyfunction, gen_stub_pymethods,
 };
@@ -17,11 +17,12 @@ use std::collections::HashMap;
 
 use crate::api::mdf::MDF;
 use crate::writer::{MdfWriter, ColumnData};
-use crate::index::{IndexedChannel, MdfIndex};
+use crate::index::{coalesce_byte_ranges, IndexedChannel, MdfIndex, Source};
 use crate::blocks::common::DataType;
 use crate::parsing::decoder::DecodedValue;
 use crate::error::MdfError;
 use crate::block_layout::{BlockInfo, FileLayout, GapInfo, LinkInfo};
+use crate::signal::decoded_opt_to_f64;
 
 // Custom exception for MDF errors
 create_exception!(mf4_rs, MdfException, pyo3::exceptions::PyException);
@@ -364,6 +365,29 @@ impl PyChannelGroupInfo {
         self.channels.iter().filter_map(|c| c.name.clone()).collect()
     }
 
+    /// Channel metadata as parallel lists rather than one object per channel.
+    ///
+    /// Cheaper than iterating :py:attr:`channels` when only names and types
+    /// are needed, e.g. to print a group listing.
+    ///
+    /// Returns
+    /// -------
+    /// tuple[list[Optional[str]], list[str], list[int]]
+    ///     ``(names, data_type_names, bit_counts)``, one entry per channel
+    ///     in record order.
+    fn channel_columns(&self) -> (Vec<Option<String>>, Vec<String>, Vec<u32>) {
+        let n = self.channels.len();
+        let mut names = Vec::with_capacity(n);
+        let mut data_types = Vec::with_capacity(n);
+        let mut bit_counts = Vec::with_capacity(n);
+        for c in &self.channels {
+            names.push(c.name.clone());
+            data_types.push(c.data_type.name.clone());
+            bit_counts.push(c.bit_count);
+        }
+        (names, data_types, bit_counts)
+    }
+
     fn __str__(&self) -> String {
         format!("Group(name={:?}, channels={}, records={})",
                 self.name, self.channel_count, self.record_count)
@@ -430,6 +454,148 @@ fn parse_lookup_key(key: &Bound<'_, PyAny>) -> PyResult<(String, Option<String>)
     }
 }
 
+/// Borrow a 1-D numpy array as a slice for bulk column writes.
+///
+/// Contiguous arrays are borrowed as-is. A zero-stride view (as produced by
+/// ``numpy.broadcast_to`` for a constant signal) is borrowed as its single
+/// element, which the writer broadcasts across every record.
+fn column_slice<'a, T: Element>(a: &'a PyReadonlyArray1<'_, T>) -> PyResult<&'a [T]> {
+    match a.as_slice() {
+        Ok(s) => Ok(s),
+        Err(e) => match a.get([0]) {
+            Some(v) if a.strides() == [0] => Ok(std::slice::from_ref(v)),
+            _ => Err(MdfException::new_err(format!("Array not contiguous: {}", e))),
+        },
+    }
+}
+
+/// Pack purely numeric decoded values into one contiguous numpy array.
+///
+/// Mirrors the dtype pandas would infer from the equivalent Python list —
+/// integers become ``int64`` (``uint64`` if any exceed ``i64::MAX``), and any
+/// float or invalid sample promotes the column to ``float64`` with ``NaN`` —
+/// without allocating a Python object per sample. Returns `None` for empty,
+/// all-invalid or non-numeric (text / bytes) channels so the caller can fall
+/// back to a list of Python objects.
+fn numeric_values_to_numpy(py: Python, values: &[Option<DecodedValue>]) -> Option<PyObject> {
+    let (mut has_float, mut has_none, mut has_numeric, mut fits_i64) = (false, false, false, true);
+    for value in values {
+        match value {
+            Some(DecodedValue::Float(_)) => has_float = true,
+            Some(DecodedValue::SignedInteger(_)) => {}
+            Some(DecodedValue::UnsignedInteger(v)) => fits_i64 &= *v <= i64::MAX as u64,
+            None => {
+                has_none = true;
+                continue;
+            }
+            Some(_) => return None,
+        }
+        has_numeric = true;
+    }
+    if !has_numeric {
+        return None;
+    }
+
+    if has_float || has_none {
+        let data: Vec<f64> = values.iter().map(decoded_opt_to_f64).collect();
+        return Some(PyArray1::from_vec_bound(py, data).into());
+    }
+    if fits_i64 {
+        let data: Vec<i64> = values
+            .iter()
+            .map(|v| match v {
+                Some(DecodedValue::SignedInteger(x)) => *x,
+                Some(DecodedValue::UnsignedInteger(x)) => *x as i64,
+                _ => 0,
+            })
+            .collect();
+        return Some(PyArray1::from_vec_bound(py, data).into());
+    }
+    // Some unsigned value exceeds i64::MAX: only an all-unsigned column maps
+    // cleanly onto uint64, anything mixed goes through the object path.
+    let mut data = Vec::with_capacity(values.len());
+    for value in values {
+        match value {
+            Some(DecodedValue::UnsignedInteger(x)) => data.push(*x),
+            _ => return None,
+        }
+    }
+    Some(PyArray1::from_vec_bound(py, data).into())
+}
+
+/// Build a numpy array of `T` from an integer column, for
+/// `MdfIndex.typed_values(dtype=...)`. Fails on the first sample that is
+/// invalid, not an integer, or outside the range of `T`.
+fn narrow_integers<T>(
+    py: Python,
+    name: &str,
+    dtype: &str,
+    values: &[Option<DecodedValue>],
+) -> PyResult<PyObject>
+where
+    T: Element + TryFrom<i64> + TryFrom<u64>,
+{
+    let mut data = Vec::with_capacity(values.len());
+    for (i, value) in values.iter().enumerate() {
+        let narrowed = match value {
+            Some(DecodedValue::SignedInteger(x)) => T::try_from(*x).ok(),
+            Some(DecodedValue::UnsignedInteger(x)) => T::try_from(*x).ok(),
+            Some(_) => {
+                return Err(MdfException::new_err(format!(
+                    "Channel '{}' is not an integer channel; dtype '{}' needs integers", name, dtype
+                )))
+            }
+            None => {
+                return Err(MdfException::new_err(format!(
+                    "Channel '{}' has an invalid sample at {}; it cannot be stored as {}", name, i, dtype
+                )))
+            }
+        };
+        data.push(narrowed.ok_or_else(|| {
+            MdfException::new_err(format!(
+                "Channel '{}' sample {} does not fit in {}", name, i, dtype
+            ))
+        })?);
+    }
+    Ok(PyArray1::from_vec_bound(py, data).into())
+}
+
+/// Build the index for a channel read from its group's master values: a
+/// ``DatetimeIndex`` when the file has a start time, otherwise the raw master
+/// seconds. `None` when there is no master.
+fn time_index(
+    py: Python,
+    pd: &PyObject,
+    timestamps: Vec<f64>,
+    start_time_ns: Option<u64>,
+) -> PyResult<PyObject> {
+    Ok(if timestamps.is_empty() {
+        py.None()
+    } else {
+        match start_time_ns.and_then(|ns| i64::try_from(ns).ok()) {
+            Some(start_ns) => {
+                // Absolute nanoseconds are computed here in one pass and
+                // handed to pandas as a datetime64[ns] view of the buffer, so
+                // building the DatetimeIndex needs no unit conversion or
+                // per-sample objects.
+                let stamps: Vec<i64> = timestamps
+                    .iter()
+                    .map(|&t| if t.is_finite() {
+                        start_ns.saturating_add((t * 1e9).round() as i64)
+                    } else {
+                        i64::MIN // NaT
+                    })
+                    .collect();
+                let py_ns = PyArray1::from_vec_bound(py, stamps);
+                let datetimes = py_ns.call_method1("view", ("datetime64[ns]",))?;
+                pd.getattr(py, "DatetimeIndex")?.call1(py, (datetimes,))?
+            }
+            // Moves the decoded buffer into numpy; no copy of the time axis.
+            None => PyArray1::from_vec_bound(py, timestamps).into(),
+        }
+    })
+}
+
 /// Build a ``pandas.Series`` from a decoded [`Signal`].
 ///
 /// `values` becomes the data; `timestamps` (master values in seconds) becomes
@@ -441,40 +607,25 @@ fn signal_to_series(
     py: Python,
     pd: &PyObject,
     name: &str,
-    timestamps: &[f64],
+    timestamps: Vec<f64>,
     values: Vec<Option<DecodedValue>>,
     start_time_ns: Option<u64>,
 ) -> PyResult<PyObject> {
-    let py_values: Vec<PyObject> = values
-        .into_iter()
-        .map(|o| o.map(|dv| decoded_value_to_pyobject(dv, py)).unwrap_or_else(|| py.None()))
-        .collect();
-
-    let index: PyObject = if timestamps.is_empty() {
-        py.None()
-    } else {
-        let py_ts = PyArray1::from_vec_bound(py, timestamps.to_vec());
-        if let Some(start_ns) = start_time_ns {
-            // Vectorized: start_timestamp + to_timedelta(seconds).
-            let to_datetime = pd.getattr(py, "to_datetime")?;
-            let to_timedelta = pd.getattr(py, "to_timedelta")?;
-            let start_ts = to_datetime.call(
-                py, (start_ns,),
-                Some([("unit", "ns")].into_py_dict(py)),
-            )?;
-            let deltas = to_timedelta.call(
-                py, (py_ts.clone(),),
-                Some([("unit", "s")].into_py_dict(py)),
-            )?;
-            match deltas.call_method1(py, "__add__", (start_ts,)) {
-                Ok(dt_index) => dt_index,
-                Err(_) => py_ts.into(),
-            }
-        } else {
-            py_ts.into()
-        }
+    let py_values: PyObject = match numeric_values_to_numpy(py, &values) {
+        Some(array) => array,
+        // The list is allocated at its final length and filled in place; no
+        // intermediate Vec of objects is built.
+        None => PyList::new_bound(
+            py,
+            values
+                .into_iter()
+                .map(|o| o.map(|dv| decoded_value_to_pyobject(dv, py)).unwrap_or_else(|| py.None())),
+        )
+        .into(),
     };
 
+    let index = time_index(py, pd, timestamps, start_time_ns)?;
+
     let series_class = pd.getattr(py, "Series")?;
     let series = if index.is_none(py) {
         series_class.call1(py, (py_values,))?
@@ -506,32 +657,96 @@ fn signal_to_series(
 pub struct PyMDF {
     mdf: Box<MDF>,
     path: String,
+    /// Every named channel in file order, decoded from its ``##TX`` block once
+    /// at open.
+    names: Vec<String>,
+    /// First `(group, channel)` position of every channel name.
+    by_name: HashMap<String, (usize, usize)>,
+    /// Per group name, the first `(group, channel)` position of every channel
+    /// name in groups carrying it, so group-qualified lookups are hash hits
+    /// instead of a walk over every group's channels.
+    in_group: HashMap<String, HashMap<String, (usize, usize)>>,
+    /// Group and channel metadata, decoded on first use and then shared by
+    /// `groups`, `group` and `channel`.
+    group_infos: std::sync::OnceLock<Vec<PyChannelGroupInfo>>,
+    /// Index over this file's own memory map, built on the first
+    /// `iter_values` call and shared by every iterator after it.
+    chunk_index: std::sync::OnceLock<Py<PyMdfIndex>>,
 }
 
 impl PyMDF {
+    /// Every group's metadata, decoding the ``##TX`` names, units and
+    /// comments on the first call only.
+    fn group_infos(&self) -> PyResult<&[PyChannelGroupInfo]> {
+        if let Some(infos) = self.group_infos.get() {
+            return Ok(infos);
+        }
+        let infos = self
+            .mdf
+            .channel_groups()
+            .iter()
+            .map(PyChannelGroupInfo::from_group)
+            .collect::<PyResult<Vec<_>>>()?;
+        Ok(self.group_infos.get_or_init(|| infos))
+    }
+
     /// Locate a live channel group + channel index by (optional group) name.
     fn find_group_channel<'a>(
         &'a self,
         group: Option<&str>,
         name: &str,
     ) -> PyResult<(crate::api::channel_group::ChannelGroup<'a>, usize)> {
-        for g in self.mdf.channel_groups() {
-            if let Some(gn) = group {
-                if g.name()?.as_deref() != Some(gn) {
-                    continue;
-                }
-            }
-            let chans = g.channels();
-            for (i, ch) in chans.iter().enumerate() {
-                if ch.name()?.as_deref() == Some(name) {
-                    return Ok((g, i));
-                }
-            }
+        let (g, c) = self.locate(group, name)?;
+        let g = self.mdf.channel_groups().into_iter().nth(g).expect("cached group index");
+        Ok((g, c))
+    }
+
+    /// The `(group, channel)` position of a channel by (optional group) name.
+    fn locate(&self, group: Option<&str>, name: &str) -> PyResult<(usize, usize)> {
+        let found = match group {
+            Some(gn) => self.in_group.get(gn).and_then(|channels| channels.get(name)),
+            None => self.by_name.get(name),
+        };
+        found.copied().ok_or_else(|| {
+            MdfException::new_err(match group {
+                Some(gn) => format!("Channel '{}' not found in group '{}'", name, gn),
+                None => format!("Channel '{}' not found", name),
+            })
+        })
+    }
+
+    /// Decode several channels of one group as `f64`, spreading them across
+    /// worker threads. Columns come back in the order of `channels`.
+    fn decode_columns_f64(
+        channels: &[&crate::api::channel::Channel<'_>],
+    ) -> Result<Vec<Vec<f64>>, MdfError> {
+        let workers = std::thread::available_parallelism()
+            .map(|n| n.get())
+            .unwrap_or(1)
+            .min(channels.len());
+        if workers <= 1 {
+            return channels.iter().map(|ch| ch.values_as_f64()).collect();
         }
-        Err(MdfException::new_err(match group {
-            Some(gn) => format!("Channel '{}' not found in group '{}'", name, gn),
-            None => format!("Channel '{}' not found", name),
-        }))
+
+        let per_worker = (channels.len() + workers - 1) / workers;
+        std::thread::scope(|scope| {
+            let handles: Vec<_> = channels
+                .chunks(per_worker)
+                .map(|part| {
+                    scope.spawn(move || {
+                        part.iter()
+                            .map(|ch| ch.values_as_f64())
+                            .collect::<Result<Vec<_>, MdfError>>()
+                    })
+                })
+                .collect();
+
+            let mut columns = Vec::with_capacity(channels.len());
+            for handle in handles {
+                columns.extend(handle.join().expect("channel decode worker panicked")?);
+            }
+            Ok(columns)
+        })
     }
 }
 
@@ -551,9 +766,39 @@ impl PyMDF {
     ///     If the file does not exist, has the wrong magic bytes, an
     ///     unsupported version, or contains malformed blocks.
     #[new]
-    fn new(path: &str) -> PyResult<Self> {
-        let mdf = Box::new(MDF::from_file(path)?);
-        Ok(PyMDF { mdf, path: path.to_string() })
+    fn new(py: Python, path: &str) -> PyResult<Self> {
+        // Parsing and the name scan are pure Rust; other threads may run.
+        let reader = py.allow_threads(|| -> Result<Self, MdfError> {
+            let mdf = Box::new(MDF::from_file(path)?);
+            let mut names = Vec::new();
+            let mut by_name = HashMap::new();
+            let mut in_group: HashMap<String, HashMap<String, (usize, usize)>> = HashMap::new();
+            for (g, group) in mdf.channel_groups().iter().enumerate() {
+                let mut group_channels = match group.name()? {
+                    Some(gn) => Some(in_group.entry(gn).or_default()),
+                    None => None,
+                };
+                for (c, channel) in group.channels().iter().enumerate() {
+                    if let Some(n) = channel.name()? {
+                        by_name.entry(n.clone()).or_insert((g, c));
+                        if let Some(channels) = group_channels.as_mut() {
+                            channels.entry(n.clone()).or_insert((g, c));
+                        }
+                        names.push(n);
+                    }
+                }
+            }
+            Ok(PyMDF {
+                mdf,
+                path: path.to_string(),
+                names,
+                by_name,
+                in_group,
+                group_infos: std::sync::OnceLock::new(),
+                chunk_index: std::sync::OnceLock::new(),
+            })
+        })?;
+        Ok(reader)
     }
 
     /// The file path this reader was opened from.
@@ -585,50 +830,80 @@ impl PyMDF {
     ///
     /// Each :class:`GroupInfo` carries its ``channels`` (a list of
     /// :class:`ChannelInfo`), so a single ``mdf.groups`` call gives the whole
-    /// structure.
+    /// structure. The metadata is decoded once per reader and reused by
+    /// later calls.
     #[getter]
     fn groups(&self) -> PyResult<Vec<PyChannelGroupInfo>> {
-        self.mdf
-            .channel_groups()
-            .iter()
-            .map(PyChannelGroupInfo::from_group)
-            .collect()
+        Ok(self.group_infos()?.to_vec())
     }
 
     /// Find a channel group by name (first match), or ``None``.
     fn group(&self, name: &str) -> PyResult<Option<PyChannelGroupInfo>> {
-        for g in self.mdf.channel_groups() {
-            if g.name()?.as_deref() == Some(name) {
-                return Ok(Some(PyChannelGroupInfo::from_group(&g)?));
-            }
-        }
-        Ok(None)
+        Ok(self
+            .group_infos()?
+            .iter()
+            .find(|g| g.name.as_deref() == Some(name))
+            .cloned())
     }
 
     /// Find a channel by name across all groups (first match), or ``None``.
     fn channel(&self, name: &str) -> PyResult<Option<PyChannelInfo>> {
-        for g in self.mdf.channel_groups() {
-            for ch in g.channels() {
-                if ch.name()?.as_deref() == Some(name) {
-                    return Ok(Some(PyChannelInfo::from_channel(&ch)?));
-                }
-            }
-        }
-        Ok(None)
+        let Some(&(g, c)) = self.by_name.get(name) else {
+            return Ok(None);
+        };
+        Ok(Some(self.group_infos()?[g].channels[c].clone()))
     }
 
     /// Names of every named channel across all groups (duplicates kept).
     #[getter]
     fn channel_names(&self) -> PyResult<Vec<String>> {
-        let mut names = Vec::new();
-        for g in self.mdf.channel_groups() {
-            for ch in g.channels() {
-                if let Some(n) = ch.name()? {
-                    names.push(n);
-                }
-            }
+        Ok(self.names.clone())
+    }
+
+    /// A group's channel metadata as one table of columns.
+    ///
+    /// Unlike :py:attr:`GroupInfo.channels`, no :class:`ChannelInfo` object is
+    /// created per channel: names and units come back as two lists and the
+    /// numeric fields as numpy arrays, one entry per channel in record order.
+    ///
+    /// Parameters
+    /// ----------
+    /// group : str
+    ///
+    /// Returns
+    /// -------
+    /// dict
+    ///     ``{"name": list[Optional[str]], "unit": list[Optional[str]],
+    ///     "data_type": uint8 array, "bit_count": uint32 array}``; the
+    ///     ``data_type`` codes are :py:attr:`DataType.value`.
+    ///
+    /// Raises
+    /// ------
+    /// MdfException
+    ///     If no group is called ``group``.
+    fn channel_table(&self, py: Python, group: &str) -> PyResult<PyObject> {
+        let g = self.mdf.group(group).ok_or_else(|| {
+            MdfException::new_err(format!("Channel group '{}' not found", group))
+        })?;
+        let channels = g.channels();
+        let n = channels.len();
+        let mut names = Vec::with_capacity(n);
+        let mut units = Vec::with_capacity(n);
+        let mut data_types = Vec::with_capacity(n);
+        let mut bit_counts = Vec::with_capacity(n);
+        for ch in &channels {
+            let block = ch.block();
+            names.push(ch.name()?);
+            units.push(ch.unit()?);
+            data_types.push(block.data_type.to_u8());
+            bit_counts.push(block.bit_count);
         }
-        Ok(names)
+        let table = PyDict::new_bound(py);
+        table.set_item("name", names)?;
+        table.set_item("unit", units)?;
+        table.set_item("data_type", PyArray1::from_vec_bound(py, data_types))?;
+        table.set_item("bit_count", PyArray1::from_vec_bound(py, bit_counts))?;
+        Ok(table.into())
     }
 
     /// Read a channel as a ``pandas.Series`` of values indexed by timestamps.
@@ -654,21 +929,25 @@ impl PyMDF {
     fn read(&self, py: Python, name: &str, group: Option<&str>) -> PyResult<PyObject> {
         let pd = check_pandas_available(py)?;
         let start_time_ns = self.mdf.start_time_ns();
-        let signal = match group {
-            Some(gn) => self
-                .mdf
-                .group(gn)
-                .ok_or_else(|| MdfException::new_err(format!("Channel group '{}' not found", gn)))?
-                .signal(name)?,
-            None => self.mdf.signal(name)?,
-        };
+        // Decoding is pure Rust over the memory map; let other Python threads
+        // run meanwhile.
+        let signal = py.allow_threads(|| -> PyResult<_> {
+            Ok(match group {
+                Some(gn) => self
+                    .mdf
+                    .group(gn)
+                    .ok_or_else(|| MdfException::new_err(format!("Channel group '{}' not found", gn)))?
+                    .signal(name)?,
+                None => self.mdf.signal(name)?,
+            })
+        })?;
         let signal = signal.ok_or_else(|| {
             MdfException::new_err(match group {
                 Some(gn) => format!("Channel '{}' not found in group '{}'", name, gn),
                 None => format!("Channel '{}' not found", name),
             })
         })?;
-        signal_to_series(py, &pd, &signal.name, &signal.timestamps, signal.values, start_time_ns)
+        signal_to_series(py, &pd, &signal.name, signal.timestamps, signal.values, start_time_ns)
     }
 
     /// Read a numeric channel by name as a plain numpy ``float64`` array.
@@ -682,11 +961,179 @@ impl PyMDF {
     /// name : str
     /// group : Optional[str]
     fn values<'py>(&self, py: Python<'py>, name: &str, group: Option<&str>) -> PyResult<PyObject> {
-        let (g, idx) = self.find_group_channel(group, name)?;
-        let values = g.channels()[idx].values_as_f64()?;
+        let values = py.allow_threads(|| -> PyResult<Vec<f64>> {
+            let (g, idx) = self.find_group_channel(group, name)?;
+            Ok(g.channels()[idx].values_as_f64()?)
+        })?;
         Ok(PyArray1::from_vec_bound(py, values).into())
     }
 
+    /// Read several numeric channels in one call as ``{name: float64 array}``.
+    ///
+    /// The channels may come from different groups. Channels of one group are
+    /// decoded together in a single pass over its data blocks, and different
+    /// groups are decoded in parallel, all with the GIL released, instead of
+    /// one :py:meth:`values` call (and FFI round-trip) per channel.
+    ///
+    /// Parameters
+    /// ----------
+    /// names : list[str]
+    /// group : Optional[str]
+    ///     Resolve every name inside this group only.
+    ///
+    /// Raises
+    /// ------
+    /// MdfException
+    ///     If any channel is missing.
+    #[pyo3(signature = (names, group=None))]
+    fn values_many(&self, py: Python, names: Vec<String>, group: Option<&str>) -> PyResult<PyObject> {
+        let columns = py.allow_threads(|| -> PyResult<Vec<Vec<f64>>> {
+            // (group, channel indices, output slots) per group involved.
+            let mut units: Vec<(usize, Vec<usize>, Vec<usize>)> = Vec::new();
+            for (slot, name) in names.iter().enumerate() {
+                let (g, c) = self.locate(group, name)?;
+                match units.iter_mut().find(|(unit_group, _, _)| *unit_group == g) {
+                    Some((_, channels, slots)) => {
+                        channels.push(c);
+                        slots.push(slot);
+                    }
+                    None => units.push((g, vec![c], vec![slot])),
+                }
+            }
+
+            let groups = self.mdf.channel_groups();
+            let decode = |part: &[(usize, Vec<usize>, Vec<usize>)]| {
+                part.iter()
+                    .map(|(g, channels, _)| groups[*g].columns_as_f64_for(channels))
+                    .collect::<Result<Vec<_>, MdfError>>()
+            };
+            let workers = std::thread::available_parallelism()
+                .map(|n| n.get())
+                .unwrap_or(1)
+                .min(units.len());
+            let decoded: Vec<Vec<Vec<f64>>> = if workers <= 1 {
+                decode(&units)?
+            } else {
+                let per_worker = (units.len() + workers - 1) / workers;
+                std::thread::scope(|scope| {
+                    let handles: Vec<_> = units
+                        .chunks(per_worker)
+                        .map(|part| scope.spawn(move || decode(part)))
+                        .collect();
+                    let mut decoded = Vec::with_capacity(units.len());
+                    for handle in handles {
+                        decoded.extend(handle.join().expect("group decode worker panicked")?);
+                    }
+                    Ok::<_, MdfError>(decoded)
+                })?
+            };
+
+            let mut columns = vec![Vec::new(); names.len()];
+            for ((_, _, slots), group_columns) in units.iter().zip(decoded) {
+                for (&slot, column) in slots.iter().zip(group_columns) {
+                    columns[slot] = column;
+                }
+            }
+            Ok(columns)
+        })?;
+        let out = PyDict::new_bound(py);
+        for (name, values) in names.into_iter().zip(columns) {
+            out.set_item(name, PyArray1::from_vec_bound(py, values))?;
+        }
+        Ok(out.into())
+    }
+
+    /// Read several channels of one group as a ``pandas.DataFrame``.
+    ///
+    /// Each channel becomes a ``float64`` column (invalid / non-numeric samples
+    /// are ``NaN``) and the group's master/time channel is the index, as with
+    /// :py:meth:`read`. The channels are decoded with the GIL released, and
+    /// the frame is assembled in a single pandas call.
+    ///
+    /// Parameters
+    /// ----------
+    /// names : Optional[list[str]]
+    ///     Channel names (case-sensitive). All must live in the same group.
+    ///     Decoded in parallel. When omitted, every named channel of
+    ///     ``group`` except the master is read, in one pass over the group's
+    ///     data blocks.
+    /// group : Optional[str]
+    ///     Restrict the search to a single group by name. Required when
+    ///     ``names`` is omitted.
+    ///
+    /// Raises
+    /// ------
+    /// MdfException
+    ///     If a channel or the group is missing, the channels span several
+    ///     groups, neither argument is given, or pandas is not installed.
+    #[pyo3(signature = (names=None, group=None))]
+    fn dataframe(&self, py: Python, names: Option<Vec<String>>, group: Option<&str>) -> PyResult<PyObject> {
+        let pd = check_pandas_available(py)?;
+        let start_time_ns = self.mdf.start_time_ns();
+        let (names, columns, timestamps) = py.allow_threads(|| -> PyResult<_> {
+            let Some(names) = names else {
+                let gn = group.ok_or_else(|| {
+                    MdfException::new_err("dataframe() needs channel names or a group")
+                })?;
+                let g = self.mdf.group(gn).ok_or_else(|| {
+                    MdfException::new_err(format!("Channel group '{}' not found", gn))
+                })?;
+                let channels = g.channels();
+                let mut timestamps = Vec::new();
+                let (mut names, mut columns) = (Vec::new(), Vec::new());
+                for (ch, column) in channels.iter().zip(g.columns_as_f64()?) {
+                    if ch.block().channel_type == 2 {
+                        timestamps = column;
+                    } else if let Some(name) = ch.name()? {
+                        names.push(name);
+                        columns.push(column);
+                    }
+                }
+                return Ok((names, columns, timestamps));
+            };
+
+            let mut resolved: Option<crate::api::channel_group::ChannelGroup<'_>> = None;
+            let mut indices = Vec::with_capacity(names.len());
+            for name in &names {
+                let (g, idx) = self.find_group_channel(group, name)?;
+                match &resolved {
+                    Some(first) if !std::ptr::eq(first.raw_channel_group(), g.raw_channel_group()) => {
+                        return Err(MdfException::new_err(format!(
+                            "Channel '{}' is not in the same group as '{}'",
+                            name, names[0]
+                        )));
+                    }
+                    Some(_) => {}
+                    None => resolved = Some(g),
+                }
+                indices.push(idx);
+            }
+            let Some(g) = resolved else { return Ok((names, Vec::new(), Vec::new())) };
+
+            // The master is decoded alongside the requested channels.
+            let all = g.channels();
+            let master = all.iter().position(|ch| ch.block().channel_type == 2);
+            let mut wanted: Vec<_> = indices.iter().map(|&i| &all[i]).collect();
+            if let Some(mi) = master {
+                wanted.push(&all[mi]);
+            }
+            let mut columns = Self::decode_columns_f64(&wanted)?;
+            let timestamps = if master.is_some() { columns.pop().unwrap_or_default() } else { Vec::new() };
+            Ok((names, columns, timestamps))
+        })?;
+
+        let data = PyDict::new_bound(py);
+        for (name, column) in names.iter().zip(columns) {
+            data.set_item(name, PyArray1::from_vec_bound(py, column))?;
+        }
+        let index = time_index(py, &pd, timestamps, start_time_ns)?;
+        let kwargs = PyDict::new_bound(py);
+        if !index.is_none(py) {
+            kwargs.set_item("index", index)?;
+        }
+        pd.getattr(py, "DataFrame")?.call_bound(py, (data,), Some(&kwargs))
+    }
+
     /// ``mdf["Speed"]`` — shorthand for :py:meth:`read` (timestamp-indexed Series).
     ///
     /// Pass a ``(name, group)`` tuple to disambiguate a channel name shared by
@@ -700,10 +1147,186 @@ impl PyMDF {
     ///
     /// Useful for debugging or analysing on-disk structure: offset, size,
     /// type, link targets and unreferenced gaps for each MDF block.
-    fn file_layout(&self) -> PyResult<PyFileLayout> {
-        let layout = self.mdf.file_layout()?;
+    fn file_layout(&self, py: Python) -> PyResult<PyFileLayout> {
+        let layout = py.allow_threads(|| self.mdf.file_layout())?;
         Ok(PyFileLayout { inner: layout })
     }
+
+    /// Build an :class:`MdfIndex` from this already-open file.
+    ///
+    /// Nothing is re-opened or re-parsed: the index is built from the parsed
+    /// metadata and reads samples through this file's memory map, so
+    /// :py:meth:`MdfIndex.read` / :py:meth:`MdfIndex.values` need no path.
+    /// For remote files use :py:meth:`MdfIndex.from_url` instead.
+    fn index(&self, py: Python) -> PyResult<PyMdfIndex> {
+        let index = py.allow_threads(|| MdfIndex::from_mdf(&self.mdf, self.path.clone()))?;
+        Ok(PyMdfIndex::wrap(index))
+    }
+
+    /// Stream a numeric channel as successive ``float64`` numpy chunks.
+    ///
+    /// Same as :py:meth:`MdfIndex.iter_values`: each step decodes the next
+    /// ``chunk_size`` records from this file's memory map with the GIL
+    /// released, so reductions over a long channel hold one chunk at a time
+    /// instead of the whole column. Concatenated, the chunks equal
+    /// :py:meth:`values`.
+    ///
+    /// Parameters
+    /// ----------
+    /// name : str
+    /// group : Optional[str]
+    /// chunk_size : Optional[int]
+    ///     Records per chunk (default 65536); the last chunk may be shorter.
+    ///
+    /// Raises
+    /// ------
+    /// MdfException
+    ///     If the channel is missing or ``chunk_size`` is zero.
+    fn iter_values(
+        &self,
+        py: Python,
+        name: &str,
+        group: Option<&str>,
+        chunk_size: Option<usize>,
+    ) -> PyResult<PyValueChunkIterator> {
+        let index = match self.chunk_index.get() {
+            Some(index) => index,
+            None => {
+                let index = py.allow_threads(|| MdfIndex::from_mdf(&self.mdf, self.path.clone()))?;
+                let index = Py::new(py, PyMdfIndex::wrap(index))?;
+                self.chunk_index.get_or_init(|| index)
+            }
+        };
+        PyValueChunkIterator::start(py, index.clone_ref(py), name, group, chunk_size)
+    }
+
+    /// Iterate over every channel as ``(group, channel, values)`` tuples.
+    ///
+    /// ``values`` is a numpy ``float64`` array as from :py:meth:`values`.
+    /// Groups are decoded one at a time as the iteration reaches them, and
+    /// each group's data blocks are read once for all of its channels rather
+    /// than once per channel — the way to visit a whole file.
+    fn iter_channels(slf: PyRef<'_, Self>) -> PyChannelIterator {
+        PyChannelIterator { mdf: slf.into(), next_group: 0, pending: Vec::new().into_iter() }
+    }
+}
+
+/// Iterator over the channels of an :class:`Mdf`, returned by
+/// :py:meth:`Mdf.iter_channels`.
+///
+/// Yields ``(group, channel, values)`` tuples in file order; ``group`` /
+/// ``channel`` are ``None`` when unnamed.
+#[gen_stub_pyclass]
+#[pyclass(name = "ChannelIterator")]
+pub struct PyChannelIterator {
+    mdf: Py<PyMDF>,
+    /// Position of the next group to decode.
+    next_group: usize,
+    /// Decoded channels of the current group not yet handed out.
+    pending: std::vec::IntoIter<(Option<String>, Option<String>, Vec<f64>)>,
+}
+
+#[gen_stub_pymethods]
+#[pymethods]
+impl PyChannelIterator {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(&mut self, py: Python) -> PyResult<Option<(Option<String>, Option<String>, PyObject)>> {
+        loop {
+            if let Some((group, name, values)) = self.pending.next() {
+                return Ok(Some((group, name, PyArray1::from_vec_bound(py, values).into())));
+            }
+            let reader = self.mdf.borrow(py);
+            let mdf: &PyMDF = &reader;
+            let g = self.next_group;
+            // One pass over the group's data blocks decodes all its channels.
+            let decoded = py.allow_threads(|| -> Result<Option<Vec<_>>, MdfError> {
+                let Some(group) = mdf.mdf.channel_groups().into_iter().nth(g) else {
+                    return Ok(None);
+                };
+                let group_name = group.name()?;
+                let columns = group.columns_as_f64()?;
+                group
+                    .channels()
+                    .iter()
+                    .zip(columns)
+                    .map(|(ch, values)| Ok((group_name.clone(), ch.name()?, values)))
+                    .collect::<Result<Vec<_>, MdfError>>()
+                    .map(Some)
+            })?;
+            drop(reader);
+            match decoded {
+                Some(channels) => {
+                    self.next_group += 1;
+                    self.pending = channels.into_iter();
+                }
+                None => return Ok(None),
+            }
+        }
+    }
+}
+
+/// Reusable, fixed-size staging area for one record of a channel group.
+///
+/// Allocate it once with the group's channel count, overwrite slots in place
+/// with the typed setters, and hand it to :py:meth:`MdfWriter.write_record_buf`
+/// for every record. Unlike :py:meth:`MdfWriter.write_record`, no Python list
+/// or ``DecodedValue`` objects are created per record.
+///
+/// Example
+/// -------
+/// >>> buf = mf4_rs.RecordBuffer(2)
+/// >>> for i in range(100):
+/// ...     buf.set_f64(0, i * 0.01)
+/// ...     buf.set_u64(1, i)
+/// ...     w.write_record_buf(cg, buf)
+#[gen_stub_pyclass]
+#[pyclass(name = "RecordBuffer")]
+pub struct PyRecordBuffer {
+    values: Vec<DecodedValue>,
+}
+
+impl PyRecordBuffer {
+    fn slot(&mut self, index: usize) -> PyResult<&mut DecodedValue> {
+        let len = self.values.len();
+        self.values.get_mut(index).ok_or_else(|| {
+            MdfException::new_err(format!("slot {} out of range for a {}-channel record", index, len))
+        })
+    }
+}
+
+#[gen_stub_pymethods]
+#[pymethods]
+impl PyRecordBuffer {
+    /// Create a buffer with ``channel_count`` slots, all initialised to ``0.0``.
+    #[new]
+    fn new(channel_count: usize) -> Self {
+        PyRecordBuffer { values: vec![DecodedValue::Float(0.0); channel_count] }
+    }
+
+    /// Store a float in slot ``index`` (float32 / float64 channels).
+    fn set_f64(&mut self, index: usize, value: f64) -> PyResult<()> {
+        *self.slot(index)? = DecodedValue::Float(value);
+        Ok(())
+    }
+
+    /// Store an unsigned integer in slot ``index``.
+    fn set_u64(&mut self, index: usize, value: u64) -> PyResult<()> {
+        *self.slot(index)? = DecodedValue::UnsignedInteger(value);
+        Ok(())
+    }
+
+    /// Store a signed integer in slot ``index``.
+    fn set_i64(&mut self, index: usize, value: i64) -> PyResult<()> {
+        *self.slot(index)? = DecodedValue::SignedInteger(value);
+        Ok(())
+    }
+
+    fn __len__(&self) -> usize {
+        self.values.len()
+    }
 }
 
 /// Streaming writer for MDF 4 files.
@@ -791,14 +1414,21 @@ impl PyMdfWriter {
     /// ----------
     /// path : str
     ///     Output filesystem path.
+    /// buffer_size : Optional[int]
+    ///     Size in bytes of the write buffer in front of the file (default
+    ///     1 MiB). Record writes are copied into it and reach the OS in
+    ///     buffer-sized chunks; raise it for very large recordings.
     ///
     /// Raises
     /// ------
     /// MdfException
     ///     If the file cannot be created.
     #[new]
-    fn new(path: &str) -> PyResult<Self> {
-        let writer = MdfWriter::new(path)?;
+    fn new(path: &str, buffer_size: Option<usize>) -> PyResult<Self> {
+        let writer = match buffer_size {
+            Some(capacity) => MdfWriter::new_with_capacity(path, capacity)?,
+            None => MdfWriter::new(path)?,
+        };
         Ok(PyMdfWriter {
             writer: Some(writer),
             channel_groups: HashMap::new(),
@@ -958,61 +1588,285 @@ impl PyMdfWriter {
     ///
     /// Parameters
     /// ----------
-    /// channel_id : str
-    ///     ID returned by one of the ``add_*_channel`` methods.
-    fn set_time_channel(&mut self, channel_id: &str) -> PyResult<()> {
+    /// channel_id : str
+    ///     ID returned by one of the ``add_*_channel`` methods.
+    fn set_time_channel(&mut self, channel_id: &str) -> PyResult<()> {
+        if let Some(ref mut writer) = self.writer {
+            let ch_id = self.channels.get(channel_id)
+                .ok_or_else(|| MdfException::new_err("Channel not found"))?;
+            writer.set_time_channel(ch_id)?;
+            Ok(())
+        } else {
+            Err(MdfException::new_err("Writer has been finalized"))
+        }
+    }
+    
+    /// Attach a value-to-text conversion (``##CC`` type 7) to a channel.
+    ///
+    /// Raw values listed in ``mapping`` display as their text; any other
+    /// value displays as ``default``.
+    ///
+    /// Parameters
+    /// ----------
+    /// channel_id : str
+    ///     ID returned by one of the ``add_*_channel`` methods.
+    /// mapping : Sequence[tuple[int, str]]
+    ///     e.g. ``[(0, "OK"), (1, "WARN")]``.
+    /// default : str
+    ///     Text for values not in ``mapping``.
+    fn add_value_to_text_conversion(
+        &mut self,
+        channel_id: &str,
+        mapping: Vec<(i64, String)>,
+        default: &str,
+    ) -> PyResult<()> {
+        if let Some(ref mut writer) = self.writer {
+            let ch_id = self.channels.get(channel_id)
+                .ok_or_else(|| MdfException::new_err("Channel not found"))?;
+            let mapping: Vec<(i64, &str)> = mapping.iter().map(|(v, t)| (*v, t.as_str())).collect();
+            writer.add_value_to_text_conversion(&mapping, default, Some(ch_id.as_str()))?;
+            Ok(())
+        } else {
+            Err(MdfException::new_err("Writer has been finalized"))
+        }
+    }
+
+    /// Open a fresh ``##DT`` data block for a channel group.
+    ///
+    /// Must be called once after all channels have been added, before any
+    /// :py:meth:`write_record` / :py:meth:`write_columns_f64` /
+    /// :py:meth:`write_columns` for that group. The writer will
+    /// automatically split into multiple ``##DT`` fragments at the 4 MB
+    /// boundary, joined by a ``##DL`` block when you call
+    /// :py:meth:`finish_data_block`.
+    fn start_data_block(&mut self, group_id: &str) -> PyResult<()> {
+        if let Some(ref mut writer) = self.writer {
+            let cg_id = self.channel_groups.get(group_id)
+                .ok_or_else(|| MdfException::new_err("Channel group not found"))?;
+            writer.start_data_block_for_cg(cg_id, 0)?;
+            Ok(())
+        } else {
+            Err(MdfException::new_err("Writer has been finalized"))
+        }
+    }
+    
+    /// Append a single record (one sample for each channel in the group).
+    ///
+    /// ``values`` must contain exactly one entry per channel, in the same
+    /// order channels were added — typically the master channel first, then
+    /// data channels. Each value is encoded according to its channel's data
+    /// type (the variant of :class:`DecodedValue` is *not* re-checked, so
+    /// passing the wrong variant will produce nonsense bytes).
+    ///
+    /// This call has Python-level overhead per value; for bulk numeric data,
+    /// prefer :py:meth:`write_columns_f64` or :py:meth:`write_columns`.
+    fn write_record(&mut self, group_id: &str, values: Vec<PyDecodedValue>) -> PyResult<()> {
+        if let Some(ref mut writer) = self.writer {
+            let cg_id = self.channel_groups.get(group_id)
+                .ok_or_else(|| MdfException::new_err("Channel group not found"))?;
+            
+            let rust_values: Vec<DecodedValue> = values.into_iter().map(DecodedValue::from).collect();
+            writer.write_record(cg_id, &rust_values)?;
+            Ok(())
+        } else {
+            Err(MdfException::new_err("Writer has been finalized"))
+        }
+    }
+    
+    /// Append one record from a reusable :class:`RecordBuffer`.
+    ///
+    /// Same encoding as :py:meth:`write_record`, but the values come from the
+    /// buffer's slots, so a tight Python loop only updates numbers in place.
+    ///
+    /// Parameters
+    /// ----------
+    /// group_id : str
+    /// buffer : RecordBuffer
+    ///     One slot per channel, in channel order.
+    fn write_record_buf(&mut self, group_id: &str, buffer: PyRef<'_, PyRecordBuffer>) -> PyResult<()> {
+        if let Some(ref mut writer) = self.writer {
+            let cg_id = self.channel_groups.get(group_id)
+                .ok_or_else(|| MdfException::new_err("Channel group not found"))?;
+            writer.write_record(cg_id, &buffer.values)?;
+            Ok(())
+        } else {
+            Err(MdfException::new_err("Writer has been finalized"))
+        }
+    }
+
+    /// Append one record of plain floats, one per channel in channel order.
+    ///
+    /// The values are read straight from the Python floats, so a row costs
+    /// no :class:`DecodedValue` allocations. Every channel of the group must
+    /// be a float channel; float32 channels are narrowed automatically.
+    ///
+    /// Parameters
+    /// ----------
+    /// group_id : str
+    /// values : Sequence[float]
+    ///     e.g. ``(t, speed, temperature)``.
+    ///
+    /// Raises
+    /// ------
+    /// MdfException
+    ///     If the value count differs from the channel count or a channel is
+    ///     not a float type.
+    fn write_record_f64(&mut self, group_id: &str, values: Vec<f64>) -> PyResult<()> {
+        if let Some(ref mut writer) = self.writer {
+            let cg_id = self.channel_groups.get(group_id)
+                .ok_or_else(|| MdfException::new_err("Channel group not found"))?;
+            writer.write_records_f64(cg_id, std::iter::once(values.as_slice()))?;
+            Ok(())
+        } else {
+            Err(MdfException::new_err("Writer has been finalized"))
+        }
+    }
+
+    /// Append records of plain floats pulled from any iterable.
+    ///
+    /// Each item is one record, a sequence with one float per channel in
+    /// channel order — e.g. ``map(make_row, range(n))`` or a generator. The
+    /// loop over the iterable runs in Rust and rows are handed to the writer
+    /// in batches, so only the row construction itself runs in Python. Every
+    /// channel of the group must be a float channel; float32 channels are
+    /// narrowed automatically.
+    ///
+    /// Parameters
+    /// ----------
+    /// group_id : str
+    /// records : Iterable[Sequence[float]]
+    ///
+    /// Raises
+    /// ------
+    /// MdfException
+    ///     If the rows differ in length, a row's length differs from the
+    ///     channel count, or a channel is not a float type.
+    fn write_records_iter(&mut self, group_id: &str, records: &Bound<'_, PyAny>) -> PyResult<()> {
+        // Records collected before each hand-off to the writer.
+        const BATCH_RECORDS: usize = 8192;
+        if let Some(ref mut writer) = self.writer {
+            let cg_id = self.channel_groups.get(group_id)
+                .ok_or_else(|| MdfException::new_err("Channel group not found"))?;
+            let mut width = None;
+            let mut batch: Vec<f64> = Vec::new();
+            for record in records.iter()? {
+                let row: Vec<f64> = record?.extract()?;
+                let width = *width.get_or_insert(row.len());
+                if row.len() != width || width == 0 {
+                    return Err(MdfException::new_err("records must have one value per channel"));
+                }
+                batch.extend_from_slice(&row);
+                if batch.len() >= width * BATCH_RECORDS {
+                    writer.write_records_f64(cg_id, batch.chunks_exact(width))?;
+                    batch.clear();
+                }
+            }
+            if let Some(width) = width {
+                writer.write_records_f64(cg_id, batch.chunks_exact(width))?;
+            }
+            Ok(())
+        } else {
+            Err(MdfException::new_err("Writer has been finalized"))
+        }
+    }
+
+    /// Append a batch of records from a 2-D numpy ``float64`` array.
+    ///
+    /// Each row is one record with one column per channel, in channel order,
+    /// so building a row no longer allocates a :class:`DecodedValue` per
+    /// field: the rows are encoded straight from the array's memory. Every
+    /// channel of the group must be a float channel; float32 channels are
+    /// narrowed automatically.
+    ///
+    /// Parameters
+    /// ----------
+    /// group_id : str
+    /// records : numpy.ndarray
+    ///     C-contiguous ``float64`` array of shape ``(n_records, n_channels)``.
+    ///
+    /// Raises
+    /// ------
+    /// MdfException
+    ///     If the array is not C-contiguous ``float64``, its column count
+    ///     differs from the channel count, or a channel is not a float type.
+    fn write_records_f64(&mut self, group_id: &str, records: &Bound<'_, PyAny>) -> PyResult<()> {
         if let Some(ref mut writer) = self.writer {
-            let ch_id = self.channels.get(channel_id)
-                .ok_or_else(|| MdfException::new_err("Channel not found"))?;
-            writer.set_time_channel(ch_id)?;
+            let cg_id = self.channel_groups.get(group_id)
+                .ok_or_else(|| MdfException::new_err("Channel group not found"))?;
+            let array = records.extract::<PyReadonlyArray2<f64>>()?;
+            let (rows, width) = (array.shape()[0], array.shape()[1]);
+            if rows == 0 {
+                return Ok(());
+            }
+            if width == 0 {
+                return Err(MdfException::new_err("records must have one column per channel"));
+            }
+            let data = array.as_slice()
+                .map_err(|e| MdfException::new_err(format!("Array not contiguous: {}", e)))?;
+            writer.write_records_f64(cg_id, data.chunks_exact(width))?;
             Ok(())
         } else {
             Err(MdfException::new_err("Writer has been finalized"))
         }
     }
-    
-    /// Open a fresh ``##DT`` data block for a channel group.
+
+    /// Size in bytes of one record of the group's open data block.
     ///
-    /// Must be called once after all channels have been added, before any
-    /// :py:meth:`write_record` / :py:meth:`write_columns_f64` /
-    /// :py:meth:`write_columns` for that group. The writer will
-    /// automatically split into multiple ``##DT`` fragments at the 4 MB
-    /// boundary, joined by a ``##DL`` block when you call
+    /// This is the stride to use when packing records for
+    /// :py:meth:`write_raw_records` (record id + data + invalidation bytes).
+    /// Only valid between :py:meth:`start_data_block` and
     /// :py:meth:`finish_data_block`.
-    fn start_data_block(&mut self, group_id: &str) -> PyResult<()> {
-        if let Some(ref mut writer) = self.writer {
+    ///
+    /// Parameters
+    /// ----------
+    /// group_id : str
+    fn record_size(&self, group_id: &str) -> PyResult<usize> {
+        if let Some(ref writer) = self.writer {
             let cg_id = self.channel_groups.get(group_id)
                 .ok_or_else(|| MdfException::new_err("Channel group not found"))?;
-            writer.start_data_block_for_cg(cg_id, 0)?;
-            Ok(())
+            writer.record_size(cg_id)
+                .ok_or_else(|| MdfException::new_err("No open data block for this channel group"))
         } else {
             Err(MdfException::new_err("Writer has been finalized"))
         }
     }
-    
-    /// Append a single record (one sample for each channel in the group).
+
+    /// Append a batch of records that are already encoded as raw bytes.
     ///
-    /// ``values`` must contain exactly one entry per channel, in the same
-    /// order channels were added — typically the master channel first, then
-    /// data channels. Each value is encoded according to its channel's data
-    /// type (the variant of :class:`DecodedValue` is *not* re-checked, so
-    /// passing the wrong variant will produce nonsense bytes).
+    /// ``data`` holds whole records back to back, each :py:meth:`record_size`
+    /// bytes long, e.g. a ``bytearray`` filled with ``struct.pack_into``. The
+    /// bytes are copied to the file without re-encoding, so one call writes
+    /// the whole batch instead of crossing into Rust once per record.
     ///
-    /// This call has Python-level overhead per value; for bulk numeric data,
-    /// prefer :py:meth:`write_columns_f64` or :py:meth:`write_columns`.
-    fn write_record(&mut self, group_id: &str, values: Vec<PyDecodedValue>) -> PyResult<()> {
+    /// Parameters
+    /// ----------
+    /// group_id : str
+    /// data : bytes | bytearray
+    ///
+    /// Raises
+    /// ------
+    /// MdfException
+    ///     If ``data`` is not ``bytes``/``bytearray`` or its length is not a
+    ///     multiple of the record size.
+    fn write_raw_records(&mut self, group_id: &str, data: &Bound<'_, PyAny>) -> PyResult<()> {
         if let Some(ref mut writer) = self.writer {
             let cg_id = self.channel_groups.get(group_id)
                 .ok_or_else(|| MdfException::new_err("Channel group not found"))?;
-            
-            let rust_values: Vec<DecodedValue> = values.into_iter().map(DecodedValue::from).collect();
-            writer.write_record(cg_id, &rust_values)?;
+            if let Ok(bytes) = data.downcast::<PyBytes>() {
+                writer.write_raw_records(cg_id, bytes.as_bytes())?;
+            } else if let Ok(bytes) = data.downcast::<PyByteArray>() {
+                // SAFETY: no Python code runs while the slice is borrowed, so
+                // the bytearray cannot be resized underneath it.
+                writer.write_raw_records(cg_id, unsafe { bytes.as_bytes() })?;
+            } else {
+                return Err(MdfException::new_err("data must be bytes or bytearray"));
+            }
             Ok(())
         } else {
             Err(MdfException::new_err("Writer has been finalized"))
         }
     }
-    
+
     /// Close the open ``##DT`` block for a channel group.
     ///
     /// If the group's data exceeded the 4 MB block size and was split
@@ -1081,22 +1935,33 @@ impl PyMdfWriter {
     /// group_id : str
     /// columns : list[numpy.ndarray]
     ///     One contiguous 1-D array per channel, all of identical length.
-    /// dtypes : list[str]
+    ///     A constant channel may be passed as a single-element array or a
+    ///     ``numpy.broadcast_to`` view; its value is written into every
+    ///     record without materializing the full column.
+    /// dtypes : Optional[list[str]]
     ///     One entry per column, matching ``columns``. Allowed values:
-    ///     ``"f64"``, ``"f32"``, ``"u64"``, ``"i64"``.
+    ///     ``"f64"``, ``"f32"``, ``"u64"``, ``"i64"``, ``"u32"``, ``"i32"``.
+    ///     When omitted, each column's type is taken from its numpy dtype
+    ///     (``float64``, ``float32``, ``uint64``, ``int64``, ``uint32`` or
+    ///     ``int32``). 32-bit integer arrays fill integer channels directly,
+    ///     with no ``astype`` copy.
     ///
     /// Raises
     /// ------
     /// MdfException
     ///     If the dtype string is not one of the supported values, the
-    ///     numpy array's element type doesn't match the dtype string, the
-    ///     two list lengths differ, or any array is non-contiguous.
-    fn write_columns(&mut self, _py: Python<'_>, group_id: &str, columns: Vec<Bound<'_, PyAny>>, dtypes: Vec<String>) -> PyResult<()> {
-        if columns.len() != dtypes.len() {
-            return Err(MdfException::new_err(format!(
-                "columns length ({}) must match dtypes length ({})",
-                columns.len(), dtypes.len()
-            )));
+    ///     numpy array's element type doesn't match the dtype string (or,
+    ///     without ``dtypes``, is not one of the six supported types), the
+    ///     two list lengths differ, or any array is non-contiguous (other
+    ///     than a zero-stride broadcast view).
+    fn write_columns(&mut self, _py: Python<'_>, group_id: &str, columns: Vec<Bound<'_, PyAny>>, dtypes: Option<Vec<String>>) -> PyResult<()> {
+        if let Some(dtypes) = &dtypes {
+            if columns.len() != dtypes.len() {
+                return Err(MdfException::new_err(format!(
+                    "columns length ({}) must match dtypes length ({})",
+                    columns.len(), dtypes.len()
+                )));
+            }
         }
 
         if let Some(ref mut writer) = self.writer {
@@ -1111,34 +1976,43 @@ impl PyMdfWriter {
                 F32(PyReadonlyArray1<'py, f32>),
                 U64(PyReadonlyArray1<'py, u64>),
                 I64(PyReadonlyArray1<'py, i64>),
+                U32(PyReadonlyArray1<'py, u32>),
+                I32(PyReadonlyArray1<'py, i32>),
             }
 
-            let owned: Vec<OwnedArray<'_>> = columns.iter().zip(dtypes.iter())
-                .map(|(col, dtype)| match dtype.as_str() {
-                    "f64" => col.extract::<PyReadonlyArray1<f64>>().map(OwnedArray::F64),
-                    "f32" => col.extract::<PyReadonlyArray1<f32>>().map(OwnedArray::F32),
-                    "u64" => col.extract::<PyReadonlyArray1<u64>>().map(OwnedArray::U64),
-                    "i64" => col.extract::<PyReadonlyArray1<i64>>().map(OwnedArray::I64),
-                    other => Err(MdfException::new_err(format!(
-                        "Unknown dtype '{}'; expected one of: f64, f32, u64, i64", other
+            let owned: Vec<OwnedArray<'_>> = columns.iter().enumerate()
+                .map(|(i, col)| match dtypes.as_ref().map(|d| d[i].as_str()) {
+                    Some("f64") => col.extract::<PyReadonlyArray1<f64>>().map(OwnedArray::F64),
+                    Some("f32") => col.extract::<PyReadonlyArray1<f32>>().map(OwnedArray::F32),
+                    Some("u64") => col.extract::<PyReadonlyArray1<u64>>().map(OwnedArray::U64),
+                    Some("i64") => col.extract::<PyReadonlyArray1<i64>>().map(OwnedArray::I64),
+                    Some("u32") => col.extract::<PyReadonlyArray1<u32>>().map(OwnedArray::U32),
+                    Some("i32") => col.extract::<PyReadonlyArray1<i32>>().map(OwnedArray::I32),
+                    Some(other) => Err(MdfException::new_err(format!(
+                        "Unknown dtype '{}'; expected one of: f64, f32, u64, i64, u32, i32", other
                     ))),
+                    // No dtype given: the array's own element type decides.
+                    None => col.extract::<PyReadonlyArray1<f64>>().map(OwnedArray::F64)
+                        .or_else(|_| col.extract::<PyReadonlyArray1<f32>>().map(OwnedArray::F32))
+                        .or_else(|_| col.extract::<PyReadonlyArray1<u64>>().map(OwnedArray::U64))
+                        .or_else(|_| col.extract::<PyReadonlyArray1<i64>>().map(OwnedArray::I64))
+                        .or_else(|_| col.extract::<PyReadonlyArray1<u32>>().map(OwnedArray::U32))
+                        .or_else(|_| col.extract::<PyReadonlyArray1<i32>>().map(OwnedArray::I32))
+                        .map_err(|_| MdfException::new_err(format!(
+                            "column {} must be a 1-D float64, float32, uint64, int64, uint32 or int32 array; \
+                             pass dtypes to name its type explicitly", i
+                        ))),
                 })
                 .collect::<PyResult<Vec<_>>>()?;
 
             let column_data: Vec<ColumnData<'_>> = owned.iter()
                 .map(|arr| match arr {
-                    OwnedArray::F64(a) => a.as_slice()
-                        .map(ColumnData::F64)
-                        .map_err(|e| MdfException::new_err(format!("Array not contiguous: {}", e))),
-                    OwnedArray::F32(a) => a.as_slice()
-                        .map(ColumnData::F32)
-                        .map_err(|e| MdfException::new_err(format!("Array not contiguous: {}", e))),
-                    OwnedArray::U64(a) => a.as_slice()
-                        .map(ColumnData::U64)
-                        .map_err(|e| MdfException::new_err(format!("Array not contiguous: {}", e))),
-                    OwnedArray::I64(a) => a.as_slice()
-                        .map(ColumnData::I64)
-                        .map_err(|e| MdfException::new_err(format!("Array not contiguous: {}", e))),
+                    OwnedArray::F64(a) => column_slice(a).map(ColumnData::F64),
+                    OwnedArray::F32(a) => column_slice(a).map(ColumnData::F32),
+                    OwnedArray::U64(a) => column_slice(a).map(ColumnData::U64),
+                    OwnedArray::I64(a) => column_slice(a).map(ColumnData::I64),
+                    OwnedArray::U32(a) => column_slice(a).map(ColumnData::U32),
+                    OwnedArray::I32(a) => column_slice(a).map(ColumnData::I32),
                 })
                 .collect::<PyResult<Vec<_>>>()?;
 
@@ -1188,6 +2062,19 @@ impl PyMdfWriter {
 #[pyclass(name = "MdfIndex")]
 pub struct PyMdfIndex {
     index: MdfIndex,
+    /// First `(group, channel)` position of every channel name, built once so
+    /// name-based reads don't rescan every group on each call.
+    by_name: HashMap<String, (usize, usize)>,
+    /// Position of the first group carrying each group name.
+    by_group: HashMap<String, usize>,
+    /// Per group, the first channel index carrying each channel name, so
+    /// group-qualified lookups are a hash hit rather than a channel scan.
+    in_group: Vec<HashMap<String, usize>>,
+    /// Whole-channel byte ranges already computed, keyed by `(group, channel)`,
+    /// so repeated `byte_ranges` / `byte_summary` calls share one plan. Holds
+    /// at most `RANGES_MEMO_MAX` channels and is emptied whenever the source
+    /// changes.
+    ranges: std::sync::Mutex<HashMap<(usize, usize), std::sync::Arc<Vec<(u64, u64)>>>>,
 }
 
 #[gen_stub_pymethods]
@@ -1202,9 +2089,22 @@ impl PyMdfIndex {
     /// ----------
     /// path : str
     ///     Path to a ``.mf4`` file.
+    /// mapped : Optional[bool]
+    ///     Keep the memory map the file was parsed through as the index's
+    ///     source, as :py:meth:`attach_file` would, so later reads slice that
+    ///     one map instead of re-opening the file on every call. Off by
+    ///     default: a plain path source holds no mapping between reads.
     #[staticmethod]
-    fn from_file(path: &str) -> PyResult<Self> {
-        Ok(PyMdfIndex { index: MdfIndex::from_file(path)? })
+    #[pyo3(signature = (path, mapped=None))]
+    fn from_file(py: Python, path: &str, mapped: Option<bool>) -> PyResult<Self> {
+        let index = py.allow_threads(|| {
+            if mapped.unwrap_or(false) {
+                MdfIndex::from_mdf(&MDF::from_file(path)?, path)
+            } else {
+                MdfIndex::from_file(path)
+            }
+        })?;
+        Ok(PyMdfIndex::wrap(index))
     }
 
     /// Load a previously saved JSON index (companion to :py:meth:`save`).
@@ -1212,8 +2112,9 @@ impl PyMdfIndex {
     /// The original MDF file is only needed later, when you actually read
     /// values via :py:meth:`open`.
     #[staticmethod]
-    fn load(path: &str) -> PyResult<Self> {
-        Ok(PyMdfIndex { index: MdfIndex::load_from_file(path)? })
+    fn load(py: Python, path: &str) -> PyResult<Self> {
+        let index = py.allow_threads(|| MdfIndex::load_from_file(path))?;
+        Ok(PyMdfIndex::wrap(index))
     }
 
     /// Build an index from an MDF file served over HTTP / S3 using range
@@ -1238,12 +2139,12 @@ impl PyMdfIndex {
         let index = py.allow_threads(move || -> Result<MdfIndex, MdfError> {
             MdfIndex::from_url_with_chunk_size(&url, chunk)
         })?;
-        Ok(PyMdfIndex { index })
+        Ok(PyMdfIndex::wrap(index))
     }
 
     /// Serialize the index to JSON at ``path`` (dependency-free).
-    fn save(&self, path: &str) -> PyResult<()> {
-        self.index.save_to_file(path)?;
+    fn save(&self, py: Python, path: &str) -> PyResult<()> {
+        py.allow_threads(|| self.index.save_to_file(path))?;
         Ok(())
     }
 
@@ -1258,12 +2159,14 @@ impl PyMdfIndex {
 
     /// Find a channel group by name (first match), or ``None``.
     fn group(&self, name: &str) -> Option<PyChannelGroupInfo> {
-        self.index.group(name).map(PyChannelGroupInfo::from_indexed)
+        let &g = self.by_group.get(name)?;
+        Some(PyChannelGroupInfo::from_indexed(&self.index.groups()[g]))
     }
 
     /// Find a channel by name across all groups (first match), or ``None``.
     fn channel(&self, name: &str) -> Option<PyChannelInfo> {
-        self.index.channel(name).map(PyChannelInfo::from_indexed)
+        let &(g, c) = self.by_name.get(name)?;
+        Some(PyChannelInfo::from_indexed(&self.index.groups()[g].channels[c]))
     }
 
     /// Names of every named channel across all groups (duplicates kept).
@@ -1272,15 +2175,30 @@ impl PyMdfIndex {
         self.index.channel_names().into_iter().map(String::from).collect()
     }
 
+    /// Total number of channels across all groups.
+    ///
+    /// Answered from the loaded index — cheaper than walking :py:attr:`groups`
+    /// or re-reading the saved JSON.
+    #[getter]
+    fn channel_count(&self) -> usize {
+        self.index.channel_count()
+    }
+
+    /// Total number of records across all groups.
+    #[getter]
+    fn record_count(&self) -> u64 {
+        self.index.record_count()
+    }
+
     /// Names of the groups that contain a channel called ``name``.
     ///
     /// Use this to disambiguate a channel name shared by several groups, then
     /// pass the chosen group to :py:meth:`read` / :py:meth:`values`.
     fn groups_with_channel(&self, name: &str) -> Vec<String> {
-        self.index
-            .find_channels(name)
-            .into_iter()
-            .filter_map(|(g, _)| self.index.groups().get(g).and_then(|grp| grp.name.clone()))
+        self.index.groups().iter()
+            .zip(&self.in_group)
+            .filter(|(_, channels)| channels.contains_key(name))
+            .filter_map(|(grp, _)| grp.name.clone())
             .collect()
     }
 
@@ -1294,21 +2212,147 @@ impl PyMdfIndex {
     /// name : str
     /// group : Optional[str]
     ///     Disambiguate by group when the name is not unique.
-    fn byte_ranges(&self, name: &str, group: Option<&str>) -> PyResult<Vec<(u64, u64)>> {
-        Ok(match group {
-            Some(g) => self.index.byte_ranges_in(g, name)?,
-            None => self.index.byte_ranges(name)?,
-        })
+    /// max_gap : Optional[int]
+    ///     Merge ranges that are at most this many bytes apart, trading a
+    ///     little over-fetch for fewer requests (e.g. ``4096`` for HTTP).
+    ///     ``None`` returns the exact per-block ranges.
+    fn byte_ranges(
+        &self,
+        py: Python,
+        name: &str,
+        group: Option<&str>,
+        max_gap: Option<u64>,
+    ) -> PyResult<Vec<(u64, u64)>> {
+        let (g, c) = self.resolve(name, group)?;
+        let ranges = py.allow_threads(|| -> Result<_, MdfError> {
+            let ranges = self.channel_ranges(g, c)?;
+            Ok(match max_gap {
+                Some(gap) => coalesce_byte_ranges(&ranges, gap),
+                None => ranges.to_vec(),
+            })
+        })?;
+        Ok(ranges)
+    }
+
+    /// :py:meth:`byte_ranges` as two numpy ``uint64`` arrays ``(offsets, lengths)``.
+    ///
+    /// Two arrays cross into Python instead of one tuple per range, and
+    /// aggregates such as ``lengths.sum()`` run in numpy rather than a
+    /// Python loop.
+    ///
+    /// Parameters
+    /// ----------
+    /// name : str
+    /// group : Optional[str]
+    /// max_gap : Optional[int]
+    ///     As in :py:meth:`byte_ranges`.
+    fn byte_range_arrays(
+        &self,
+        py: Python,
+        name: &str,
+        group: Option<&str>,
+        max_gap: Option<u64>,
+    ) -> PyResult<(PyObject, PyObject)> {
+        let (offsets, lengths): (Vec<u64>, Vec<u64>) =
+            self.byte_ranges(py, name, group, max_gap)?.into_iter().unzip();
+        Ok((
+            PyArray1::from_vec_bound(py, offsets).into(),
+            PyArray1::from_vec_bound(py, lengths).into(),
+        ))
     }
 
     /// Byte ranges covering a record window ``[start, start+count)``.
+    ///
+    /// ``max_gap`` merges nearby ranges as in :py:meth:`byte_ranges`.
     fn byte_ranges_for_records(
         &self,
+        py: Python,
         name: &str,
         start_record: u64,
         record_count: u64,
+        max_gap: Option<u64>,
     ) -> PyResult<Vec<(u64, u64)>> {
-        Ok(self.index.byte_ranges_for_records(name, start_record, record_count)?)
+        let (g, c) = self.resolve(name, None)?;
+        let ranges = py.allow_threads(|| -> Result<_, MdfError> {
+            let ranges = self.index.get_channel_byte_ranges_for_records(g, c, start_record, record_count)?;
+            Ok(match max_gap {
+                Some(gap) => coalesce_byte_ranges(&ranges, gap),
+                None => ranges,
+            })
+        })?;
+        Ok(ranges)
+    }
+
+    /// Byte ranges for a record window together with their total length.
+    ///
+    /// Same ranges as :py:meth:`byte_ranges_for_records`; the total is summed
+    /// on the Rust side so callers sizing a buffer or a request budget need
+    /// not walk the list again.
+    ///
+    /// Returns
+    /// -------
+    /// tuple[list[tuple[int, int]], int]
+    ///     ``(ranges, total_bytes)``.
+    fn byte_plan_for_records(
+        &self,
+        py: Python,
+        name: &str,
+        start_record: u64,
+        record_count: u64,
+        max_gap: Option<u64>,
+    ) -> PyResult<(Vec<(u64, u64)>, u64)> {
+        let ranges = self.byte_ranges_for_records(py, name, start_record, record_count, max_gap)?;
+        let total = ranges.iter().map(|&(_, len)| len).sum();
+        Ok((ranges, total))
+    }
+
+    /// Byte footprint of every channel in a group, in one call.
+    ///
+    /// Equivalent to calling :py:meth:`byte_ranges` per channel and summing,
+    /// without crossing into Rust once per channel.
+    ///
+    /// Parameters
+    /// ----------
+    /// group : str
+    ///     Name of the channel group.
+    /// max_gap : Optional[int]
+    ///     Count ranges after merging as in :py:meth:`byte_ranges`.
+    ///
+    /// Returns
+    /// -------
+    /// list[tuple[Optional[str], int, int]]
+    ///     ``(channel name, total bytes, range count)`` per channel, in
+    ///     channel order. VLSD channels, whose samples live outside the
+    ///     records, report ``(name, 0, 0)``.
+    fn byte_summary(
+        &self,
+        py: Python,
+        group: &str,
+        max_gap: Option<u64>,
+    ) -> PyResult<Vec<(Option<String>, u64, usize)>> {
+        let &g = self.by_group.get(group)
+            .ok_or_else(|| MdfException::new_err(format!("Channel group '{}' not found", group)))?;
+        let channels = &self.index.groups()[g].channels;
+        let summary = py.allow_threads(|| -> Result<_, MdfError> {
+            let mut summary = Vec::with_capacity(channels.len());
+            for (c, channel) in channels.iter().enumerate() {
+                if channel.is_vlsd() {
+                    summary.push((channel.name.clone(), 0, 0));
+                    continue;
+                }
+                let ranges = self.channel_ranges(g, c)?;
+                let (total, count) = match max_gap {
+                    Some(gap) => {
+                        let merged = coalesce_byte_ranges(&ranges, gap);
+                        (merged.iter().map(|&(_, len)| len).sum(), merged.len())
+                    }
+                    None => (ranges.iter().map(|&(_, len)| len).sum(), ranges.len()),
+                };
+                summary.push((channel.name.clone(), total, count));
+            }
+            Ok(summary)
+        })?;
+        Ok(summary)
     }
 
     /// Inspect the conversion attached to a channel (by name).
@@ -1317,9 +2361,7 @@ impl PyMdfIndex {
     /// describing it (``conversion_type``, ``values``, ``resolved_texts``,
     /// ``formula`` …).
     fn conversion_info(&self, name: &str) -> PyResult<Option<HashMap<String, PyObject>>> {
-        let (g, c) = self.index.locate(name).ok_or_else(|| {
-            MdfException::new_err(format!("Channel '{}' not found", name))
-        })?;
+        let (g, c) = self.resolve(name, None)?;
         let channel = &self.index.groups()[g].channels[c];
 
         if let Some(conversion) = &channel.conversion {
@@ -1353,6 +2395,35 @@ impl PyMdfIndex {
         self.index.file_size
     }
 
+    /// Headline figures for the index, straight from the in-memory structure.
+    ///
+    /// A cheap alternative to re-reading a saved JSON index just to report
+    /// on it. Keys: ``file_size``, ``group_count``, ``channel_count``,
+    /// ``record_count``, ``first_channel`` (name of the first channel, or
+    /// ``None``) and ``first_block`` (``(offset, size)`` of the first data
+    /// block, or ``None``).
+    fn summary(&self, py: Python) -> HashMap<String, PyObject> {
+        let groups = self.index.groups();
+        let first_channel = groups
+            .iter()
+            .flat_map(|g| g.channels.iter())
+            .next()
+            .and_then(|ch| ch.name.clone());
+        let first_block = groups
+            .iter()
+            .flat_map(|g| g.data_blocks.iter())
+            .next()
+            .map(|b| (b.file_offset, b.size));
+        let mut info = HashMap::new();
+        info.insert("file_size".to_string(), self.index.file_size.to_object(py));
+        info.insert("group_count".to_string(), groups.len().to_object(py));
+        info.insert("channel_count".to_string(), self.index.channel_count().to_object(py));
+        info.insert("record_count".to_string(), self.index.record_count().to_object(py));
+        info.insert("first_channel".to_string(), first_channel.to_object(py));
+        info.insert("first_block".to_string(), first_block.to_object(py));
+        info
+    }
+
     /// The data source attached to this index (file path or URL), or ``None``.
     ///
     /// Set automatically by :py:meth:`from_file` / :py:meth:`from_url`. After
@@ -1391,6 +2462,23 @@ impl PyMdfIndex {
         self.apply_source(value);
     }
 
+    /// Attach a local MDF file and keep it memory-mapped for all later reads.
+    ///
+    /// A plain file :py:attr:`source` is re-opened and re-mapped on every
+    /// :py:meth:`read` / :py:meth:`values` call. ``attach_file`` maps it once
+    /// and reuses that map until the source is replaced — the fast path for
+    /// many reads against one local file. Pages are still read lazily.
+    ///
+    /// Parameters
+    /// ----------
+    /// path : str
+    ///     Path to the ``.mf4`` file this index was built from.
+    fn attach_file(&mut self, py: Python, path: &str) -> PyResult<()> {
+        py.allow_threads(|| self.index.attach_file(path))?;
+        self.clear_ranges();
+        Ok(())
+    }
+
     /// Read a channel as a ``pandas.Series`` of values indexed by timestamps.
     ///
     /// **Lazy:** the byte-range request to the attached source happens now, not
@@ -1411,12 +2499,10 @@ impl PyMdfIndex {
     fn read(&self, py: Python, name: &str, group: Option<&str>) -> PyResult<PyObject> {
         let pd = check_pandas_available(py)?;
         // Release the GIL during the (potentially blocking, e.g. HTTP) read.
-        let signal = py.allow_threads(|| match group {
-            Some(g) => self.index.read_in(g, name),
-            None => self.index.read(name),
-        })?;
+        let (g, c) = self.resolve(name, group)?;
+        let signal = py.allow_threads(|| self.index.read_signal(g, c))?;
         signal_to_series(
-            py, &pd, &signal.name, &signal.timestamps, signal.values, self.index.start_time_ns,
+            py, &pd, &signal.name, signal.timestamps, signal.values, self.index.start_time_ns,
         )
     }
 
@@ -1430,19 +2516,248 @@ impl PyMdfIndex {
     /// name : str
     /// group : Optional[str]
     fn values<'py>(&self, py: Python<'py>, name: &str, group: Option<&str>) -> PyResult<PyObject> {
-        let (g, c) = match group {
-            Some(gn) => self.index.locate_in(gn, name).ok_or_else(|| {
-                MdfException::new_err(format!("Channel '{}' not found in group '{}'", name, gn))
-            })?,
-            None => self.index.locate(name).ok_or_else(|| {
-                MdfException::new_err(format!("Channel '{}' not found", name))
-            })?,
-        };
+        let (g, c) = self.resolve(name, group)?;
         // Release the GIL during the (potentially blocking, e.g. HTTP) read.
         let values = py.allow_threads(|| self.index.read_values_f64_via_source(g, c))?;
         Ok(PyArray1::from_vec_bound(py, values).into())
     }
 
+    /// Read a numeric channel by name as a numpy array of its natural dtype.
+    ///
+    /// Like :py:meth:`values`, but integer channels keep their integers:
+    /// ``int64`` (``uint64`` when a value exceeds the ``int64`` range), while
+    /// float channels (including linearly converted ones) and channels with
+    /// invalid samples are ``float64`` with ``NaN`` for invalid samples. The
+    /// array is filled from Rust with no Python object per sample.
+    ///
+    /// Parameters
+    /// ----------
+    /// name : str
+    /// group : Optional[str]
+    /// dtype : Optional[str]
+    ///     Narrow an integer channel to a smaller element type: one of
+    ///     ``"int8"``, ``"int16"``, ``"int32"``, ``"int64"``, ``"uint8"``,
+    ///     ``"uint16"``, ``"uint32"`` or ``"uint64"``. Every sample must be a
+    ///     valid integer that fits; a narrow array makes later scans such as
+    ///     ``np.count_nonzero(speed > 100)`` touch fewer bytes.
+    ///
+    /// Raises
+    /// ------
+    /// MdfException
+    ///     If no source is attached, the channel is missing, or it holds text
+    ///     or bytes (use :py:meth:`read` for those); also if ``dtype`` is
+    ///     not a supported type or a sample is invalid, not an integer, or out
+    ///     of its range.
+    fn typed_values(&self, py: Python, name: &str, group: Option<&str>, dtype: Option<&str>) -> PyResult<PyObject> {
+        let (g, c) = self.resolve(name, group)?;
+        // Release the GIL during the (potentially blocking, e.g. HTTP) read.
+        let values = py.allow_threads(|| self.index.read_values_via_source(g, c))?;
+        if let Some(dtype) = dtype {
+            return match dtype {
+                "int8" => narrow_integers::<i8>(py, name, dtype, &values),
+                "int16" => narrow_integers::<i16>(py, name, dtype, &values),
+                "int32" => narrow_integers::<i32>(py, name, dtype, &values),
+                "int64" => narrow_integers::<i64>(py, name, dtype, &values),
+                "uint8" => narrow_integers::<u8>(py, name, dtype, &values),
+                "uint16" => narrow_integers::<u16>(py, name, dtype, &values),
+                "uint32" => narrow_integers::<u32>(py, name, dtype, &values),
+                "uint64" => narrow_integers::<u64>(py, name, dtype, &values),
+                other => Err(MdfException::new_err(format!(
+                    "Unknown dtype '{}'; expected one of: int8, int16, int32, int64, \
+                     uint8, uint16, uint32, uint64", other
+                ))),
+            };
+        }
+        if let Some(array) = numeric_values_to_numpy(py, &values) {
+            return Ok(array);
+        }
+        if values.iter().any(|v| v.is_some()) {
+            return Err(MdfException::new_err(format!(
+                "Channel '{}' is not numeric; use read() instead", name
+            )));
+        }
+        // Empty or entirely invalid: a float64 array of NaN.
+        let data: Vec<f64> = values.iter().map(decoded_opt_to_f64).collect();
+        Ok(PyArray1::from_vec_bound(py, data).into())
+    }
+
+    /// Summary statistics of a numeric channel in one pass.
+    ///
+    /// Decodes the channel as :py:meth:`values` does and folds every valid
+    /// sample into the count, minimum, maximum, sum and threshold count
+    /// together, inside Rust, rather than one numpy reduction per figure.
+    /// ``NaN`` (invalid) samples are skipped.
+    ///
+    /// Parameters
+    /// ----------
+    /// name : str
+    /// group : Optional[str]
+    /// threshold : Optional[float]
+    ///     Also count the samples strictly greater than this value.
+    ///
+    /// Returns
+    /// -------
+    /// dict
+    ///     ``{"count": int, "min": float | None, "max": float | None,
+    ///     "mean": float | None, "above": int | None}``; the statistics are
+    ///     ``None`` when no sample is valid, ``above`` when no ``threshold``
+    ///     is given.
+    ///
+    /// Raises
+    /// ------
+    /// MdfException
+    ///     If no source is attached or the channel is missing.
+    fn stats(
+        &self,
+        py: Python,
+        name: &str,
+        group: Option<&str>,
+        threshold: Option<f64>,
+    ) -> PyResult<HashMap<String, PyObject>> {
+        let (g, c) = self.resolve(name, group)?;
+        let (count, min, max, sum, above) = py.allow_threads(|| -> Result<_, MdfError> {
+            let values = self.index.read_values_f64_via_source(g, c)?;
+            let limit = threshold.unwrap_or(f64::INFINITY);
+            let (mut count, mut min, mut max, mut sum, mut above) =
+                (0usize, f64::INFINITY, f64::NEG_INFINITY, 0.0f64, 0usize);
+            for &v in values.iter().filter(|v| !v.is_nan()) {
+                count += 1;
+                min = min.min(v);
+                max = max.max(v);
+                sum += v;
+                above += (v > limit) as usize;
+            }
+            Ok((count, min, max, sum, above))
+        })?;
+        let valid = |x: f64| (count > 0).then_some(x);
+        let mut stats = HashMap::new();
+        stats.insert("count".to_string(), count.to_object(py));
+        stats.insert("min".to_string(), valid(min).to_object(py));
+        stats.insert("max".to_string(), valid(max).to_object(py));
+        stats.insert("mean".to_string(), valid(sum / count as f64).to_object(py));
+        stats.insert("above".to_string(), threshold.map(|_| above).to_object(py));
+        Ok(stats)
+    }
+
+    /// Decode a numeric channel from byte ranges you have already fetched.
+    ///
+    /// Pairs with :py:meth:`byte_ranges`: fetch those ranges yourself (HTTP,
+    /// S3, a cache, ...) and hand the bytes back here, so the data is decoded
+    /// from what was downloaded instead of being read from the source a second
+    /// time. No source needs to be attached. The buffers are decoded in place
+    /// with the GIL released. Invalid samples are ``NaN``.
+    ///
+    /// Parameters
+    /// ----------
+    /// name : str
+    /// ranges : list[tuple[int, int]]
+    ///     ``(offset, length)`` of each fetched range, as returned by
+    ///     :py:meth:`byte_ranges` (merged ranges work too). For a group with
+    ///     invalidation bytes the decoder needs each data block's whole record
+    ///     payload, which :py:meth:`byte_ranges` does not cover, so such
+    ///     channels are read with :py:meth:`values` instead.
+    /// buffers : list[bytes]
+    ///     The fetched bytes, one entry per range.
+    /// group : Optional[str]
+    ///
+    /// Raises
+    /// ------
+    /// MdfException
+    ///     If the channel is missing, ``ranges`` and ``buffers`` differ in
+    ///     length, or the buffers do not cover the channel's data.
+    fn values_from_buffers<'py>(
+        &self,
+        py: Python<'py>,
+        name: &str,
+        ranges: Vec<(u64, u64)>,
+        buffers: Vec<Bound<'py, PyBytes>>,
+        group: Option<&str>,
+    ) -> PyResult<PyObject> {
+        if ranges.len() != buffers.len() {
+            return Err(MdfException::new_err(format!(
+                "ranges length ({}) must match buffers length ({})",
+                ranges.len(), buffers.len()
+            )));
+        }
+        let (g, c) = self.resolve(name, group)?;
+        // Borrowed, not copied: bytes objects are immutable and `buffers`
+        // keeps them alive, so the slices stay valid with the GIL released.
+        let fetched: Vec<(u64, &[u8])> = ranges.iter()
+            .zip(buffers.iter())
+            .map(|(&(offset, _), bytes)| (offset, bytes.as_bytes()))
+            .collect();
+        let values = py.allow_threads(|| self.index.decode_channel_f64_from_buffers(g, c, &fetched))?;
+        Ok(PyArray1::from_vec_bound(py, values).into())
+    }
+
+    /// Read several numeric channels in one call as ``{name: float64 array}``.
+    ///
+    /// The attached source is opened once (a single memory map, or a single
+    /// HTTP reader) and all channels are decoded with the GIL released, instead
+    /// of paying the open + FFI round-trip per channel as repeated
+    /// :py:meth:`values` calls do. For a local file the channels are decoded
+    /// in parallel across the available cores; over HTTP, channels of the same
+    /// group share one fetch of the group's data blocks.
+    ///
+    /// Parameters
+    /// ----------
+    /// names : list[str]
+    /// group : Optional[str]
+    ///     Resolve every name inside this group only.
+    ///
+    /// Raises
+    /// ------
+    /// MdfException
+    ///     If no source is attached or any channel is missing.
+    fn values_many(&self, py: Python, names: Vec<String>, group: Option<&str>) -> PyResult<PyObject> {
+        let positions = names
+            .iter()
+            .map(|name| self.resolve(name, group))
+            .collect::<PyResult<Vec<_>>>()?;
+        let columns = py.allow_threads(|| self.index.read_values_f64_many_via_source(&positions))?;
+        let out = PyDict::new_bound(py);
+        for (name, values) in names.into_iter().zip(columns) {
+            out.set_item(name, PyArray1::from_vec_bound(py, values))?;
+        }
+        Ok(out.into())
+    }
+
+    /// Stream a numeric channel as successive ``float64`` numpy chunks.
+    ///
+    /// Each step decodes the next ``chunk_size`` records straight from the
+    /// data blocks that hold them, with the GIL released, so peak memory is
+    /// one chunk rather than the whole column. Concatenated, the chunks equal
+    /// :py:meth:`values`. A local file source is opened and mapped once, when
+    /// the iterator is created, and every chunk slices that mapping.
+    ///
+    /// Parameters
+    /// ----------
+    /// name : str
+    /// group : Optional[str]
+    /// chunk_size : Optional[int]
+    ///     Records per chunk (default 65536); the last chunk may be shorter.
+    ///
+    /// Raises
+    /// ------
+    /// MdfException
+    ///     If the channel is missing, ``chunk_size`` is zero, or no source
+    ///     is attached.
+    ///
+    /// Example
+    /// -------
+    /// >>> total = 0.0
+    /// >>> for chunk in idx.iter_values("Speed", chunk_size=100_000):
+    /// ...     total += chunk.sum()
+    fn iter_values(
+        slf: PyRef<'_, Self>,
+        name: &str,
+        group: Option<&str>,
+        chunk_size: Option<usize>,
+    ) -> PyResult<PyValueChunkIterator> {
+        let py = slf.py();
+        PyValueChunkIterator::start(py, slf.into(), name, group, chunk_size)
+    }
+
     /// ``index["Speed"]`` — shorthand for :py:meth:`read` (timestamp-indexed Series).
     ///
     /// Pass a ``(name, group)`` tuple to disambiguate a channel name shared by
@@ -1453,9 +2768,148 @@ impl PyMdfIndex {
     }
 }
 
+/// Iterator over fixed-size chunks of one channel, returned by
+/// :py:meth:`MdfIndex.iter_values`.
+///
+/// Yields ``float64`` numpy arrays of at most ``chunk_size`` values, in
+/// record order.
+#[gen_stub_pyclass]
+#[pyclass(name = "ValueChunkIterator")]
+pub struct PyValueChunkIterator {
+    index: Py<PyMdfIndex>,
+    /// The index's source when the iterator was created, with a file path
+    /// mapped once so successive chunks do not re-open the file.
+    source: Source,
+    group: usize,
+    channel: usize,
+    /// First record of the next chunk.
+    next_record: u64,
+    /// Records in the channel's group.
+    record_count: u64,
+    chunk_size: u64,
+}
+
+impl PyValueChunkIterator {
+    /// Begin a chunked walk over channel `name` of `index`.
+    fn start(
+        py: Python,
+        index: Py<PyMdfIndex>,
+        name: &str,
+        group: Option<&str>,
+        chunk_size: Option<usize>,
+    ) -> PyResult<Self> {
+        let reader = index.borrow(py);
+        let (g, c) = reader.resolve(name, group)?;
+        let chunk_size = chunk_size.unwrap_or(65536);
+        if chunk_size == 0 {
+            return Err(MdfException::new_err("chunk_size must be positive"));
+        }
+        let record_count = reader.index.groups()[g].record_count;
+        let source = reader.index.pinned_source()?;
+        drop(reader);
+        Ok(PyValueChunkIterator {
+            index,
+            source,
+            group: g,
+            channel: c,
+            next_record: 0,
+            record_count,
+            chunk_size: chunk_size as u64,
+        })
+    }
+}
+
+#[gen_stub_pymethods]
+#[pymethods]
+impl PyValueChunkIterator {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(&mut self, py: Python) -> PyResult<Option<PyObject>> {
+        if self.next_record >= self.record_count {
+            return Ok(None);
+        }
+        let count = self.chunk_size.min(self.record_count - self.next_record);
+        let reader = self.index.borrow(py);
+        let index: &MdfIndex = &reader.index;
+        let (g, c, start) = (self.group, self.channel, self.next_record);
+        let source = &self.source;
+        let values = py.allow_threads(|| index.read_values_f64_window_from(source, g, c, start, count))?;
+        drop(reader);
+        // A group whose data blocks hold fewer records than its cycle count
+        // ends early rather than yielding empty chunks.
+        if values.is_empty() {
+            self.next_record = self.record_count;
+            return Ok(None);
+        }
+        self.next_record += count;
+        Ok(Some(PyArray1::from_vec_bound(py, values).into()))
+    }
+}
+
+/// How many channels' byte ranges a `PyMdfIndex` memoizes before starting over.
+const RANGES_MEMO_MAX: usize = 1024;
+
 impl PyMdfIndex {
+    /// Wrap an [`MdfIndex`], building the channel- and group-name lookup tables.
+    fn wrap(index: MdfIndex) -> Self {
+        let mut by_name = HashMap::new();
+        let mut by_group = HashMap::new();
+        let mut in_group = Vec::with_capacity(index.groups().len());
+        for (g, group) in index.groups().iter().enumerate() {
+            if let Some(name) = &group.name {
+                by_group.entry(name.clone()).or_insert(g);
+            }
+            let mut channels = HashMap::with_capacity(group.channels.len());
+            for (c, channel) in group.channels.iter().enumerate() {
+                if let Some(name) = &channel.name {
+                    by_name.entry(name.clone()).or_insert((g, c));
+                    channels.entry(name.clone()).or_insert(c);
+                }
+            }
+            in_group.push(channels);
+        }
+        PyMdfIndex { index, by_name, by_group, in_group, ranges: Default::default() }
+    }
+
+    /// Whole-channel byte ranges for `(g, c)`, computed on first use and
+    /// served from `ranges` afterwards.
+    fn channel_ranges(&self, g: usize, c: usize) -> Result<std::sync::Arc<Vec<(u64, u64)>>, MdfError> {
+        if let Some(ranges) = self.ranges.lock().unwrap_or_else(|e| e.into_inner()).get(&(g, c)) {
+            return Ok(ranges.clone());
+        }
+        let ranges = std::sync::Arc::new(self.index.get_channel_byte_ranges(g, c)?);
+        let mut memo = self.ranges.lock().unwrap_or_else(|e| e.into_inner());
+        if memo.len() >= RANGES_MEMO_MAX {
+            memo.clear();
+        }
+        memo.insert((g, c), ranges.clone());
+        Ok(ranges)
+    }
+
+    /// Forget every memoized byte-range plan.
+    fn clear_ranges(&mut self) {
+        self.ranges.get_mut().unwrap_or_else(|e| e.into_inner()).clear();
+    }
+
+    /// Resolve a channel name (optionally within a named group) to indices.
+    fn resolve(&self, name: &str, group: Option<&str>) -> PyResult<(usize, usize)> {
+        match group {
+            Some(gn) => self.by_group.get(gn)
+                .and_then(|&g| Some((g, *self.in_group[g].get(name)?)))
+                .ok_or_else(|| {
+                    MdfException::new_err(format!("Channel '{}' not found in group '{}'", name, gn))
+                }),
+            None => self.by_name.get(name).copied().ok_or_else(|| {
+                MdfException::new_err(format!("Channel '{}' not found", name))
+            }),
+        }
+    }
+
     /// Apply a string source, auto-detecting URL vs file path.
     fn apply_source(&mut self, value: Option<&str>) {
+        self.clear_ranges();
         match value {
             None => self.index.source = None,
             Some(v) if v.starts_with("http://") || v.starts_with("https://") => {
@@ -1639,8 +3093,8 @@ impl PyFileLayout {
     /// ----------
     /// path : str
     #[staticmethod]
-    fn from_file(path: &str) -> PyResult<Self> {
-        let inner = FileLayout::from_file(path)?;
+    fn from_file(py: Python, path: &str) -> PyResult<Self> {
+        let inner = py.allow_threads(|| FileLayout::from_file(path))?;
         Ok(PyFileLayout { inner })
     }
 
@@ -1721,8 +3175,8 @@ impl PyFileLayout {
 /// FileLayout
 #[gen_stub_pyfunction]
 #[pyfunction]
-fn file_layout_from_file(path: &str) -> PyResult<PyFileLayout> {
-    PyFileLayout::from_file(path)
+fn file_layout_from_file(py: Python, path: &str) -> PyResult<PyFileLayout> {
+    PyFileLayout::from_file(py, path)
 }
 
 /// Cut an MDF file by time, copying only records whose master channel value
@@ -1748,12 +3202,13 @@ fn file_layout_from_file(path: &str) -> PyResult<PyFileLayout> {
 #[pyfunction]
 #[pyo3(signature = (input_path, output_path, start_time, end_time))]
 fn cut_mdf_by_time(
+    py: Python<'_>,
     input_path: &str,
     output_path: &str,
     start_time: f64,
     end_time: f64,
 ) -> PyResult<()> {
-    crate::cut::cut_mdf_by_time(input_path, output_path, start_time, end_time)?;
+    py.allow_threads(|| crate::cut::cut_mdf_by_time(input_path, output_path, start_time, end_time))?;
     Ok(())
 }
 
@@ -1839,7 +3294,7 @@ fn cut_mdf_by_utc(
 ) -> PyResult<()> {
     let start_ns = coerce_to_unix_ns(py, start_utc)?;
     let end_ns = coerce_to_unix_ns(py, end_utc)?;
-    crate::cut::cut_mdf_by_utc_ns(input_path, output_path, start_ns, end_ns)?;
+    py.allow_threads(|| crate::cut::cut_mdf_by_utc_ns(input_path, output_path, start_ns, end_ns))?;
     Ok(())
 }
 
@@ -1927,8 +3382,8 @@ fn create_data_type_string_utf8() -> PyDataType {
 ///     Source file paths. Must be uncompressed MDF 4.10+ files.
 #[gen_stub_pyfunction]
 #[pyfunction]
-fn merge_files(output: &str, first: &str, second: &str) -> PyResult<()> {
-    crate::merge::merge_files(output, first, second)?;
+fn merge_files(py: Python<'_>, output: &str, first: &str, second: &str) -> PyResult<()> {
+    py.allow_threads(|| crate::merge::merge_files(output, first, second))?;
     Ok(())
 }
 
@@ -1957,6 +3412,9 @@ pub fn init_mf4_rs_module(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<PyMDF>()?;
     m.add_class::<PyMdfWriter>()?;
     m.add_class::<PyMdfIndex>()?;
+    m.add_class::<PyChannelIterator>()?;
+    m.add_class::<PyValueChunkIterator>()?;
+    m.add_class::<PyRecordBuffer>()?;
     m.add_class::<PyChannelGroupInfo>()?;
     m.add_class::<PyChannelInfo>()?;
     m.add_class::<PyDecodedValue>()?;
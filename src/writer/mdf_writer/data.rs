@@ -9,8 +9,13 @@ use crate::parsing::decoder::DecodedValue;
 ///
 /// Each variant holds a slice of typed values for a single channel. All
 /// columns passed to `write_columns` must have the same length (number of
-/// records). The encoder for each channel must match the corresponding
-/// `ColumnData` variant.
+/// records), except that a single-element column is broadcast as a constant
+/// across every record. The encoder for each channel must match the
+/// corresponding `ColumnData` variant.
+///
+/// More column types may be added, so matches outside this crate need a
+/// wildcard arm.
+#[non_exhaustive]
 pub enum ColumnData<'a> {
     /// 64-bit IEEE 754 float values.
     F64(&'a [f64]),
@@ -20,6 +25,10 @@ pub enum ColumnData<'a> {
     U64(&'a [u64]),
     /// Signed 64-bit integer values.
     I64(&'a [i64]),
+    /// Unsigned 32-bit integer values, for unsigned integer channels.
+    U32(&'a [u32]),
+    /// Signed 32-bit integer values, for signed integer channels.
+    I32(&'a [i32]),
 }
 
 pub(super) enum ChannelEncoder {
@@ -316,45 +325,22 @@ impl MdfWriter {
     }
 
     /// Append one record to the currently open DTBLOCK for the given channel group.
+    ///
+    /// The group's record layout (encoders and constant template) was built
+    /// once by `start_data_block_for_cg`; each call is a single lookup, a
+    /// template copy and one encode per value.
     pub fn write_record(&mut self, cg_id: &str, values: &[DecodedValue]) -> Result<(), MdfError> {
-        let potential_new_block = {
-            let dt = self.open_dts.get(cg_id).ok_or_else(|| MdfError::BlockSerializationError("no open DT block for this channel group".into()))?;
-            if values.len() != dt.channels.len() {
-                return Err(MdfError::BlockSerializationError("value count mismatch".into()));
-            }
-            24 + dt.record_size * (dt.record_count as usize + 1) > MAX_DT_BLOCK_SIZE
-        };
-
-        if potential_new_block {
-            let (start_pos, record_count, record_size) = {
-                let dt = self.open_dts.get(cg_id).unwrap();
-                (dt.start_pos, dt.record_count, dt.record_size)
-            };
-            let size = 24 + record_size * record_count as usize;
-            self.update_link(start_pos + 8, size as u64)?;
-            {
-                let dt = self.open_dts.get_mut(cg_id).unwrap();
-                dt.total_record_count += record_count;
-                dt.dt_sizes.push(size as u64);
-            }
-            let header = BlockHeader { id: "##DT".to_string(), reserved0: 0, block_len: 24, links_nr: 0 };
-            let header_bytes = header.to_bytes()?;
-            let new_dt_id = format!("dt_{}", self.dt_counter);
-            self.dt_counter += 1;
-            let new_dt_pos = self.write_block_with_id(&header_bytes, &new_dt_id)?;
-
-            let dt = self.open_dts.get_mut(cg_id).unwrap();
-            dt.dt_id = new_dt_id.clone();
-            dt.start_pos = new_dt_pos;
-            dt.record_count = 0;
-            dt.dt_ids.push(new_dt_id);
-            dt.dt_positions.push(new_dt_pos);
-        }
-
-        let dt = self.open_dts.get_mut(cg_id).unwrap();
+        let mut dt = self.open_dts.get_mut(cg_id).ok_or_else(|| {
+            MdfError::BlockSerializationError("no open DT block for this channel group".into())
+        })?;
         if values.len() != dt.channels.len() {
             return Err(MdfError::BlockSerializationError("value count mismatch".into()));
         }
+        if 24 + dt.record_size * (dt.record_count as usize + 1) > MAX_DT_BLOCK_SIZE {
+            // Rare: roll over to a fresh ##DT block, then pick the group up again.
+            self.split_dt_block(cg_id, &mut Vec::new())?;
+            dt = self.open_dts.get_mut(cg_id).unwrap();
+        }
 
         dt.record_buf.copy_from_slice(&dt.record_template);
         encode_record(dt, values);
@@ -421,6 +407,50 @@ impl MdfWriter {
         Ok(())
     }
 
+    /// Append a run of pre-encoded records for the specified channel group.
+    ///
+    /// `raw` holds whole records back to back, each laid out exactly as for
+    /// [`write_raw_record`]; its length must be a multiple of the group's
+    /// record size. Records are copied to the file in as few writes as the
+    /// `##DT` block limit allows, so callers can pack a large batch into one
+    /// buffer and hand it over in a single call.
+    pub fn write_raw_records(&mut self, cg_id: &str, raw: &[u8]) -> Result<(), MdfError> {
+        let record_size = self.record_size(cg_id).ok_or_else(|| {
+            MdfError::BlockSerializationError("no open DT block for this channel group".into())
+        })?;
+        if record_size == 0 || raw.len() % record_size != 0 {
+            return Err(MdfError::BlockSerializationError(
+                "raw records length is not a multiple of the record size".into(),
+            ));
+        }
+        let max_records = ((MAX_DT_BLOCK_SIZE - 24) / record_size).max(1);
+        let mut rest = raw;
+        while !rest.is_empty() {
+            let record_count = self.open_dts[cg_id].record_count as usize;
+            if record_count >= max_records {
+                // The open block is full: let the single-record path roll over
+                // to a fresh ##DT block.
+                let (first, tail) = rest.split_at(record_size);
+                self.write_raw_record(cg_id, first)?;
+                rest = tail;
+                continue;
+            }
+            let n = (max_records - record_count).min(rest.len() / record_size);
+            let (chunk, tail) = rest.split_at(n * record_size);
+            self.file.write_all(chunk)?;
+            self.offset += chunk.len() as u64;
+            self.open_dts.get_mut(cg_id).unwrap().record_count += n as u64;
+            rest = tail;
+        }
+        Ok(())
+    }
+
+    /// Size in bytes of one record of the open data block for `cg_id`
+    /// (record id + data + invalidation bytes), or `None` if no block is open.
+    pub fn record_size(&self, cg_id: &str) -> Option<usize> {
+        self.open_dts.get(cg_id).map(|dt| dt.record_size)
+    }
+
     /// Fast path for uniform unsigned integer channel groups.
     pub fn write_record_u64(&mut self, cg_id: &str, values: &[u64]) -> Result<(), MdfError> {
         let dt = self.open_dts.get_mut(cg_id).ok_or_else(|| {
@@ -456,7 +486,10 @@ impl MdfWriter {
             dt
         };
         let max_records = (MAX_DT_BLOCK_SIZE - 24) / record_size;
-        let mut buffer = Vec::with_capacity(record_size * max_records);
+        let records = records.into_iter();
+        // Size the buffer for the batch rather than a whole DT block, so a
+        // single-record call does not allocate megabytes it never fills.
+        let mut buffer = Vec::with_capacity(record_size * records.size_hint().0.clamp(1, max_records));
         for record in records {
             let potential_new_block = {
                 let dt = self.open_dts.get(cg_id).ok_or_else(|| {
@@ -533,7 +566,8 @@ impl MdfWriter {
             }
         }
         let max_records = (MAX_DT_BLOCK_SIZE - 24) / record_size;
-        let mut buffer = Vec::with_capacity(record_size * max_records);
+        let records = records.into_iter();
+        let mut buffer = Vec::with_capacity(record_size * records.size_hint().0.clamp(1, max_records));
         for rec in records {
             let potential_new_block = {
                 let dt = self.open_dts.get(cg_id).ok_or_else(|| {
@@ -655,7 +689,8 @@ impl MdfWriter {
             }
         }
         let max_records = (MAX_DT_BLOCK_SIZE - 24) / record_size;
-        let mut buffer = Vec::with_capacity(record_size * max_records);
+        let records = records.into_iter();
+        let mut buffer = Vec::with_capacity(record_size * records.size_hint().0.clamp(1, max_records));
         for rec in records {
             let potential_new_block = {
                 let dt = self.open_dts.get(cg_id).ok_or_else(|| {
@@ -806,31 +841,34 @@ impl MdfWriter {
     /// channel's encoder type. Values are written column-by-column into a
     /// pre-allocated record buffer and flushed in large chunks, avoiding
     /// per-record dispatch overhead.
+    ///
+    /// A column holding a single value is a constant: it is encoded once into
+    /// the record template instead of being expanded to one value per record.
     pub fn write_columns(&mut self, cg_id: &str, columns: &[ColumnData<'_>]) -> Result<(), MdfError> {
+        fn column_len(col: &ColumnData<'_>) -> usize {
+            match col {
+                ColumnData::F64(s) => s.len(),
+                ColumnData::F32(s) => s.len(),
+                ColumnData::U64(s) => s.len(),
+                ColumnData::I64(s) => s.len(),
+                ColumnData::U32(s) => s.len(),
+                ColumnData::I32(s) => s.len(),
+            }
+        }
+
         // Validate and extract metadata once.
-        let (nrows, enc_info, record_size, need_template, template) = {
+        let (nrows, mut enc_info, record_size, mut need_template, mut template) = {
             let dt = self.open_dts.get(cg_id).ok_or_else(|| {
                 MdfError::BlockSerializationError("no open DT block for this channel group".into())
             })?;
             if columns.len() != dt.encoders.len() {
                 return Err(MdfError::BlockSerializationError("column count does not match encoder count".into()));
             }
-            let nrows = match columns.first() {
-                Some(ColumnData::F64(s)) => s.len(),
-                Some(ColumnData::F32(s)) => s.len(),
-                Some(ColumnData::U64(s)) => s.len(),
-                Some(ColumnData::I64(s)) => s.len(),
-                None => 0,
-            };
+            let nrows = columns.iter().map(column_len).max().unwrap_or(0);
             let mut total_channel_bytes = 0usize;
             for (col, enc) in columns.iter().zip(dt.encoders.iter()) {
-                let col_len = match col {
-                    ColumnData::F64(s) => s.len(),
-                    ColumnData::F32(s) => s.len(),
-                    ColumnData::U64(s) => s.len(),
-                    ColumnData::I64(s) => s.len(),
-                };
-                if col_len != nrows {
+                let col_len = column_len(col);
+                if col_len != nrows && col_len != 1 {
                     return Err(MdfError::BlockSerializationError("column length mismatch".into()));
                 }
                 let type_ok = match (col, enc) {
@@ -838,6 +876,8 @@ impl MdfWriter {
                     (ColumnData::F32(_), ChannelEncoder::F32 { .. }) => true,
                     (ColumnData::U64(_), ChannelEncoder::UInt { .. }) => true,
                     (ColumnData::I64(_), ChannelEncoder::Int { .. }) => true,
+                    (ColumnData::U32(_), ChannelEncoder::UInt { .. }) => true,
+                    (ColumnData::I32(_), ChannelEncoder::Int { .. }) => true,
                     _ => false,
                 };
                 if !type_ok {
@@ -864,6 +904,32 @@ impl MdfWriter {
             return Ok(());
         }
 
+        // Stamp constant (single-value) columns into the template once and
+        // drop them from the per-record loop.
+        if nrows > 1 {
+            for (col, info) in columns.iter().zip(enc_info.iter_mut()) {
+                let (off, nbytes) = *info;
+                if nbytes == 0 || column_len(col) != 1 {
+                    continue;
+                }
+                let bytes = match col {
+                    ColumnData::F64(v) => v[0].to_le_bytes(),
+                    ColumnData::F32(v) => {
+                        let mut b = [0u8; 8];
+                        b[..4].copy_from_slice(&v[0].to_le_bytes());
+                        b
+                    }
+                    ColumnData::U64(v) => v[0].to_le_bytes(),
+                    ColumnData::I64(v) => v[0].to_le_bytes(),
+                    ColumnData::U32(v) => u64::from(v[0]).to_le_bytes(),
+                    ColumnData::I32(v) => i64::from(v[0]).to_le_bytes(),
+                };
+                template[off..off + nbytes].copy_from_slice(&bytes[..nbytes]);
+                *info = (off, 0);
+                need_template = true;
+            }
+        }
+
         let max_per_dt = (MAX_DT_BLOCK_SIZE - 24) / record_size;
         let mut buf = vec![0u8; max_per_dt * record_size];
 
@@ -920,6 +986,22 @@ impl MdfWriter {
                             buf[base..base + nbytes].copy_from_slice(&b[..nbytes]);
                         }
                     }
+                    // 32-bit columns are widened per value, so the array is
+                    // never copied into a 64-bit one first.
+                    ColumnData::U32(vals) => {
+                        for r in 0..chunk_size {
+                            let base = r * record_size + off;
+                            let b = u64::from(vals[row + r]).to_le_bytes();
+                            buf[base..base + nbytes].copy_from_slice(&b[..nbytes]);
+                        }
+                    }
+                    ColumnData::I32(vals) => {
+                        for r in 0..chunk_size {
+                            let base = r * record_size + off;
+                            let b = i64::from(vals[row + r]).to_le_bytes();
+                            buf[base..base + nbytes].copy_from_slice(&b[..nbytes]);
+                        }
+                    }
                 }
             }
 
@@ -2,7 +2,6 @@
 use super::*;
 use std::collections::HashMap;
 use std::io::{Seek, SeekFrom, Write};
-use byteorder::{LittleEndian, WriteBytesExt};
 
 #[cfg(not(target_arch = "wasm32"))]
 use std::fs::File;
@@ -24,6 +23,10 @@ impl MmapWriter {
         let file = OpenOptions::new().read(true).write(true).create(true).open(path)?;
         file.set_len(size as u64)?;
         let mmap = unsafe { MmapMut::map_mut(&file)? };
+        // Blocks are written front to back (apart from small link patches),
+        // so let the kernel write back and evict pages behind the cursor.
+        #[cfg(unix)]
+        let _ = mmap.advise(memmap2::Advice::Sequential);
         Ok(MmapWriter { mmap, pos: 0 })
     }
 }
@@ -80,6 +83,7 @@ impl MdfWriter {
             cg_channels: HashMap::new(),
             cg_channel_ids: HashMap::new(),
             channel_map: HashMap::new(),
+            pending_patches: Vec::new(),
         }
     }
 
@@ -112,6 +116,7 @@ impl MdfWriter {
             cg_channels: HashMap::new(),
             cg_channel_ids: HashMap::new(),
             channel_map: HashMap::new(),
+            pending_patches: Vec::new(),
         })
     }
 
@@ -134,6 +139,7 @@ impl MdfWriter {
             cg_channels: HashMap::new(),
             cg_channel_ids: HashMap::new(),
             channel_map: HashMap::new(),
+            pending_patches: Vec::new(),
         })
     }
 
@@ -166,11 +172,11 @@ impl MdfWriter {
     }
 
     /// Updates a link (u64 address) at a specific offset in the file.
+    ///
+    /// The new value is recorded and written out by [`finalize`]; the
+    /// buffered output is not touched until then.
     pub fn update_link(&mut self, offset: u64, address: u64) -> Result<(), MdfError> {
-        let current_pos = self.offset;
-        self.file.seek(SeekFrom::Start(offset))?;
-        self.file.write_u64::<LittleEndian>(address)?;
-        self.file.seek(SeekFrom::Start(current_pos))?;
+        self.patch_bytes(offset, &address.to_le_bytes());
         Ok(())
     }
 
@@ -185,26 +191,59 @@ impl MdfWriter {
     }
 
     fn update_u32(&mut self, offset: u64, value: u32) -> Result<(), MdfError> {
-        let current_pos = self.offset;
-        self.file.seek(SeekFrom::Start(offset))?;
-        self.file.write_u32::<LittleEndian>(value)?;
-        self.file.seek(SeekFrom::Start(current_pos))?;
+        self.patch_bytes(offset, &value.to_le_bytes());
         Ok(())
     }
 
     fn update_u64(&mut self, offset: u64, value: u64) -> Result<(), MdfError> {
-        let current_pos = self.offset;
-        self.file.seek(SeekFrom::Start(offset))?;
-        self.file.write_u64::<LittleEndian>(value)?;
-        self.file.seek(SeekFrom::Start(current_pos))?;
+        self.patch_bytes(offset, &value.to_le_bytes());
         Ok(())
     }
 
     fn update_u8(&mut self, offset: u64, value: u8) -> Result<(), MdfError> {
-        let current_pos = self.offset;
-        self.file.seek(SeekFrom::Start(offset))?;
-        self.file.write_u8(value)?;
-        self.file.seek(SeekFrom::Start(current_pos))?;
+        self.patch_bytes(offset, &[value]);
+        Ok(())
+    }
+
+    /// Records `bytes` (at most eight, the widest field patched) to be
+    /// written at `offset`. A later patch to the same offset replaces an
+    /// earlier one, matching the order of the updates.
+    fn patch_bytes(&mut self, offset: u64, bytes: &[u8]) {
+        let mut value = [0u8; 8];
+        value[..bytes.len()].copy_from_slice(bytes);
+        self.pending_patches.push((offset, bytes.len(), value));
+    }
+
+    /// Writes every pending patch, one seek and write per contiguous run of
+    /// patched bytes, then returns the cursor to the end of the file.
+    fn apply_patches(&mut self) -> Result<(), MdfError> {
+        if self.pending_patches.is_empty() {
+            return Ok(());
+        }
+        let mut patches = std::mem::take(&mut self.pending_patches);
+        // Stable sort: patches to the same offset keep their update order,
+        // so the last one is copied into the run last and wins.
+        patches.sort_by_key(|&(offset, _, _)| offset);
+        let mut run_start = 0u64;
+        let mut run: Vec<u8> = Vec::new();
+        for (offset, len, value) in patches {
+            if !run.is_empty() && offset > run_start + run.len() as u64 {
+                self.file.seek(SeekFrom::Start(run_start))?;
+                self.file.write_all(&run)?;
+                run.clear();
+            }
+            if run.is_empty() {
+                run_start = offset;
+            }
+            let at = (offset - run_start) as usize;
+            if run.len() < at + len {
+                run.resize(at + len, 0);
+            }
+            run[at..at + len].copy_from_slice(&value[..len]);
+        }
+        self.file.seek(SeekFrom::Start(run_start))?;
+        self.file.write_all(&run)?;
+        self.file.seek(SeekFrom::Start(self.offset))?;
         Ok(())
     }
 
@@ -229,8 +268,10 @@ impl MdfWriter {
     /// Returns the current file offset (for block address calculation).
     pub fn offset(&self) -> u64 { self.offset }
 
-    /// Finalizes the file (flushes all data to disk).
+    /// Finalizes the file: writes the pending link patches and flushes all
+    /// data to disk.
     pub fn finalize(mut self) -> Result<(), MdfError> {
+        self.apply_patches()?;
         self.file.flush()?;
         Ok(())
     }
@@ -67,4 +67,9 @@ pub struct MdfWriter {
     /// open DT block emits its SD block.
     cg_channel_ids: HashMap<String, Vec<String>>,
     channel_map: HashMap<String, (String, usize)>,
+    /// Link and field patches to already-written blocks as (absolute offset,
+    /// length, value) in update order. Sorted and applied in one pass by
+    /// `finalize` so that patching does not seek (and flush) the buffered
+    /// output in the middle of writing.
+    pending_patches: Vec<(u64, usize, [u8; 8])>,
 }
@@ -1,6 +1,6 @@
 use mf4_rs::writer::MdfWriter;
 use mf4_rs::api::mdf::MDF;
-use mf4_rs::parsing::decoder::{decode_channel_value, DecodedValue};
+use mf4_rs::parsing::decoder::{decode_channel_value, decode_f64_column, decode_f64_from_record, DecodedValue};
 use mf4_rs::blocks::channel_block::ChannelBlock;
 use mf4_rs::blocks::common::DataType;
 use mf4_rs::error::MdfError;
@@ -120,6 +120,90 @@ fn writer_write_records() -> Result<(), MdfError> {
     Ok(())
 }
 
+#[test]
+fn writer_write_columns_32bit() -> Result<(), MdfError> {
+    use mf4_rs::writer::ColumnData;
+
+    let path = std::env::temp_dir().join("columns_32bit_test.mf4");
+    if path.exists() { std::fs::remove_file(&path)?; }
+
+    let mut writer = MdfWriter::new(path.to_str().unwrap())?;
+    writer.init_mdf_file()?;
+    let cg_id = writer.add_channel_group(None, |_| {})?;
+    let speed = writer.add_channel(&cg_id, None, |ch| {
+        ch.data_type = DataType::UnsignedIntegerLE;
+        ch.bit_count = 32;
+    })?;
+    let offset = writer.add_channel(&cg_id, Some(&speed), |ch| {
+        ch.data_type = DataType::SignedIntegerLE;
+        ch.bit_count = 32;
+    })?;
+    writer.add_channel(&cg_id, Some(&offset), |ch| {
+        ch.data_type = DataType::SignedIntegerLE;
+        ch.bit_count = 16;
+    })?;
+
+    writer.start_data_block_for_cg(&cg_id, 0)?;
+    let speeds: Vec<u32> = vec![60, 110, u32::MAX];
+    let offsets: Vec<i32> = vec![-5, 0, i32::MIN];
+    // A single-value column is written as a constant.
+    writer.write_columns(&cg_id, &[
+        ColumnData::U32(&speeds),
+        ColumnData::I32(&offsets),
+        ColumnData::I32(&[-7]),
+    ])?;
+    writer.finish_data_block(&cg_id)?;
+    writer.finalize()?;
+
+    let mdf = MDF::from_file(path.to_str().unwrap())?;
+    let groups = mdf.channel_groups();
+    let columns = groups[0].columns_as_f64()?;
+    assert_eq!(columns[0], vec![60.0, 110.0, u32::MAX as f64]);
+    assert_eq!(columns[1], vec![-5.0, 0.0, i32::MIN as f64]);
+    assert_eq!(columns[2], vec![-7.0; 3]);
+
+    std::fs::remove_file(path)?;
+    Ok(())
+}
+
+#[test]
+fn writer_write_raw_records_spans_data_blocks() -> Result<(), MdfError> {
+    let path = std::env::temp_dir().join("raw_records_test.mf4");
+    if path.exists() { std::fs::remove_file(&path)?; }
+
+    let mut writer = MdfWriter::new(path.to_str().unwrap())?;
+    writer.init_mdf_file()?;
+    let cg_id = writer.add_channel_group(None, |_| {})?;
+    writer.add_channel(&cg_id, None, |ch| {
+        ch.data_type = DataType::UnsignedIntegerLE;
+        ch.bit_count = 64;
+    })?;
+
+    writer.start_data_block_for_cg(&cg_id, 0)?;
+    assert_eq!(writer.record_size(&cg_id), Some(8));
+    // More than one 4 MB ##DT block worth of records, handed over in two
+    // uneven batches.
+    let n = 600_000u64;
+    let raw: Vec<u8> = (0..n).flat_map(|v| v.to_le_bytes()).collect();
+    let (first, second) = raw.split_at(8 * 123_457);
+    writer.write_raw_records(&cg_id, first)?;
+    writer.write_raw_records(&cg_id, second)?;
+    assert!(writer.write_raw_records(&cg_id, &[0u8; 5]).is_err());
+    writer.finish_data_block(&cg_id)?;
+    writer.finalize()?;
+
+    let mdf = MDF::from_file(path.to_str().unwrap())?;
+    let groups = mdf.channel_groups();
+    let vals = groups[0].channels()[0].values()?;
+    assert_eq!(vals.len(), n as usize);
+    for (i, v) in vals.iter().enumerate() {
+        assert!(matches!(v, Some(DecodedValue::UnsignedInteger(x)) if *x == i as u64));
+    }
+
+    std::fs::remove_file(path)?;
+    Ok(())
+}
+
 #[test]
 fn decode_channel_value_integer() {
     let mut ch = ChannelBlock::default();
@@ -132,6 +216,52 @@ fn decode_channel_value_integer() {
     }
 }
 
+#[test]
+fn decode_f64_column_matches_per_record_decode() {
+    // 1 record-id byte + 13 data bytes: an i16 at byte 1, an f64 at byte 3
+    // and an unaligned 12-bit field that needs the general decoder.
+    let record_size = 14;
+    let mut block = Vec::new();
+    for i in 0..50i16 {
+        let mut record = vec![7u8];
+        record.extend_from_slice(&(i * -300).to_le_bytes());
+        record.extend_from_slice(&(i as f64 * 0.25).to_le_bytes());
+        record.extend_from_slice(&[0xAB, 0xCD, 0xEF]);
+        block.extend_from_slice(&record);
+    }
+
+    let mut int_ch = ChannelBlock::default();
+    int_ch.data_type = DataType::SignedIntegerLE;
+    int_ch.bit_count = 16;
+    let mut float_ch = ChannelBlock::default();
+    float_ch.data_type = DataType::FloatLE;
+    float_ch.byte_offset = 2;
+    float_ch.bit_count = 64;
+    // The same bytes read big-endian also take the strided path.
+    let mut be_int_ch = int_ch.clone();
+    be_int_ch.data_type = DataType::SignedIntegerBE;
+    let mut be_float_ch = float_ch.clone();
+    be_float_ch.data_type = DataType::FloatBE;
+
+    for ch in [&int_ch, &float_ch, &be_int_ch, &be_float_ch] {
+        let mut column = Vec::new();
+        assert!(decode_f64_column(&block, record_size, 1, ch, &mut column));
+        let expected: Vec<f64> = block
+            .chunks_exact(record_size)
+            .map(|record| decode_f64_from_record(record, 1, ch))
+            .collect();
+        assert_eq!(column, expected);
+    }
+
+    let mut packed = ChannelBlock::default();
+    packed.byte_offset = 10;
+    packed.bit_offset = 4;
+    packed.bit_count = 12;
+    let mut column = Vec::new();
+    assert!(!decode_f64_column(&block, record_size, 1, &packed, &mut column));
+    assert!(column.is_empty());
+}
+
 #[test]
 fn writer_block_position() -> Result<(), MdfError> {
     let path = std::env::temp_dir().join("pos_test.mf4");
@@ -148,6 +278,34 @@ fn writer_block_position() -> Result<(), MdfError> {
     Ok(())
 }
 
+#[test]
+fn writer_link_patches_written_on_finalize() -> Result<(), MdfError> {
+    let path = std::env::temp_dir().join("patch_test.mf4");
+    if path.exists() {
+        std::fs::remove_file(&path)?;
+    }
+
+    // Later patches to the same bytes win, and adjacent patches are written
+    // together when the writer is finalized.
+    let mut writer = MdfWriter::new_with_capacity(path.to_str().unwrap(), 16)?;
+    let pos = writer.write_block_with_id(&[0u8; 24], "blk")?;
+    writer.update_link(pos, 1)?;
+    writer.update_link(pos + 8, 2)?;
+    writer.update_link(pos, 3)?;
+    writer.write_block(&[0xFFu8; 8])?;
+    writer.finalize()?;
+
+    let bytes = std::fs::read(&path)?;
+    assert_eq!(bytes.len(), 32);
+    assert_eq!(&bytes[0..8], &3u64.to_le_bytes());
+    assert_eq!(&bytes[8..16], &2u64.to_le_bytes());
+    assert_eq!(&bytes[16..24], &[0u8; 8]);
+    assert_eq!(&bytes[24..32], &[0xFFu8; 8]);
+
+    std::fs::remove_file(path)?;
+    Ok(())
+}
+
 #[test]
 fn cut_mdf_file_by_time() -> Result<(), MdfError> {
     let input = std::env::temp_dir().join("cut_input.mf4");
@@ -328,3 +486,50 @@ fn cut_does_not_double_apply_conversions() -> Result<(), MdfError> {
     std::fs::remove_file(output)?;
     Ok(())
 }
+
+#[test]
+fn group_columns_match_per_channel_reads() -> Result<(), MdfError> {
+    let path = std::env::temp_dir().join("group_columns_test.mf4");
+    if path.exists() { std::fs::remove_file(&path)?; }
+
+    let mut writer = MdfWriter::new(path.to_str().unwrap())?;
+    writer.init_mdf_file()?;
+    let cg_id = writer.add_channel_group(None, |_| {})?;
+    let time = writer.add_channel(&cg_id, None, |ch| {
+        ch.data_type = DataType::FloatLE;
+        ch.bit_count = 64;
+    })?;
+    writer.add_channel(&cg_id, Some(&time), |ch| {
+        ch.data_type = DataType::UnsignedIntegerLE;
+        ch.bit_count = 32;
+    })?;
+
+    writer.start_data_block_for_cg(&cg_id, 0)?;
+    for i in 0..100u64 {
+        writer.write_record(
+            &cg_id,
+            &[DecodedValue::Float(i as f64 * 0.5), DecodedValue::UnsignedInteger(i * 3)],
+        )?;
+    }
+    writer.finish_data_block(&cg_id)?;
+    writer.finalize()?;
+
+    let mdf = MDF::from_file(path.to_str().unwrap())?;
+    let groups = mdf.channel_groups();
+    let columns = groups[0].columns_as_f64()?;
+    let channels = groups[0].channels();
+    assert_eq!(columns.len(), channels.len());
+    for (column, channel) in columns.iter().zip(&channels) {
+        assert_eq!(column.len(), 100);
+        assert_eq!(*column, channel.values_as_f64()?);
+    }
+    assert_eq!(columns[1][7], 21.0);
+
+    // A subset comes back in the requested order, from the same single pass.
+    let subset = groups[0].columns_as_f64_for(&[1, 0, 1])?;
+    assert_eq!(subset, vec![columns[1].clone(), columns[0].clone(), columns[1].clone()]);
+    assert!(groups[0].columns_as_f64_for(&[2]).is_err());
+
+    std::fs::remove_file(path)?;
+    Ok(())
+}
@@ -596,6 +596,50 @@ fn verify_write_columns_f64_correctness() -> Result<(), MdfError> {
     Ok(())
 }
 
+#[test]
+fn verify_write_columns_broadcast_correctness() -> Result<(), MdfError> {
+    use mf4_rs::api::mdf::MDF;
+
+    let n = 1000usize;
+    let path = temp_path("verify_col_broadcast");
+    cleanup(&path);
+
+    let col0: Vec<f64> = (0..n).map(|i| i as f64 * 0.001).collect();
+    let col2: Vec<f64> = col0.iter().map(|v| v * 3.0).collect();
+
+    {
+        let (mut w, cg) = setup_f64_writer(&path)?;
+        w.write_columns(&cg, &[
+            ColumnData::F64(&col0),
+            ColumnData::F64(&[42.5]),
+            ColumnData::F64(&col2),
+            ColumnData::F64(&[-1.0]),
+        ])?;
+        w.finish_data_block(&cg)?;
+        w.finalize()?;
+    }
+
+    let mdf = MDF::from_file(path.to_str().unwrap())?;
+    let groups: Vec<_> = mdf.channel_groups().into_iter().collect();
+    let channels: Vec<_> = groups[0].channels().into_iter().collect();
+
+    let vals0 = channels[0].values_as_f64()?;
+    let vals1 = channels[1].values_as_f64()?;
+    let vals2 = channels[2].values_as_f64()?;
+    let vals3 = channels[3].values_as_f64()?;
+    assert_eq!(vals1.len(), n);
+
+    for i in 0..n {
+        assert!((vals0[i] - col0[i]).abs() < 1e-10, "mismatch at row {} ch0", i);
+        assert_eq!(vals1[i], 42.5, "mismatch at row {} ch1", i);
+        assert!((vals2[i] - col2[i]).abs() < 1e-10, "mismatch at row {} ch2", i);
+        assert_eq!(vals3[i], -1.0, "mismatch at row {} ch3", i);
+    }
+
+    cleanup(&path);
+    Ok(())
+}
+
 #[test]
 fn verify_write_records_f64_correctness() -> Result<(), MdfError> {
     use mf4_rs::api::mdf::MDF;
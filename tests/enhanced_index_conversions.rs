@@ -285,6 +285,10 @@ fn test_index_serialization_with_resolved_data() -> Result<(), MdfError> {
     // Test serialization
     index.save_to_file(temp_index_path.to_str().unwrap())?;
     
+    // Unset conversion links are omitted rather than written as null
+    let json = fs::read_to_string(&temp_index_path)?;
+    assert!(!json.contains("cc_md_comment"), "unset links should not be serialized");
+    
     // Test deserialization
     let loaded_index = MdfIndex::load_from_file(temp_index_path.to_str().unwrap())?;
     
@@ -296,6 +300,8 @@ fn test_index_serialization_with_resolved_data() -> Result<(), MdfError> {
     
     if let Some(ref conversion) = loaded_channel.conversion {
         assert_eq!(conversion.get_resolved_text(0), Some(&"Resolved Text".to_string()));
+        assert!(conversion.cc_md_comment.is_none());
+        assert_eq!(conversion.cc_ref, vec![0]);
     } else {
         panic!("Expected conversion block to be present");
     }
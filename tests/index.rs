@@ -1,7 +1,7 @@
 use mf4_rs::writer::MdfWriter;
 use mf4_rs::blocks::common::DataType;
 use mf4_rs::parsing::decoder::DecodedValue;
-use mf4_rs::index::MdfIndex;
+use mf4_rs::index::{coalesce_byte_ranges, MdfIndex};
 use mf4_rs::api::mdf::MDF;
 use mf4_rs::error::MdfError;
 use std::fs;
@@ -57,6 +57,15 @@ fn test_index_roundtrip() -> Result<(), MdfError> {
     let index = MdfIndex::from_file(mdf_path.to_str().unwrap())?;
     index.save_to_file(index_path.to_str().unwrap())?;
 
+    // Absent optional fields are omitted rather than written as null
+    let saved = fs::read_to_string(&index_path)?;
+    assert!(!saved.contains("null"), "index file should not contain null fields");
+    // Data blocks stay keyed objects so earlier readers can load the file.
+    assert!(saved.contains("file_offset"), "data blocks should be stored as objects");
+    // Zero-valued layout fields are written too, for the same reason.
+    assert!(saved.contains("\"flags\""), "zero flags should be written");
+    assert!(saved.contains("invalidation_bytes"), "zero invalidation bytes should be written");
+
     // Load index and verify structure
     let loaded_index = MdfIndex::load_from_file(index_path.to_str().unwrap())?;
 
@@ -564,3 +573,193 @@ fn test_channel_group_name_lookup() -> Result<(), MdfError> {
     let _ = fs::remove_file(mdf_path);
     Ok(())
 }
+
+#[test]
+fn test_read_many_f64_matches_single_reads() -> Result<(), MdfError> {
+    let mdf_path = std::env::temp_dir().join("read_many_test.mf4");
+    let _ = fs::remove_file(&mdf_path);
+
+    let mut writer = MdfWriter::new(mdf_path.to_str().unwrap())?;
+    writer.init_mdf_file()?;
+    let cg_id = writer.add_channel_group(None, |_| {})?;
+    let t_id = writer.add_channel(&cg_id, None, |ch| {
+        ch.data_type = DataType::FloatLE;
+        ch.name = Some("Time".to_string());
+        ch.bit_count = 64;
+    })?;
+    writer.set_time_channel(&t_id)?;
+    writer.add_channel(&cg_id, Some(&t_id), |ch| {
+        ch.data_type = DataType::UnsignedIntegerLE;
+        ch.name = Some("Count".to_string());
+        ch.bit_count = 32;
+    })?;
+    writer.start_data_block_for_cg(&cg_id, 0)?;
+    for i in 0..20u64 {
+        writer.write_record(&cg_id, &[
+            DecodedValue::Float(i as f64 * 0.5),
+            DecodedValue::UnsignedInteger(i * 3),
+        ])?;
+    }
+    writer.finish_data_block(&cg_id)?;
+    writer.finalize()?;
+
+    let index = MdfIndex::from_file(mdf_path.to_str().unwrap())?;
+    assert_eq!(index.channel_count(), 2);
+    assert_eq!(index.record_count(), 20);
+    let many = index.read_many_f64(&["Count", "Time"])?;
+    assert_eq!(many.len(), 2);
+    assert_eq!(many[0], index.read("Count")?.values_f64());
+    assert_eq!(many[1], index.read("Time")?.values_f64());
+    assert!(index.read_many_f64(&["Time", "Missing"]).is_err());
+    // Channels of one group are decoded together; repeats and order survive.
+    let shuffled = index.read_many_f64(&["Time", "Count", "Time"])?;
+    assert_eq!(shuffled, vec![many[1].clone(), many[0].clone(), many[1].clone()]);
+
+    // A persistently mapped source reads the same values.
+    let mut mapped = index.clone();
+    mapped.attach_file(mdf_path.to_str().unwrap())?;
+    assert_eq!(mapped.source_string().as_deref(), mdf_path.to_str());
+    assert_eq!(mapped.read_many_f64(&["Count", "Time"])?, many);
+    assert_eq!(mapped.read("Count")?.values_f64(), many[0]);
+
+    // An index built from an already-open MDF shares its map.
+    let mdf = MDF::from_file(mdf_path.to_str().unwrap())?;
+    let shared = MdfIndex::from_mdf(&mdf, mdf_path.to_str().unwrap())?;
+    assert_eq!(shared.file_size, index.file_size);
+    assert_eq!(shared.read_many_f64(&["Count", "Time"])?, many);
+
+    let _ = fs::remove_file(mdf_path);
+    Ok(())
+}
+
+#[test]
+fn test_coalesce_byte_ranges() {
+    // Three 50-byte ranges split by 24-byte ##DT headers, given out of order,
+    // plus one far-away range.
+    let ranges = [(174, 50), (100, 50), (248, 50), (10_000, 8)];
+    assert_eq!(
+        coalesce_byte_ranges(&ranges, 24),
+        vec![(100, 198), (10_000, 8)]
+    );
+    // A gap smaller than the headers keeps every range separate.
+    assert_eq!(coalesce_byte_ranges(&ranges, 0).len(), 4);
+    // Overlapping and contained ranges fold into their union.
+    assert_eq!(coalesce_byte_ranges(&[(0, 100), (10, 20), (90, 30)], 0), vec![(0, 120)]);
+    assert!(coalesce_byte_ranges(&[], 4096).is_empty());
+}
+
+#[test]
+fn test_split_channel_read_coalesces_block_fetches() -> Result<(), MdfError> {
+    use mf4_rs::index::{ByteRangeReader, SliceRangeReader};
+    use mf4_rs::writer::ColumnData;
+
+    let mdf_path = std::env::temp_dir().join("index_coalesced_fetch.mf4");
+    let _ = fs::remove_file(&mdf_path);
+
+    // 600k 16-byte records spill over several 4 MiB ##DT blocks.
+    let n = 600_000usize;
+    let mut writer = MdfWriter::new(mdf_path.to_str().unwrap())?;
+    writer.init_mdf_file()?;
+    let cg_id = writer.add_channel_group(None, |_| {})?;
+    let t_id = writer.add_channel(&cg_id, None, |ch| {
+        ch.data_type = DataType::FloatLE;
+        ch.name = Some("Time".to_string());
+        ch.bit_count = 64;
+    })?;
+    writer.set_time_channel(&t_id)?;
+    writer.add_channel(&cg_id, Some(&t_id), |ch| {
+        ch.data_type = DataType::UnsignedIntegerLE;
+        ch.name = Some("Count".to_string());
+        ch.bit_count = 64;
+    })?;
+    writer.start_data_block_for_cg(&cg_id, 0)?;
+    let time: Vec<f64> = (0..n).map(|i| i as f64 * 0.001).collect();
+    let count: Vec<u64> = (0..n as u64).collect();
+    writer.write_columns(&cg_id, &[ColumnData::F64(&time), ColumnData::U64(&count)])?;
+    writer.finish_data_block(&cg_id)?;
+    writer.finalize()?;
+
+    let index = MdfIndex::from_file(mdf_path.to_str().unwrap())?;
+    assert!(index.groups()[0].data_blocks.len() > 1);
+
+    struct Counted {
+        inner: SliceRangeReader,
+        calls: u64,
+    }
+    impl ByteRangeReader for Counted {
+        type Error = MdfError;
+        fn read_range(&mut self, offset: u64, length: u64) -> Result<Vec<u8>, MdfError> {
+            self.calls += 1;
+            self.inner.read_range(offset, length)
+        }
+    }
+
+    let bytes = fs::read(&mdf_path)?;
+    let mut data = index.open(Counted { inner: SliceRangeReader::new(bytes.clone()), calls: 0 });
+    let values = data.values_f64("Count")?;
+    assert_eq!(values.len(), n);
+    assert!(values.iter().enumerate().all(|(i, &v)| v == i as f64));
+    // Back-to-back blocks are fetched as one range.
+    assert_eq!(data.into_inner().calls, 1);
+
+    // A reader holding the whole file decodes the payloads in place.
+    let mut in_memory = index.open(SliceRangeReader::new(bytes));
+    assert_eq!(in_memory.values_f64("Count")?, values);
+
+    let _ = fs::remove_file(mdf_path);
+    Ok(())
+}
+
+#[test]
+fn test_decode_channel_from_fetched_buffers() -> Result<(), MdfError> {
+    let mdf_path = std::env::temp_dir().join("index_fetched_buffers.mf4");
+    let _ = fs::remove_file(&mdf_path);
+
+    let mut writer = MdfWriter::new(mdf_path.to_str().unwrap())?;
+    writer.init_mdf_file()?;
+    let cg_id = writer.add_channel_group(None, |_| {})?;
+    let t_id = writer.add_channel(&cg_id, None, |ch| {
+        ch.data_type = DataType::FloatLE;
+        ch.name = Some("Time".to_string());
+        ch.bit_count = 64;
+    })?;
+    writer.set_time_channel(&t_id)?;
+    writer.add_channel(&cg_id, Some(&t_id), |ch| {
+        ch.data_type = DataType::UnsignedIntegerLE;
+        ch.name = Some("Count".to_string());
+        ch.bit_count = 32;
+    })?;
+    writer.start_data_block_for_cg(&cg_id, 0)?;
+    for i in 0..20u64 {
+        writer.write_record(&cg_id, &[
+            DecodedValue::Float(i as f64 * 0.5),
+            DecodedValue::UnsignedInteger(i * 3),
+        ])?;
+    }
+    writer.finish_data_block(&cg_id)?;
+    writer.finalize()?;
+
+    let index = MdfIndex::from_file(mdf_path.to_str().unwrap())?;
+    let file = fs::read(&mdf_path)?;
+    let fetch = |ranges: &[(u64, u64)]| -> Vec<(u64, Vec<u8>)> {
+        ranges.iter()
+            .map(|&(o, l)| (o, file[o as usize..(o + l) as usize].to_vec()))
+            .collect()
+    };
+    let expected = index.read("Count")?.values_f64();
+
+    // Only the channel's own byte span is fetched, merged or not.
+    for ranges in [index.byte_ranges("Count")?, coalesce_byte_ranges(&index.byte_ranges("Count")?, 4096)] {
+        let fetched = fetch(&ranges);
+        let buffers: Vec<(u64, &[u8])> = fetched.iter().map(|(o, b)| (*o, b.as_slice())).collect();
+        assert_eq!(index.decode_f64_from_buffers("Count", &buffers)?, expected);
+    }
+
+    // A truncated fetch is reported rather than decoded as zeros.
+    let ranges = index.byte_ranges("Count")?;
+    let short = &file[ranges[0].0 as usize..(ranges[0].0 + ranges[0].1 - 1) as usize];
+    assert!(index.decode_f64_from_buffers("Count", &[(ranges[0].0, short)]).is_err());
+
+    let _ = fs::remove_file(mdf_path);
+    Ok(())
+}
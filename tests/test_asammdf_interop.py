@@ -10,7 +10,7 @@ These tests verify that:
 5. Data block splitting (##DL) is handled correctly
 
 Prerequisites:
-    pip install asammdf pandas numpy
+    pip install asammdf numpy
     maturin develop --release   (or: pip install .)
 
 Usage:
@@ -19,29 +19,33 @@ Usage:
 This script exits with code 0 on success, non-zero on failure.
 """
 
+import contextlib
+import functools
+import importlib
+import importlib.util
+import mmap
 import os
+import struct
 import sys
 import tempfile
-import traceback
 
 import numpy as np
 
 
 def check_imports():
-    """Verify all required packages are available."""
+    """Verify all required packages are available.
+
+    asammdf is only located here, not imported: :func:`_asammdf` imports it
+    on first use, so the skip path and mf4-rs-only tests don't pay its
+    import time.
+    """
     errors = []
-    try:
-        import asammdf  # noqa: F401
-    except ImportError:
+    if importlib.util.find_spec("asammdf") is None:
         errors.append("asammdf (pip install asammdf)")
     try:
         import mf4_rs  # noqa: F401
     except ImportError:
         errors.append("mf4_rs (maturin develop --release)")
-    try:
-        import pandas  # noqa: F401
-    except ImportError:
-        errors.append("pandas (pip install pandas)")
     if errors:
         print(f"SKIP: missing packages: {', '.join(errors)}")
         sys.exit(0)  # exit 0 so CI doesn't fail if packages unavailable
@@ -49,26 +53,46 @@ def check_imports():
 
 check_imports()
 
-from asammdf import MDF as AsamMDF, Signal  # noqa: E402
 import mf4_rs  # noqa: E402
 
 
+@functools.lru_cache(maxsize=1)
+def _asammdf():
+    """The ``asammdf`` module, imported on first use."""
+    return importlib.import_module("asammdf")
+
+
 passed = 0
 failed = 0
 skipped = 0
+_failures = []
 
 
 def run_test(name, fn):
-    """Run a test function and track results."""
+    """Run a test function and track results.
+
+    A failure prints one line here; its exception is kept and the traceback
+    is formatted later by :func:`print_failures`.
+    """
     global passed, failed
     try:
         fn()
-        print(f"  PASS  {name}")
-        passed += 1
     except Exception as e:
         print(f"  FAIL  {name}: {e}")
-        traceback.print_exc()
+        _failures.append((name, e))
         failed += 1
+    else:
+        print(f"  PASS  {name}")
+        passed += 1
+
+
+def print_failures():
+    """Print the traceback of every failure recorded by :func:`run_test`."""
+    import traceback
+
+    for name, exc in _failures:
+        print(f"\n--- {name} ---")
+        traceback.print_exception(type(exc), exc, exc.__traceback__)
 
 
 # ---------------------------------------------------------------------------
@@ -76,21 +100,29 @@ def run_test(name, fn):
 # ---------------------------------------------------------------------------
 
 
-def tmp(name):
-    return os.path.join(tempfile.gettempdir(), f"interop_{name}.mf4")
+def tmp(directory, name):
+    return os.path.join(directory, f"interop_{name}.mf4")
 
 
-def cleanup(*paths):
-    for p in paths:
-        try:
-            os.remove(p)
-        except OSError:
-            pass
+_BASIC_DIR = None
+_BASIC_PATH = None
 
 
 def write_mf4rs_basic():
-    """Write a basic file with mf4-rs: time + float + int, 100 records."""
-    path = tmp("mf4rs_basic")
+    """Write a basic file with mf4-rs: time + float + int, 100 records.
+
+    The file is written on the first call and shared by every later one; the
+    tests only read it. Its temporary directory is removed when the
+    interpreter exits.
+    """
+    global _BASIC_DIR, _BASIC_PATH
+    if _BASIC_PATH is None:
+        _BASIC_DIR = tempfile.TemporaryDirectory()
+        _BASIC_PATH = _write_mf4rs_basic(tmp(_BASIC_DIR.name, "mf4rs_basic"))
+    return _BASIC_PATH
+
+
+def _write_mf4rs_basic(path):
     w = mf4_rs.MdfWriter(path)
     w.init_mdf_file()
     cg = w.add_channel_group("Group1")
@@ -99,31 +131,39 @@ def write_mf4rs_basic():
     w.add_int_channel(cg, "Counter")
 
     w.start_data_block(cg)
-    for i in range(100):
-        w.write_record(cg, [
-            mf4_rs.create_float_value(i * 0.01),
-            mf4_rs.create_float_value(20.0 + i * 0.5),
-            mf4_rs.create_uint_value(i),
-        ])
+    # Column types are inferred from the arrays: float64, float64, uint64.
+    i = np.arange(100, dtype=np.uint64)
+    w.write_columns(cg, [i * 0.01, 20.0 + i * 0.5, i])
     w.finish_data_block(cg)
     w.finalize()
     return path
 
 
-def write_asammdf_basic():
+@contextlib.contextmanager
+def basic_mdfs():
+    """``(mf4_rs.Mdf, asammdf.MDF)`` over the shared basic file.
+
+    The asammdf handle is closed when the ``with`` block exits, so no test
+    leaves it open on the file.
+    """
+    path = write_mf4rs_basic()
+    with _asammdf().MDF(path) as a_mdf:
+        yield mf4_rs.Mdf(path), a_mdf
+
+
+def write_asammdf_basic(directory):
     """Write a basic file with asammdf: time + float + int, 100 records."""
-    path = tmp("asammdf_basic")
-    t = np.arange(100, dtype=np.float64) * 0.01
-    temp = 20.0 + np.arange(100, dtype=np.float64) * 0.5
+    path = tmp(directory, "asammdf_basic")
     counter = np.arange(100, dtype=np.uint64)
-    mdf = AsamMDF()
-    mdf.append([
-        Signal(samples=t, timestamps=t, name="Time"),
-        Signal(samples=temp, timestamps=t, name="Temperature"),
-        Signal(samples=counter, timestamps=t, name="Counter"),
-    ])
-    mdf.save(path, overwrite=True)
-    mdf.close()
+    t = counter * 0.01
+    temp = 20.0 + counter * 0.5
+    with _asammdf().MDF() as mdf:
+        mdf.append([
+            _asammdf().Signal(samples=t, timestamps=t, name="Time"),
+            _asammdf().Signal(samples=temp, timestamps=t, name="Temperature"),
+            _asammdf().Signal(samples=counter, timestamps=t, name="Counter"),
+        ])
+        mdf.save(path, overwrite=True)
     return path
 
 
@@ -134,28 +174,22 @@ def write_asammdf_basic():
 
 def test_asammdf_reads_mf4rs_basic():
     """asammdf can read a basic mf4-rs file and get correct values."""
-    path = write_mf4rs_basic()
-    try:
-        mdf = AsamMDF(path)
+    with basic_mdfs() as (_, mdf):
         assert len(mdf.groups) >= 1, f"expected >=1 groups, got {len(mdf.groups)}"
 
+        i = np.arange(100)
         temp = mdf.get("Temperature", group=0)
         assert len(temp.samples) == 100, f"expected 100 samples, got {len(temp.samples)}"
-        assert abs(temp.samples[0] - 20.0) < 0.1, f"first temp should be ~20.0, got {temp.samples[0]}"
-        assert abs(temp.samples[99] - 69.5) < 0.1, f"last temp should be ~69.5, got {temp.samples[99]}"
+        np.testing.assert_allclose(temp.samples, 20.0 + i * 0.5, rtol=0, atol=1e-9, err_msg="Temperature")
 
         counter = mdf.get("Counter", group=0)
-        assert int(counter.samples[0]) == 0
-        assert int(counter.samples[99]) == 99
-        mdf.close()
-    finally:
-        cleanup(path)
+        np.testing.assert_array_equal(counter.samples.astype(np.int64), i, err_msg="Counter")
 
 
 def test_mf4rs_reads_asammdf_basic():
     """mf4-rs can read a basic asammdf file and get correct values."""
-    path = write_asammdf_basic()
-    try:
+    with tempfile.TemporaryDirectory() as d:
+        path = write_asammdf_basic(d)
         mdf = mf4_rs.Mdf(path)
         groups = mdf.groups
         assert len(groups) >= 1, f"expected >=1 groups, got {len(groups)}"
@@ -165,33 +199,23 @@ def test_mf4rs_reads_asammdf_basic():
         assert len(temp_vals) == 100, f"expected 100 values, got {len(temp_vals)}"
         assert abs(temp_vals[0] - 20.0) < 0.001, f"first temp should be 20.0, got {temp_vals[0]}"
         assert abs(temp_vals[99] - 69.5) < 0.001, f"last temp should be 69.5, got {temp_vals[99]}"
-    finally:
-        cleanup(path)
 
 
 def test_cross_read_values_match():
     """Values written by mf4-rs match when read by both libraries."""
-    path = write_mf4rs_basic()
-    try:
+    with basic_mdfs() as (rs_mdf, a_mdf):
         # Read with mf4-rs (returns numpy arrays)
-        rs_mdf = mf4_rs.Mdf(path)
         rs_temp = rs_mdf.values("Temperature")
         rs_count = rs_mdf.values("Counter")
 
         # Read with asammdf
-        a_mdf = AsamMDF(path)
         a_temp = a_mdf.get("Temperature", group=0).samples
         a_count = a_mdf.get("Counter", group=0).samples
-        a_mdf.close()
 
-        # Compare
+        # Compare; mf4-rs reports invalid samples as NaN, so none may appear here
         assert len(rs_temp) == len(a_temp), "length mismatch"
-        for i, (rv, av) in enumerate(zip(rs_temp, a_temp)):
-            assert abs(rv - av) < 1e-5, f"Temperature mismatch at {i}: {rv} vs {av}"
-        for i, (rv, av) in enumerate(zip(rs_count, a_count)):
-            assert int(rv) == int(av), f"Counter mismatch at {i}: {rv} vs {av}"
-    finally:
-        cleanup(path)
+        np.testing.assert_allclose(rs_temp, a_temp, rtol=0, atol=1e-5, err_msg="Temperature")
+        np.testing.assert_array_equal(rs_count.astype(np.int64), a_count.astype(np.int64), err_msg="Counter")
 
 
 def test_all_integer_types_roundtrip():
@@ -206,64 +230,58 @@ def test_all_integer_types_roundtrip():
         "int32": (np.int32, [-2147483648, 0, 2147483647]),
         "int64": (np.int64, [-(2**63), 0, 2**63 - 1]),
     }
-    paths = []
-    try:
-        for name, (dtype, values) in types.items():
-            path = tmp(f"dtype_{name}")
-            paths.append(path)
-            mdf = AsamMDF()
-            samples = np.array(values, dtype=dtype)
-            t = np.arange(len(values), dtype=np.float64)
-            mdf.append([Signal(samples=samples, timestamps=t, name=name)])
+    # Every signal has three samples, so one time axis serves them all and
+    # the whole set is saved as a single file.
+    t = np.arange(3, dtype=np.float64)
+    with tempfile.TemporaryDirectory() as d:
+        path = tmp(d, "dtype_ints")
+        with _asammdf().MDF() as mdf:
+            mdf.append([
+                _asammdf().Signal(samples=np.array(values, dtype=dtype), timestamps=t, name=name)
+                for name, (dtype, values) in types.items()
+            ])
             mdf.save(path, overwrite=True)
-            mdf.close()
 
-            rs_mdf = mf4_rs.Mdf(path)
-            rs_vals = rs_mdf.values(name)
+        read = mf4_rs.Mdf(path).values_many(list(types))
+        for name, (_, values) in types.items():
+            rs_vals = read[name]
             assert len(rs_vals) == len(values), f"{name}: expected {len(values)}, got {len(rs_vals)}"
-            for orig, read in zip(values, rs_vals):
-                # Values are returned as float64, which has 53 bits of precision.
-                # For large integers (>2^53), check relative error instead of exact match.
-                if abs(orig) > 2**53:
-                    rel_err = abs(float(orig) - read) / abs(float(orig))
-                    assert rel_err < 1e-15, f"{name}: expected {orig}, got {read} (rel_err={rel_err})"
-                else:
-                    assert int(orig) == int(read), f"{name}: expected {orig}, got {read}"
-    finally:
-        cleanup(*paths)
+            # Values are returned as float64, which has 53 bits of precision:
+            # integers up to 2^53 must match exactly, larger ones to within
+            # float64 rounding.
+            np.testing.assert_allclose(
+                rs_vals, np.array(values, dtype=np.float64), rtol=1e-15, atol=0, err_msg=name
+            )
 
 
 def test_float_types_roundtrip():
     """asammdf-written files with float32 and float64 are readable by mf4-rs."""
-    paths = []
-    try:
-        for name, dtype, values in [
-            ("float32", np.float32, [-1.5, 0.0, 3.14]),
-            ("float64", np.float64, [-1.5, 0.0, 3.141592653589793]),
-        ]:
-            path = tmp(f"dtype_{name}")
-            paths.append(path)
-            mdf = AsamMDF()
-            samples = np.array(values, dtype=dtype)
-            t = np.arange(len(values), dtype=np.float64)
-            mdf.append([Signal(samples=samples, timestamps=t, name=name)])
+    types = [
+        ("float32", np.float32, [-1.5, 0.0, 3.14]),
+        ("float64", np.float64, [-1.5, 0.0, 3.141592653589793]),
+    ]
+    t = np.arange(3, dtype=np.float64)
+    with tempfile.TemporaryDirectory() as d:
+        path = tmp(d, "dtype_floats")
+        with _asammdf().MDF() as mdf:
+            mdf.append([
+                _asammdf().Signal(samples=np.array(values, dtype=dtype), timestamps=t, name=name)
+                for name, dtype, values in types
+            ])
             mdf.save(path, overwrite=True)
-            mdf.close()
 
-            rs_mdf = mf4_rs.Mdf(path)
-            rs_vals = rs_mdf.values(name)
+        read = mf4_rs.Mdf(path).values_many([name for name, _, _ in types])
+        for name, _, values in types:
+            rs_vals = read[name]
             assert len(rs_vals) == len(values), f"{name}: expected {len(values)}, got {len(rs_vals)}"
-            for orig, read in zip(values, rs_vals):
-                tol = 1e-2 if name == "float32" else 1e-10
-                assert abs(orig - read) < tol, f"{name}: expected {orig}, got {read}"
-    finally:
-        cleanup(*paths)
+            tol = 1e-2 if name == "float32" else 1e-10
+            np.testing.assert_allclose(rs_vals, values, rtol=0, atol=tol, err_msg=name)
 
 
 def test_multi_group_cross_read():
     """Multi-group mf4-rs files are correctly parsed by asammdf."""
-    path = tmp("multi_group")
-    try:
+    with tempfile.TemporaryDirectory() as d:
+        path = tmp(d, "multi_group")
         w = mf4_rs.MdfWriter(path)
         w.init_mdf_file()
 
@@ -271,81 +289,114 @@ def test_multi_group_cross_read():
         w.add_time_channel(cg1, "Time")
         w.add_float_channel(cg1, "Temp")
         w.start_data_block(cg1)
-        for i in range(10):
-            w.write_record(cg1, [
-                mf4_rs.create_float_value(i * 0.1),
-                mf4_rs.create_float_value(20.0 + i),
-            ])
+        i = np.arange(10, dtype=np.float64)
+        w.write_records_f64(cg1, np.column_stack([i * 0.1, 20.0 + i]))
         w.finish_data_block(cg1)
 
         cg2 = w.add_channel_group("G2")
         w.add_time_channel(cg2, "Time")
         w.add_float_channel(cg2, "Pressure")
         w.start_data_block(cg2)
-        for i in range(5):
-            w.write_record(cg2, [
-                mf4_rs.create_float_value(i * 0.2),
-                mf4_rs.create_float_value(1013.0 + i),
-            ])
+        # Both row writers append to the same open block.
+        for i in range(2):
+            w.write_record_f64(cg2, (i * 0.2, 1013.0 + i))
+        w.write_records_iter(cg2, ((i * 0.2, 1013.0 + i) for i in range(2, 5)))
         w.finish_data_block(cg2)
         w.finalize()
 
-        mdf = AsamMDF(path)
-        assert len(mdf.groups) == 2, f"expected 2 groups, got {len(mdf.groups)}"
+        with _asammdf().MDF(path) as mdf:
+            assert len(mdf.groups) == 2, f"expected 2 groups, got {len(mdf.groups)}"
+
+            temp = mdf.get("Temp", group=0)
+            assert len(temp.samples) == 10
+            assert abs(temp.samples[9] - 29.0) < 0.1
+
+            pressure = mdf.get("Pressure", group=1)
+            assert len(pressure.samples) == 5
+            assert abs(pressure.samples[4] - 1017.0) < 0.1
+
+
+def test_write_records_iter_batches():
+    """write_records_iter spans its internal batches and rejects bad rows."""
+    with tempfile.TemporaryDirectory() as d:
+        path = tmp(d, "records_iter")
+        # More rows than one 8192-record batch, ending on a partial batch.
+        n = 2 * 8192 + 5
+        w = mf4_rs.MdfWriter(path)
+        w.init_mdf_file()
+        cg = w.add_channel_group("G")
+        w.add_time_channel(cg, "Time")
+        w.add_float_channel(cg, "Value")
+        w.start_data_block(cg)
+        w.write_records_iter(cg, ((i * 0.001, i * 2.0) for i in range(n)))
+        w.finish_data_block(cg)
+        w.finalize()
 
-        temp = mdf.get("Temp", group=0)
-        assert len(temp.samples) == 10
-        assert abs(temp.samples[9] - 29.0) < 0.1
+        i = np.arange(n, dtype=np.float64)
+        np.testing.assert_array_equal(mf4_rs.Mdf(path).values("Value"), i * 2.0, err_msg="mf4-rs Value")
+        with _asammdf().MDF(path) as mdf:
+            np.testing.assert_array_equal(mdf.get("Value", group=0).samples, i * 2.0, err_msg="asammdf Value")
 
-        pressure = mdf.get("Pressure", group=1)
-        assert len(pressure.samples) == 5
-        assert abs(pressure.samples[4] - 1017.0) < 0.1
-        mdf.close()
-    finally:
-        cleanup(path)
+        # A row whose width differs from the first row, and rows wider than
+        # the group's channel count, are both rejected.
+        for name, rows in [
+            ("ragged", [(0.0, 1.0), (0.1,)]),
+            ("too wide", [(0.0, 1.0, 2.0)]),
+        ]:
+            w = mf4_rs.MdfWriter(tmp(d, f"records_iter_{name.replace(' ', '_')}"))
+            w.init_mdf_file()
+            cg = w.add_channel_group("G")
+            w.add_time_channel(cg, "Time")
+            w.add_float_channel(cg, "Value")
+            w.start_data_block(cg)
+            try:
+                w.write_records_iter(cg, iter(rows))
+            except mf4_rs.MdfException:
+                pass
+            else:
+                raise AssertionError(f"{name} rows should raise MdfException")
 
 
 def test_master_channel_detected():
     """asammdf correctly identifies the master channel in mf4-rs files."""
-    path = write_mf4rs_basic()
-    try:
-        mdf = AsamMDF(path)
+    with basic_mdfs() as (_, mdf):
         master_idx = mdf.masters_db.get(0, None)
         assert master_idx is not None, "no master channel detected"
         master_ch = mdf.groups[0].channels[master_idx]
         assert master_ch.channel_type == 2, f"expected ch_type=2, got {master_ch.channel_type}"
         assert master_ch.sync_type == 1, f"expected sync_type=1, got {master_ch.sync_type}"
         assert master_ch.name == "Time", f"expected name='Time', got '{master_ch.name}'"
-        mdf.close()
-    finally:
-        cleanup(path)
+
+
+ID_FIELDS = struct.Struct("<8s8s8s")
 
 
 def test_file_identification():
     """mf4-rs files have correct identification block."""
     path = write_mf4rs_basic()
-    try:
-        with open(path, "rb") as f:
-            data = f.read(64)
-        file_id = data[0:8].rstrip(b"\x00")
-        assert file_id == b"MDF     ", f"bad file ID: {file_id}"
-        fmt = data[8:16].rstrip(b"\x00").decode().strip()
-        assert fmt == "4.10", f"bad format: {fmt}"
-        prog = data[16:24].rstrip(b"\x00").decode().strip()
-        assert prog == "mf4-rs", f"bad program ID: {prog}"
-    finally:
-        cleanup(path)
+    # Unbuffered: the 64-byte identification block is read straight into the
+    # result rather than through a default-sized read buffer.
+    with open(path, "rb", buffering=0) as f:
+        data = f.read(64)
+    # IDBLOCK: 8-byte file id, 8-byte format id, 8-byte program id.
+    file_id, fmt, prog = (
+        field.rstrip(b"\x00") for field in ID_FIELDS.unpack_from(data)
+    )
+    assert file_id == b"MDF     ", f"bad file ID: {file_id}"
+    fmt = fmt.decode().strip()
+    assert fmt == "4.10", f"bad format: {fmt}"
+    prog = prog.decode().strip()
+    assert prog == "mf4-rs", f"bad program ID: {prog}"
 
 
 def test_compressed_file_fails_gracefully():
     """mf4-rs fails with a clear error on compressed (##DZ) files."""
-    path = tmp("compressed")
-    try:
+    with tempfile.TemporaryDirectory() as d:
+        path = tmp(d, "compressed")
         t = np.arange(1000, dtype=np.float64) * 0.001
-        mdf = AsamMDF()
-        mdf.append([Signal(samples=t * 2.0, timestamps=t, name="data")])
-        mdf.save(path, overwrite=True, compression=2)
-        mdf.close()
+        with _asammdf().MDF() as mdf:
+            mdf.append([_asammdf().Signal(samples=t * 2.0, timestamps=t, name="data")])
+            mdf.save(path, overwrite=True, compression=2)
 
         try:
             rs_mdf = mf4_rs.Mdf(path)
@@ -355,14 +406,12 @@ def test_compressed_file_fails_gracefully():
         except Exception as e:
             # Expected: BlockIDError for ##DZ
             assert "DZ" in str(e) or "Block" in str(e), f"unexpected error: {e}"
-    finally:
-        cleanup(path)
 
 
 def test_data_block_splitting_cross_read():
     """asammdf can read mf4-rs files that use data block splitting (##DL)."""
-    path = tmp("dl_split")
-    try:
+    with tempfile.TemporaryDirectory() as d:
+        path = tmp(d, "dl_split")
         # Write enough data to trigger 4MB split: 300K records x 16 bytes = 4.8MB
         w = mf4_rs.MdfWriter(path)
         w.init_mdf_file()
@@ -373,90 +422,81 @@ def test_data_block_splitting_cross_read():
         w.add_float_channel(cg, "d")
         w.start_data_block(cg)
         n = 300_000
-        for i in range(n):
-            w.write_record(cg, [
-                mf4_rs.create_float_value(float(i)),
-                mf4_rs.create_float_value(float(i * 2)),
-                mf4_rs.create_float_value(float(i * 3)),
-                mf4_rs.create_float_value(float(i * 4)),
-            ])
+        # One (4, n) block holds a = i, b = 2i, c = 3i, d = 4i; its rows are
+        # contiguous, so the whole payload goes over in a single call.
+        block = np.arange(1, 5, dtype=np.float64)[:, None] * np.arange(n, dtype=np.float64)
+        w.write_columns_f64(cg, list(block))
         w.finish_data_block(cg)
         w.finalize()
 
-        # Verify ##DL block exists
-        with open(path, "rb") as f:
-            data = f.read()
-        assert b"##DL" in data, "expected ##DL block in split file"
+        # Verify ##DL block exists; scan a read-only map rather than copying
+        # the ~4.8 MB file into a bytes object.
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            assert mm.find(b"##DL") != -1, "expected ##DL block in split file"
 
         # Read with asammdf
-        mdf = AsamMDF(path)
-        sig = mdf.get("a")
-        assert len(sig.samples) == n, f"expected {n} samples, got {len(sig.samples)}"
-        assert abs(sig.samples[0]) < 0.001, f"first value should be ~0, got {sig.samples[0]}"
-        assert abs(sig.samples[-1] - (n - 1)) < 1.0, f"last value wrong: {sig.samples[-1]}"
+        with _asammdf().MDF(path) as mdf:
+            # Every sample is an exact small integer, so whole columns compare
+            # exactly, including the records on either side of each DT split.
+            sig = mdf.get("a")
+            assert len(sig.samples) == n, f"expected {n} samples, got {len(sig.samples)}"
+            np.testing.assert_array_equal(sig.samples, block[0], err_msg="a")
 
-        sig_d = mdf.get("d")
-        assert abs(sig_d.samples[100] - 400.0) < 1.0
-        mdf.close()
-    finally:
-        cleanup(path)
+            sig_d = mdf.get("d")
+            np.testing.assert_array_equal(sig_d.samples, block[3], err_msg="d")
 
 
 def test_value_to_text_conversion_cross_read():
     """asammdf correctly applies value-to-text conversions from mf4-rs files."""
-    # This uses the Rust example file which has value-to-text conversions
-    path = tmp("v2t")
-    try:
-        # Write file with value-to-text conversion using Rust API via cargo
-        os.system(
-            f'cd /home/user/mf4-rs && cargo run --release --example write_file 2>/dev/null'
-        )
-        example_path = "/home/user/mf4-rs/example.mf4"
-        if not os.path.exists(example_path):
-            print("    (SKIP: example.mf4 not found)")
-            return
-
-        mdf = AsamMDF(example_path)
-        # Group 1 has Status channel with value-to-text conversion
-        status = mdf.get("Status", group=1)
-        assert status is not None, "Status channel not found"
-        # With conversions applied, values should be byte strings
-        assert status.samples[0] == b"OK" or status.samples[0] == "OK", \
-            f"expected OK for value 0, got {status.samples[0]}"
-        assert status.samples[1] == b"WARN" or status.samples[1] == "WARN", \
-            f"expected WARN for value 1, got {status.samples[1]}"
-
-        # Check the conversion type - find Status channel by name
-        status_ch = None
-        for ch in mdf.groups[1].channels:
-            if ch.name == "Status":
-                status_ch = ch
-                break
-        assert status_ch is not None, "Status channel not found in group 1"
-        assert status_ch.conversion is not None, "expected conversion block"
-        assert status_ch.conversion.conversion_type == 7, \
-            f"expected conversion type 7 (ValueToText), got {status_ch.conversion.conversion_type}"
-        mdf.close()
-    finally:
-        cleanup(path)
-        cleanup("/home/user/mf4-rs/example.mf4")
+    with tempfile.TemporaryDirectory() as d:
+        path = tmp(d, "v2t")
+        w = mf4_rs.MdfWriter(path)
+        w.init_mdf_file()
+        cg = w.add_channel_group("Status")
+        w.add_time_channel(cg, "Time")
+        status_id = w.add_int_channel(cg, "Status")
+        w.add_value_to_text_conversion(status_id, [(0, "OK"), (1, "WARN")], "UNKNOWN")
+        w.start_data_block(cg)
+        i = np.arange(100, dtype=np.uint64)
+        w.write_columns(cg, [i * 0.1, i % 2])
+        w.finish_data_block(cg)
+        w.finalize()
+
+        with _asammdf().MDF(path) as mdf:
+            status = mdf.get("Status", group=0)
+            assert status is not None, "Status channel not found"
+            # With conversions applied, values should be byte strings
+            assert status.samples[0] == b"OK" or status.samples[0] == "OK", \
+                f"expected OK for value 0, got {status.samples[0]}"
+            assert status.samples[1] == b"WARN" or status.samples[1] == "WARN", \
+                f"expected WARN for value 1, got {status.samples[1]}"
+
+            # Check the conversion type - find Status channel by name
+            status_ch = None
+            for ch in mdf.groups[0].channels:
+                if ch.name == "Status":
+                    status_ch = ch
+                    break
+            assert status_ch is not None, "Status channel not found in group 0"
+            assert status_ch.conversion is not None, "expected conversion block"
+            assert status_ch.conversion.conversion_type == 7, \
+                f"expected conversion type 7 (ValueToText), got {status_ch.conversion.conversion_type}"
 
 
 def test_units_and_comments_readable():
     """mf4-rs can read units and comments from asammdf files."""
-    path = tmp("units")
-    try:
-        mdf = AsamMDF()
-        sig = Signal(
-            samples=np.array([20.0, 21.0, 22.0]),
-            timestamps=np.array([0.0, 1.0, 2.0]),
-            name="Temperature",
-            unit="degC",
-            comment="Ambient temperature",
-        )
-        mdf.append([sig])
-        mdf.save(path, overwrite=True)
-        mdf.close()
+    with tempfile.TemporaryDirectory() as d:
+        path = tmp(d, "units")
+        with _asammdf().MDF() as mdf:
+            sig = _asammdf().Signal(
+                samples=np.array([20.0, 21.0, 22.0]),
+                timestamps=np.array([0.0, 1.0, 2.0]),
+                name="Temperature",
+                unit="degC",
+                comment="Ambient temperature",
+            )
+            mdf.append([sig])
+            mdf.save(path, overwrite=True)
 
         rs_mdf = mf4_rs.Mdf(path)
         channels = [ch for g in rs_mdf.groups for ch in g.channels]
@@ -465,15 +505,13 @@ def test_units_and_comments_readable():
         assert temp_ch[0].unit == "degC", f"expected unit='degC', got '{temp_ch[0].unit}'"
         assert temp_ch[0].comment == "Ambient temperature", \
             f"expected comment='Ambient temperature', got '{temp_ch[0].comment}'"
-    finally:
-        cleanup(path)
 
 
 def test_performance_write():
     """Performance sanity check for mf4-rs Python write (should complete in < 30s)."""
     import time
-    path = tmp("perf_write")
-    try:
+    with tempfile.TemporaryDirectory() as d:
+        path = tmp(d, "perf_write")
         n = 100_000
         w = mf4_rs.MdfWriter(path)
         w.init_mdf_file()
@@ -485,21 +523,15 @@ def test_performance_write():
 
         start = time.time()
         w.start_data_block(cg)
-        for i in range(n):
-            t = i * 0.001
-            w.write_record(cg, [
-                mf4_rs.create_float_value(t),
-                mf4_rs.create_float_value(t * 2),
-                mf4_rs.create_float_value(t * 3),
-                mf4_rs.create_float_value(t * 4),
-            ])
+        # Record i is (t, 2t, 3t, 4t) with t = i * 0.001; the (n, 4) array
+        # goes over in one call instead of one write_record per row.
+        t = np.arange(n, dtype=np.float64) * 0.001
+        w.write_records_f64(cg, t[:, None] * np.arange(1, 5, dtype=np.float64))
         w.finish_data_block(cg)
         w.finalize()
         elapsed = time.time() - start
         assert elapsed < 30, f"write took {elapsed:.1f}s - performance regression"
         print(f"    ({n} records in {elapsed:.3f}s)")
-    finally:
-        cleanup(path)
 
 
 def test_cut_asammdf_vlsd_string():
@@ -513,9 +545,9 @@ def test_cut_asammdf_vlsd_string():
     can still read it (it walks SD entries sequentially) but asammdf reports
     a length mismatch. This test exercises the rewrite path.
     """
-    src = tmp("asammdf_vlsd_src")
-    out = tmp("asammdf_vlsd_cut")
-    try:
+    with tempfile.TemporaryDirectory() as d:
+        src = tmp(d, "asammdf_vlsd_src")
+        out = tmp(d, "asammdf_vlsd_cut")
         # Asammdf maps S<n> bytes arrays to channel_type=1 (VLSD), data_type=7
         # (UTF-8 string). Use a fixed S20 so payload bytes vary in their
         # null-padded form but the VLSD entry size stays predictable.
@@ -525,19 +557,18 @@ def test_cut_asammdf_vlsd_string():
             [f"event-{i}-payload".encode() for i in range(n)], dtype="S20"
         )
         nums = np.arange(n, dtype=np.int32) * 10
-        mdf = AsamMDF(version="4.10")
-        mdf.append(
-            [
-                Signal(samples=strings, timestamps=t, name="Message", encoding="utf-8"),
-                Signal(samples=nums, timestamps=t, name="Counter"),
-            ],
-            common_timebase=True,
-        )
-        mdf.save(src, overwrite=True)
-        mdf.close()
+        with _asammdf().MDF(version="4.10") as mdf:
+            mdf.append(
+                [
+                    _asammdf().Signal(samples=strings, timestamps=t, name="Message", encoding="utf-8"),
+                    _asammdf().Signal(samples=nums, timestamps=t, name="Counter"),
+                ],
+                common_timebase=True,
+            )
+            mdf.save(src, overwrite=True)
 
         # Sanity: confirm asammdf actually emitted a VLSD string channel.
-        with AsamMDF(src) as m:
+        with _asammdf().MDF(src) as m:
             ch = next(c for c in m.groups[0].channels if c.name == "Message")
             assert ch.channel_type == 1, f"expected VLSD channel_type=1, got {ch.channel_type}"
             assert ch.data_type == 7, f"expected UTF-8 string data_type=7, got {ch.data_type}"
@@ -556,7 +587,7 @@ def test_cut_asammdf_vlsd_string():
         # asammdf reads the cut output correctly — this is the regression
         # check. With stale inline offsets it would raise
         # "samples and timestamps length mismatch".
-        with AsamMDF(out) as m:
+        with _asammdf().MDF(out) as m:
             msg = m.get("Message")
             ctr = m.get("Counter")
             assert len(msg.samples) == 5, f"asammdf saw {len(msg.samples)} samples"
@@ -565,25 +596,35 @@ def test_cut_asammdf_vlsd_string():
                 f"event-{i}-payload" for i in range(2, 7)
             ]
             assert ctr.samples.tolist() == [20, 30, 40, 50, 60]
-    finally:
-        cleanup(src, out)
 
 
-def test_performance_read():
-    """Performance sanity check for mf4-rs Python read (should complete in < 10s)."""
+def test_performance_read_open():
+    """Performance sanity check for opening a file with mf4-rs (< 5s for 10 opens)."""
     import time
     path = write_mf4rs_basic()
-    try:
-        start = time.time()
-        for _ in range(10):
-            mdf = mf4_rs.Mdf(path)
-            for name in ["Time", "Temperature", "Counter"]:
-                mdf.values(name)
-        elapsed = time.time() - start
-        assert elapsed < 10, f"10x read took {elapsed:.1f}s - performance regression"
-        print(f"    (10x read in {elapsed:.3f}s)")
-    finally:
-        cleanup(path)
+    start = time.perf_counter()
+    for _ in range(10):
+        mf4_rs.Mdf(path)
+    elapsed = time.perf_counter() - start
+    assert elapsed < 5, f"10x open took {elapsed:.1f}s - performance regression"
+    print(f"    (10x open in {elapsed:.3f}s)")
+
+
+def test_performance_read_decode():
+    """Performance sanity check for mf4-rs value decoding (< 10s for 30 reads).
+
+    The file is opened once, so the timing covers the data-block decode path
+    rather than the metadata walk measured by the open test.
+    """
+    import time
+    mdf = mf4_rs.Mdf(write_mf4rs_basic())
+    start = time.perf_counter()
+    for _ in range(10):
+        for name in ["Time", "Temperature", "Counter"]:
+            mdf.values(name)
+    elapsed = time.perf_counter() - start
+    assert elapsed < 10, f"30 reads took {elapsed:.1f}s - performance regression"
+    print(f"    (30 reads in {elapsed:.3f}s)")
 
 
 # ---------------------------------------------------------------------------
@@ -601,6 +642,7 @@ if __name__ == "__main__":
         ("all integer types roundtrip", test_all_integer_types_roundtrip),
         ("float types roundtrip", test_float_types_roundtrip),
         ("multi-group cross-read", test_multi_group_cross_read),
+        ("write_records_iter batches and errors", test_write_records_iter_batches),
         ("master channel detected by asammdf", test_master_channel_detected),
         ("file identification block", test_file_identification),
         ("compressed file fails gracefully", test_compressed_file_fails_gracefully),
@@ -609,12 +651,17 @@ if __name__ == "__main__":
         ("units and comments readable", test_units_and_comments_readable),
         ("cut preserves asammdf VLSD strings", test_cut_asammdf_vlsd_string),
         ("performance: write", test_performance_write),
-        ("performance: read", test_performance_read),
+        ("performance: read (open)", test_performance_read_open),
+        ("performance: read (decode)", test_performance_read_decode),
     ]
 
+    # Run one at a time: asammdf is not thread-safe, and sequential runs
+    # keep each test's output together.
     for name, fn in tests:
         run_test(name, fn)
 
+    print_failures()
+
     print(f"\n{'='*50}")
     print(f"Results: {passed} passed, {failed} failed")
     print(f"{'='*50}")
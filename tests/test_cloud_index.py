@@ -12,6 +12,7 @@ without forcing a maturin build on every runner.
 from __future__ import annotations
 
 import http.server
+import mmap
 import os
 import re
 import socketserver
@@ -19,10 +20,12 @@ import sys
 import tempfile
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 try:
     import mf4_rs
+    import numpy as np
 except ImportError as e:
     print(f"SKIP: mf4_rs not importable ({e}); run `maturin develop --release` first")
     sys.exit(0)
@@ -51,13 +54,14 @@ def build_fixture(path: str) -> None:
             cn_ids.append(ch)
         cn_ids_per_group.append(cn_ids)
 
+    # Every group's columns are built with numpy and written in one call.
+    r = np.arange(RECORDS, dtype=np.float64)
     for g, cg in enumerate(cg_ids):
+        columns = [r * 0.01]
+        for j in range(1, CHANNELS_PER_GROUP):
+            columns.append(g * 100 + r * j)
         w.start_data_block(cg)
-        for r in range(RECORDS):
-            record = [mf4_rs.create_float_value(r * 0.01)]
-            for j in range(1, CHANNELS_PER_GROUP):
-                record.append(mf4_rs.create_float_value(float(g * 100 + r * j)))
-            w.write_record(cg, record)
+        w.write_columns_f64(cg, columns)
         w.finish_data_block(cg)
 
     w.finalize()
@@ -69,19 +73,39 @@ class RangeHandler(http.server.SimpleHTTPRequestHandler):
     Stays on HTTP/1.0 (the default) so each response closes the TCP
     connection. With HTTP/1.1 keep-alive, ureq 2.x can wedge waiting for
     bytes the server has no intention of sending.
+
+    Each served file is memory-mapped once and shared by every request, so
+    a range request is a slice of the map rather than an open and a read of
+    the whole file.
     """
 
+    _maps: dict[str, mmap.mmap] = {}
+    _maps_lock = threading.Lock()
+
+    @classmethod
+    def _mapped(cls, path: str) -> mmap.mmap:
+        with cls._maps_lock:
+            mm = cls._maps.get(path)
+            if mm is None:
+                with open(path, "rb") as f:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                cls._maps[path] = mm
+            return mm
+
+    @classmethod
+    def close_maps(cls) -> None:
+        with cls._maps_lock:
+            for mm in cls._maps.values():
+                mm.close()
+            cls._maps.clear()
+
     def do_GET(self):  # noqa: N802
         path = self.translate_path(self.path)
         try:
-            f = open(path, "rb")
-        except OSError:
+            data = memoryview(self._mapped(path))
+        except (OSError, ValueError):
             self.send_error(404)
             return
-        try:
-            data = f.read()
-        finally:
-            f.close()
         total = len(data)
         rng = self.headers.get("Range")
         if rng:
@@ -110,8 +134,8 @@ class RangeHandler(http.server.SimpleHTTPRequestHandler):
     def do_HEAD(self):  # noqa: N802
         path = self.translate_path(self.path)
         try:
-            size = os.path.getsize(path)
-        except OSError:
+            size = len(self._mapped(path))
+        except (OSError, ValueError):
             self.send_error(404)
             return
         self.send_response(200)
@@ -174,9 +198,15 @@ def main() -> int:
                 ("Group 3", "ch_3_1"),
                 ("Group 4", "ch_4_3"),
             ]
-            for gn, cn in targets:
-                vals = idx_local.values(cn, group=gn)   # local file, lazy
-                vals_url = idx.values(cn)               # URL range request, lazy
+            # Issue the URL reads up front: MdfIndex.values releases the GIL,
+            # so the range requests are in flight while the local reads decode.
+            with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+                url_reads = [pool.submit(idx.values, cn) for _, cn in targets]
+                pairs = [
+                    (gn, cn, idx_local.values(cn, group=gn), fut.result())
+                    for (gn, cn), fut in zip(targets, url_reads)
+                ]
+            for gn, cn, vals, vals_url in pairs:
                 assert len(vals) == RECORDS, f"{gn}/{cn} local len {len(vals)}"
                 assert len(vals_url) == RECORDS, f"{gn}/{cn} url len {len(vals_url)}"
                 # Spot-check one value matches between local and URL paths.
@@ -185,6 +215,30 @@ def main() -> int:
                 )
             print(f"5 channel reads (local + url) in {(time.perf_counter() - t0)*1000:.1f} ms")
 
+            # Channels of one group share their fetched data runs over HTTP.
+            names = [f"ch_2_{j}" for j in range(1, CHANNELS_PER_GROUP)]
+            many_url = idx.values_many(names, group="Group 2")
+            many_local = idx_local.values_many(names, group="Group 2")
+            for cn in names:
+                assert many_url[cn].tolist() == many_local[cn].tolist(), f"{cn} differs"
+
+            # Streaming over HTTP fetches one window at a time; the chunks
+            # stitch back into the full column.
+            chunks = list(idx.iter_values("ch_3_2", chunk_size=64))
+            assert [c.size for c in chunks] == [64, 64, 64, RECORDS - 192]
+            assert np.concatenate(chunks).tolist() == idx_local.values("ch_3_2").tolist()
+
+            # The batched per-group summary agrees with per-channel byte_ranges.
+            summary = idx_local.byte_summary("Group 2")
+            assert len(summary) == CHANNELS_PER_GROUP, f"summary has {len(summary)} rows"
+            name, nbytes, count = summary[4]
+            ranges = idx_local.byte_ranges(name, group="Group 2")
+            assert name == "ch_2_4", f"summary row 4 is {name!r}"
+            assert (nbytes, count) == (sum(n for _, n in ranges), len(ranges))
+            offsets, lengths = idx_local.byte_range_arrays(name, group="Group 2")
+            assert list(zip(offsets.tolist(), lengths.tolist())) == ranges
+            assert (nbytes, count) == (int(lengths.sum()), lengths.size)
+
             # Round-trip via JSON: the source is environment-local, so it is not
             # persisted — re-attach the URL after loading.
             json_path = tmp_path / "fixture.idx.json"
@@ -201,6 +255,7 @@ def main() -> int:
             return 0
         finally:
             httpd.shutdown()
+            RangeHandler.close_maps()
 
 
 if __name__ == "__main__":